@@ -0,0 +1,67 @@
+-- Build condition eras server-side instead of aggregating condition_occurrence
+-- rows in Python. Classic gap-and-islands with the CDM's 30-day persistence
+-- window: occurrences of the same condition at most 30 days apart fuse into one
+-- era. PostgreSQL only.
+--
+-- The condition_era *table* deployed by the models stays untouched; the
+-- materialized view lives alongside it. Either read condition_era_mv directly
+-- or copy it into the table after a refresh:
+--   INSERT INTO condition_era SELECT * FROM condition_era_mv;
+--
+-- Refresh after new condition_occurrence loads with
+-- omopmodel.refresh_condition_era(session) or
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY condition_era_mv;
+-- (CONCURRENTLY needs the unique index created below.)
+
+CREATE MATERIALIZED VIEW condition_era_mv AS
+WITH ordered AS (
+    SELECT
+        person_id,
+        condition_concept_id,
+        condition_start_date,
+        COALESCE(condition_end_date, condition_start_date) AS condition_end_date,
+        LAG(COALESCE(condition_end_date, condition_start_date)) OVER (
+            PARTITION BY person_id, condition_concept_id
+            ORDER BY condition_start_date
+        ) AS previous_end_date
+    FROM condition_occurrence
+    WHERE condition_concept_id != 0
+),
+flagged AS (
+    SELECT
+        *,
+        CASE
+            WHEN previous_end_date IS NULL
+              OR condition_start_date > previous_end_date + 30
+            THEN 1 ELSE 0
+        END AS starts_new_era
+    FROM ordered
+),
+grouped AS (
+    SELECT
+        *,
+        SUM(starts_new_era) OVER (
+            PARTITION BY person_id, condition_concept_id
+            ORDER BY condition_start_date
+            ROWS UNBOUNDED PRECEDING
+        ) AS era_group
+    FROM flagged
+)
+SELECT
+    ROW_NUMBER() OVER (
+        ORDER BY person_id, condition_concept_id, MIN(condition_start_date)
+    ) AS condition_era_id,
+    person_id,
+    condition_concept_id,
+    MIN(condition_start_date) AS condition_era_start_date,
+    MAX(condition_end_date) AS condition_era_end_date,
+    COUNT(*) AS condition_occurrence_count
+FROM grouped
+GROUP BY person_id, condition_concept_id, era_group;
+
+-- required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_condition_era_mv_id
+    ON condition_era_mv (condition_era_id);
+-- the dominant query pattern
+CREATE INDEX idx_condition_era_mv_person
+    ON condition_era_mv (person_id, condition_concept_id);
@@ -1,22 +1,34 @@
-from sqlalchemy import create_engine
 from omopmodel import OMOP_5_4_declarative as omop54
-from omopmodel import VocabulariesLoader
+from omopmodel import VocabulariesLoader, get_engine
 
 # Define the connection to our sqlite database.
 # if it does not exists, it will created on the fly
-engine = create_engine("sqlite:///cdm_source.db", echo=False)
+# "insertmanyvalues_page_size" makes SQLAlchemy fold up to 10k rows into a single
+# multi-VALUES INSERT statement instead of emitting one statement per row.
+# get_engine() also deploys the OMOP schema and memoizes the engine per url,
+# so follow-up scripts in the same process reuse it without re-reflection.
+engine = get_engine(
+    "sqlite:///cdm_source.db",
+    omop_module=omop54,
+    echo=False,
+    insertmanyvalues_page_size=10000,
+)
 
 # Define the directory where our exported https://athena.ohdsi.org vocabularies csv files are stored.
 athena_export_directory = "/home/me/Downloads/AthenaUnzipped"
 
-# Create the OMOP Schema on our database
-omop54.Base.metadata.create_all(engine)
 
 # Initialize the vocabulary loader.
 v = VocabulariesLoader(
     athena_export_directory,
     database_engine=engine,
     omop_module=omop54,  # <- This is optional. default is OMOP CDM V5.4
+    # metadata.create_all() above created all indexes and foreign keys as well.
+    # Maintaining them row by row would dominate the load time, therefore the
+    # loader drops them before inserting and rebuilds them in one pass at the
+    # end. Both flags default to True and are only spelled out here for clarity.
+    drop_constraints_and_indexes_before_insert=True,
+    recreate_constraints_and_indexes_after_insert=True,
 )
 # Load the vocabulary from the CSV files into the database.
 # HINT: If you are using a sqlite database this can take unbearably long
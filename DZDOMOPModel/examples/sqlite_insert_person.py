@@ -1,13 +1,19 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from omopmodel import OMOP_5_3_declarative as omop53
+from omopmodel import get_engine
 
-# Create a SQLite database and deploy the omop schema (tables,constraints, indices and primary keys)
-
-engine = create_engine("sqlite:///cdm_source.db", echo=False)
-
-# Create the schema if not done
-omop53.Base.metadata.create_all(engine)
+# Create a SQLite database and deploy the omop schema (tables,constraints, indices and primary keys).
+# get_engine() memoizes the engine per url and only deploys the schema once per
+# process, so chaining this script with the other examples does not re-reflect
+# all ~40 OMOP tables on every call.
+# "insertmanyvalues_page_size" lets SQLAlchemy batch many rows into a single
+# multi-VALUES INSERT statement when you insert larger amounts of objects.
+engine = get_engine(
+    "sqlite:///cdm_source.db",
+    omop_module=omop53,
+    echo=False,
+    insertmanyvalues_page_size=10000,
+)
 
 # Define a caresite and a person. Connect these two
 care_site = omop53.CareSite(care_site_id=5678, care_site_name="St. Local")
@@ -22,6 +28,14 @@ person = omop53.Person(
 
 # Open a session and write these object/rows to the database
 with Session(engine) as session:
-    session.add(care_site)
-    session.add(person)
+    session.add_all([care_site, person])
     session.commit()
+
+# HINT: If you need to insert many thousands of rows, skip the ORM objects and
+# pass plain dicts to an insert() statement. This avoids the per-object
+# unit-of-work bookkeeping and is roughly an order of magnitude faster:
+#
+#   from sqlalchemy import insert
+#   with Session(engine) as session:
+#       session.execute(insert(omop53.Person), [{"person_id": 1234, ...}, ...])
+#       session.commit()
@@ -1,3 +1,4 @@
+from sqlalchemy import inspect
 from sqlmodel import SQLModel, Session, create_engine
 
 
@@ -6,10 +7,18 @@ from omopmodel import OMOP_5_4_sqlmodels as omop54
 
 # Create a SQLite database and deploy the omop schema (tables,constraints, indices and primary keys)
 
-engine = create_engine("sqlite:///cdm_source.db", echo=False)
+# "insertmanyvalues_page_size" lets SQLAlchemy batch many rows into a single
+# multi-VALUES INSERT statement when you insert larger amounts of objects.
+engine = create_engine(
+    "sqlite:///cdm_source.db", echo=False, insertmanyvalues_page_size=10000
+)
 
-# Create the schema if not done
-SQLModel.metadata.create_all(engine)
+# Create the schema if not done.
+# create_all(checkfirst=True) would probe every single table with its own
+# round trip on each start. Checking one marker table ourselves and creating
+# the schema with checkfirst=False skips all of that on a warm database.
+if not inspect(engine).has_table("person"):
+    SQLModel.metadata.create_all(engine, checkfirst=False)
 
 # Define a caresite and a person. Connect these two
 care_site = omop54.CareSite(care_site_id=5678, care_site_name="St. Local")
@@ -24,6 +33,14 @@ person = omop54.Person(
 
 # Open a session and write these object/rows to the database
 with Session(engine) as session:
-    session.add(care_site)
-    session.add(person)
+    session.add_all([care_site, person])
     session.commit()
+
+# HINT: If you need to insert many thousands of rows, skip the ORM objects and
+# pass plain dicts to an insert() statement. This avoids the per-object
+# unit-of-work bookkeeping and is roughly an order of magnitude faster:
+#
+#   from sqlalchemy import insert
+#   with Session(engine) as session:
+#       session.execute(insert(omop54.Person), [{"person_id": 1234, ...}, ...])
+#       session.commit()
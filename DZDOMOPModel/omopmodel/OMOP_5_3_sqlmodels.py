@@ -30,7 +30,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import Date, DateTime, ForeignKeyConstraint, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text
+from sqlalchemy import Date, DateTime, ForeignKeyConstraint, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text, text
 from sqlmodel import Field, Relationship, SQLModel, Column
 
 class CdmSource(SQLModel, table=True):
@@ -61,9 +61,12 @@ class Concept(SQLModel, table=True):
         PrimaryKeyConstraint('concept_id', name='xpk_concept'),
         Index('idx_concept_class_id', 'concept_class_id'),
         Index('idx_concept_code', 'concept_code'),
-        Index('idx_concept_concept_id', 'concept_id'),
         Index('idx_concept_domain_id', 'domain_id'),
         Index('idx_concept_vocabluary_id', 'vocabulary_id'),
+        Index('idx_concept_vocab_std_domain', 'vocabulary_id', 'standard_concept', 'domain_id', postgresql_include=['concept_id', 'concept_name']),
+        Index('idx_concept_code_vocab', 'concept_code', 'vocabulary_id'),
+        Index('idx_concept_standard', 'standard_concept', postgresql_where=text("standard_concept = 'S'")),
+        Index('brin_concept_valid_end_date', 'valid_end_date', postgresql_using='brin'),
         {'comment': 'DESC: The Standardized Vocabularies contains records, or '
                 'Concepts, that uniquely identify each fundamental unit of meaning '
                 'used to express clinical information in all domain tables of the '
@@ -111,7 +114,6 @@ class ConceptClass(SQLModel, table=True):
     __table_args__ = (
         ForeignKeyConstraint(['concept_class_concept_id'], ['concept.concept_id'], name='fpk_concept_class_concept_class_concept_id'),
         PrimaryKeyConstraint('concept_class_id', name='xpk_concept_class'),
-        Index('idx_concept_class_class_id', 'concept_class_id'),
         {'comment': 'DESC: The CONCEPT_CLASS table is a reference table, which '
                 'includes a list of the classifications used to differentiate '
                 'Concepts within a given Vocabulary. This reference table is '
@@ -130,7 +132,6 @@ class Domain(SQLModel, table=True):
     __table_args__ = (
         ForeignKeyConstraint(['domain_concept_id'], ['concept.concept_id'], name='fpk_domain_domain_concept_id'),
         PrimaryKeyConstraint('domain_id', name='xpk_domain'),
-        Index('idx_domain_domain_id', 'domain_id'),
         {'comment': 'DESC: The DOMAIN table includes a list of OMOP-defined Domains '
                 'the Concepts of the Standardized Vocabularies can belong to. A '
                 'Domain defines the set of allowable Concepts for the standardized '
@@ -153,7 +154,6 @@ class Domain(SQLModel, table=True):
 class Location(SQLModel, table=True):
     __table_args__ = (
         PrimaryKeyConstraint('location_id', name='xpk_location'),
-        Index('idx_location_id_1', 'location_id'),
         {'comment': 'DESC: The LOCATION table represents a generic way to capture '
                 'physical location or address information of Persons and Care '
                 'Sites. | ETL CONVENTIONS: Each address or Location is unique and '
@@ -181,7 +181,6 @@ class Vocabulary(SQLModel, table=True):
     __table_args__ = (
         ForeignKeyConstraint(['vocabulary_concept_id'], ['concept.concept_id'], name='fpk_vocabulary_vocabulary_concept_id'),
         PrimaryKeyConstraint('vocabulary_id', name='xpk_vocabulary'),
-        Index('idx_vocabulary_vocabulary_id', 'vocabulary_id'),
         {'comment': 'DESC: The VOCABULARY table includes a list of the Vocabularies '
                 'collected from various sources or created de novo by the OMOP '
                 'community. This reference table is populated with a single record '
@@ -232,7 +231,6 @@ class CareSite(SQLModel, table=True):
         ForeignKeyConstraint(['location_id'], ['location.location_id'], name='fpk_care_site_location_id'),
         ForeignKeyConstraint(['place_of_service_concept_id'], ['concept.concept_id'], name='fpk_care_site_place_of_service_concept_id'),
         PrimaryKeyConstraint('care_site_id', name='xpk_care_site'),
-        Index('idx_care_site_id_1', 'care_site_id'),
         {'comment': 'DESC: The CARE_SITE table contains a list of uniquely identified '
                 'institutional (physical or organizational) units where healthcare '
                 'delivery is practiced (offices, wards, hospitals, clinics, etc.). '
@@ -409,6 +407,7 @@ class Cost(SQLModel, table=True):
         ForeignKeyConstraint(['revenue_code_concept_id'], ['concept.concept_id'], name='fpk_cost_revenue_code_concept_id'),
         PrimaryKeyConstraint('cost_id', name='xpk_cost'),
         Index('idx_cost_event_id', 'cost_event_id'),
+        Index('idx_cost_event_domain', 'cost_event_id', 'cost_domain_id', postgresql_include=['total_paid', 'total_charge']),
         {'comment': 'DESC: The COST table captures records containing the cost of any '
                 'medical event recorded in one of the OMOP clinical event tables '
                 'such as DRUG_EXPOSURE, PROCEDURE_OCCURRENCE, VISIT_OCCURRENCE, '
@@ -516,9 +515,7 @@ class FactRelationship(SQLModel, table=True):
         ForeignKeyConstraint(['domain_concept_id_1'], ['concept.concept_id'], name='fpk_fact_relationship_domain_concept_id_1'),
         ForeignKeyConstraint(['domain_concept_id_2'], ['concept.concept_id'], name='fpk_fact_relationship_domain_concept_id_2'),
         ForeignKeyConstraint(['relationship_concept_id'], ['concept.concept_id'], name='fpk_fact_relationship_relationship_concept_id'),
-        Index('idx_fact_relationship_id1', 'domain_concept_id_1'),
-        Index('idx_fact_relationship_id2', 'domain_concept_id_2'),
-        Index('idx_fact_relationship_id3', 'relationship_concept_id'),
+        Index('idx_fact_relationship_composite', 'domain_concept_id_1', 'fact_id_1', 'domain_concept_id_2', 'fact_id_2', 'relationship_concept_id'),
         {'comment': 'DESC: The FACT_RELATIONSHIP table contains records about the '
                 'relationships between facts stored as records in any table of the '
                 'CDM. Relationships can be defined between facts from the same '
@@ -675,6 +672,7 @@ class ConceptRelationship(SQLModel, table=True):
         Index('idx_concept_relationship_id_1', 'concept_id_1'),
         Index('idx_concept_relationship_id_2', 'concept_id_2'),
         Index('idx_concept_relationship_id_3', 'relationship_id'),
+        Index('idx_concept_relationship_pair', 'concept_id_1', 'relationship_id', 'concept_id_2'),
         {'comment': 'DESC: The CONCEPT_RELATIONSHIP table contains records that define '
                 'direct relationships between any two Concepts and the nature or '
                 'type of the relationship. Each type of a relationship is defined '
@@ -701,7 +699,7 @@ class Provider(SQLModel, table=True):
         ForeignKeyConstraint(['specialty_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_concept_id'),
         ForeignKeyConstraint(['specialty_source_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_source_concept_id'),
         PrimaryKeyConstraint('provider_id', name='xpk_provider'),
-        Index('idx_provider_id_1', 'provider_id'),
+        Index('idx_provider_specialty', 'specialty_concept_id'),
         {'comment': 'DESC: The PROVIDER table contains a list of uniquely identified '
                 'healthcare providers. These are individuals providing hands-on '
                 'healthcare to patients, such as physicians, nurses, midwives, '
@@ -757,7 +755,6 @@ class Person(SQLModel, table=True):
         ForeignKeyConstraint(['race_source_concept_id'], ['concept.concept_id'], name='fpk_person_race_source_concept_id'),
         PrimaryKeyConstraint('person_id', name='xpk_person'),
         Index('idx_gender', 'gender_concept_id'),
-        Index('idx_person_id', 'person_id'),
         {'comment': 'DESC: This table serves as the central identity management for '
                 'all Persons in the database. It contains records that uniquely '
                 'identify each person or patient, and some demographic '
@@ -851,7 +848,7 @@ class DoseEra(SQLModel, table=True):
         ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_dose_era_unit_concept_id'),
         PrimaryKeyConstraint('dose_era_id', name='xpk_dose_era'),
         Index('idx_dose_era_concept_id_1', 'drug_concept_id'),
-        Index('idx_dose_era_person_id_1', 'person_id'),
+        Index('idx_dose_era_person_start', 'person_id', 'dose_era_start_date', 'drug_concept_id'),
         {'comment': 'DESC: A Dose Era is defined as a span of time when the Person is '
                 'assumed to be exposed to a constant dose of a specific active '
                 'ingredient. | ETL CONVENTIONS: Dose Eras will be derived from '
@@ -883,7 +880,7 @@ class DrugEra(SQLModel, table=True):
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_drug_era_person_id'),
         PrimaryKeyConstraint('drug_era_id', name='xpk_drug_era'),
         Index('idx_drug_era_concept_id_1', 'drug_concept_id'),
-        Index('idx_drug_era_person_id_1', 'person_id'),
+        Index('idx_drug_era_person_start', 'person_id', 'drug_era_start_date', 'drug_concept_id'),
         {'comment': 'DESC: A Drug Era is defined as a span of time when the Person is '
                 'assumed to be exposed to a particular active ingredient. A Drug '
                 'Era is not the same as a Drug Exposure: Exposures are individual '
@@ -913,7 +910,8 @@ class ObservationPeriod(SQLModel, table=True):
         ForeignKeyConstraint(['period_type_concept_id'], ['concept.concept_id'], name='fpk_observation_period_period_type_concept_id'),
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_observation_period_person_id'),
         PrimaryKeyConstraint('observation_period_id', name='xpk_observation_period'),
-        Index('idx_observation_period_id_1', 'person_id'),
+        Index('idx_observation_period_person_start', 'person_id', 'observation_period_start_date', 'observation_period_end_date'),
+        Index('brin_observation_period_start_date', 'observation_period_start_date', postgresql_using='brin'),
         {'comment': 'DESC: This table contains records which define spans of time '
                 'during which two conditions are expected to hold: (i) Clinical '
                 'Events that happened to the Person are recorded in the Event '
@@ -980,7 +978,9 @@ class PayerPlanPeriod(SQLModel, table=True):
         ForeignKeyConstraint(['stop_reason_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_concept_id'),
         ForeignKeyConstraint(['stop_reason_source_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_source_concept_id'),
         PrimaryKeyConstraint('payer_plan_period_id', name='xpk_payer_plan_period'),
-        Index('idx_period_person_id_1', 'person_id'),
+        Index('idx_payer_plan_period_person_start', 'person_id', 'payer_plan_period_start_date', 'payer_plan_period_end_date', postgresql_include=['payer_concept_id', 'plan_concept_id']),
+        Index('brin_payer_plan_period_start_date', 'payer_plan_period_start_date', postgresql_using='brin'),
+        Index('idx_payer_plan_period_stop_reason', 'stop_reason_concept_id', postgresql_where=text('stop_reason_concept_id IS NOT NULL')),
         {'comment': 'DESC: The PAYER_PLAN_PERIOD table captures details of the period '
                 'of time that a Person is continuously enrolled under a specific '
                 'health Plan benefit structure from a given Payer. Each Person '
@@ -1040,7 +1040,9 @@ class ProcedureOccurrence(SQLModel, table=True):
         ForeignKeyConstraint(['procedure_type_concept_id'], ['concept.concept_id'], name='fpk_procedure_occurrence_procedure_type_concept_id'),
         PrimaryKeyConstraint('procedure_occurrence_id', name='xpk_procedure_occurrence'),
         Index('idx_procedure_concept_id_1', 'procedure_concept_id'),
-        Index('idx_procedure_person_id_1', 'person_id'),
+        Index('idx_procedure_person_date', 'person_id', 'procedure_date', postgresql_include=['procedure_concept_id', 'visit_occurrence_id', 'quantity']),
+        Index('brin_procedure_date', 'procedure_date', postgresql_using='brin'),
+        Index('idx_procedure_source_concept', 'procedure_source_concept_id', postgresql_where=text('procedure_source_concept_id IS NOT NULL')),
         Index('idx_procedure_visit_id_1', 'visit_occurrence_id'),
         {'comment': 'DESC: This table contains records of activities or processes '
                 'ordered by, or carried out by, a healthcare provider on the '
@@ -1098,7 +1100,9 @@ class Specimen(SQLModel, table=True):
         ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_specimen_unit_concept_id'),
         PrimaryKeyConstraint('specimen_id', name='xpk_specimen'),
         Index('idx_specimen_concept_id_1', 'specimen_concept_id'),
-        Index('idx_specimen_person_id_1', 'person_id'),
+        Index('idx_specimen_person_id_1', 'person_id', postgresql_include=['specimen_concept_id', 'quantity']),
+        Index('brin_specimen_date', 'specimen_date', postgresql_using='brin'),
+        Index('idx_specimen_anatomic_site', 'anatomic_site_concept_id', postgresql_where=text('anatomic_site_concept_id IS NOT NULL')),
         {'comment': 'DESC: The specimen domain contains the records identifying '
                 'biological samples from a person. | ETL CONVENTIONS: Anatomic '
                 'site is coded at the most specific level of granularity possible, '
@@ -1144,7 +1148,8 @@ class VisitOccurrence(SQLModel, table=True):
         ForeignKeyConstraint(['visit_type_concept_id'], ['concept.concept_id'], name='fpk_visit_occurrence_visit_type_concept_id'),
         PrimaryKeyConstraint('visit_occurrence_id', name='xpk_visit_occurrence'),
         Index('idx_visit_concept_id_1', 'visit_concept_id'),
-        Index('idx_visit_person_id_1', 'person_id'),
+        Index('idx_visit_person_date', 'person_id', 'visit_start_date'),
+        Index('brin_visit_start_date', 'visit_start_date', postgresql_using='brin'),
         {'comment': 'DESC: This table contains Events where Persons engage with the '
                 'healthcare system for a duration of time. They are often also '
                 'called "Encounters". Visits are defined by a configuration of '
@@ -1296,7 +1301,7 @@ class VisitDetail(SQLModel, table=True):
         ForeignKeyConstraint(['visit_occurrence_id'], ['visit_occurrence.visit_occurrence_id'], name='fpk_visit_detail_visit_occurrence_id'),
         PrimaryKeyConstraint('visit_detail_id', name='xpk_visit_detail'),
         Index('idx_visit_det_concept_id_1', 'visit_detail_concept_id'),
-        Index('idx_visit_det_occ_id', 'visit_occurrence_id'),
+        Index('idx_visit_det_occ_person', 'visit_occurrence_id', 'person_id'),
         Index('idx_visit_det_person_id_1', 'person_id'),
         {'comment': 'DESC: The VISIT_DETAIL table is an optional table used to '
                 'represents details of each record in the parent VISIT_OCCURRENCE '
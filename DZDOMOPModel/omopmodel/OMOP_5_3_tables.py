@@ -27,7 +27,7 @@ SOFTWARE.
 
 '''
 # OMOP CDM Source Version name: OMOP_5_3
-from sqlalchemy import Column, Date, DateTime, ForeignKeyConstraint, Index, Integer, MetaData, Numeric, PrimaryKeyConstraint, String, Table, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKeyConstraint, Index, Integer, MetaData, Numeric, PrimaryKeyConstraint, String, Table, Text, text
 
 metadata = MetaData()
 
@@ -66,9 +66,12 @@ concept = Table(
     PrimaryKeyConstraint('concept_id', name='xpk_concept'),
     Index('idx_concept_class_id', 'concept_class_id'),
     Index('idx_concept_code', 'concept_code'),
-    Index('idx_concept_concept_id', 'concept_id'),
     Index('idx_concept_domain_id', 'domain_id'),
     Index('idx_concept_vocabluary_id', 'vocabulary_id'),
+    Index('idx_concept_vocab_std_domain', 'vocabulary_id', 'standard_concept', 'domain_id', postgresql_include=['concept_id', 'concept_name']),
+    Index('idx_concept_code_vocab', 'concept_code', 'vocabulary_id'),
+    Index('idx_concept_standard', 'standard_concept', postgresql_where=text("standard_concept = 'S'")),
+    Index('brin_concept_valid_end_date', 'valid_end_date', postgresql_using='brin'),
     comment='DESC: The Standardized Vocabularies contains records, or Concepts, that uniquely identify each fundamental unit of meaning used to express clinical information in all domain tables of the CDM. Concepts are derived from vocabularies, which represent clinical information across a domain (e.g. conditions, drugs, procedures) through the use of codes and associated descriptions. Some Concepts are designated Standard Concepts, meaning these Concepts can be used as normative expressions of a clinical entity within the OMOP Common Data Model and within standardized analytics. Each Standard Concept belongs to one domain, which defines the location where the Concept would be expected to occur within data tables of the CDM.\n\nConcepts can represent broad categories (like "Cardiovascular disease"), detailed clinical elements ("Myocardial infarction of the anterolateral wall") or modifying characteristics and attributes that define Concepts at various levels of detail (severity of a disease, associated morphology, etc.).\n\nRecords in the Standardized Vocabularies tables are derived from national or international vocabularies such as SNOMED-CT, RxNorm, and LOINC, or custom Concepts defined to cover various aspects of observational data analysis. '
 )
 
@@ -79,7 +82,6 @@ concept_class = Table(
     Column('concept_class_concept_id', Integer, nullable=False, comment='USER GUIDANCE: A Concept that represents the Concept Class.'),
     ForeignKeyConstraint(['concept_class_concept_id'], ['concept.concept_id'], name='fpk_concept_class_concept_class_concept_id'),
     PrimaryKeyConstraint('concept_class_id', name='xpk_concept_class'),
-    Index('idx_concept_class_class_id', 'concept_class_id'),
     comment='DESC: The CONCEPT_CLASS table is a reference table, which includes a list of the classifications used to differentiate Concepts within a given Vocabulary. This reference table is populated with a single record for each Concept Class.'
 )
 
@@ -90,7 +92,6 @@ domain = Table(
     Column('domain_concept_id', Integer, nullable=False, comment='USER GUIDANCE: A Concept representing the Domain Concept the DOMAIN record belongs to.'),
     ForeignKeyConstraint(['domain_concept_id'], ['concept.concept_id'], name='fpk_domain_domain_concept_id'),
     PrimaryKeyConstraint('domain_id', name='xpk_domain'),
-    Index('idx_domain_domain_id', 'domain_id'),
     comment='DESC: The DOMAIN table includes a list of OMOP-defined Domains the Concepts of the Standardized Vocabularies can belong to. A Domain defines the set of allowable Concepts for the standardized fields in the CDM tables. For example, the "Condition" Domain contains Concepts that describe a condition of a patient, and these Concepts can only be stored in the condition_concept_id field of the CONDITION_OCCURRENCE and CONDITION_ERA tables. This reference table is populated with a single record for each Domain and includes a descriptive name for the Domain.'
 )
 
@@ -105,7 +106,6 @@ location = Table(
     Column('county', String(20)),
     Column('location_source_value', String(50), comment=' | ETLCONVENTIONS: Put the verbatim value for the location here, as it shows up in the source. '),
     PrimaryKeyConstraint('location_id', name='xpk_location'),
-    Index('idx_location_id_1', 'location_id'),
     comment='DESC: The LOCATION table represents a generic way to capture physical location or address information of Persons and Care Sites. | ETL CONVENTIONS: Each address or Location is unique and is present only once in the table. Locations do not contain names, such as the name of a hospital. In order to construct a full address that can be used in the postal service, the address information from the Location needs to be combined with information from the Care Site.'
 )
 
@@ -118,7 +118,6 @@ vocabulary = Table(
     Column('vocabulary_concept_id', Integer, nullable=False, comment='USER GUIDANCE: A Concept that represents the Vocabulary the VOCABULARY record belongs to.'),
     ForeignKeyConstraint(['vocabulary_concept_id'], ['concept.concept_id'], name='fpk_vocabulary_vocabulary_concept_id'),
     PrimaryKeyConstraint('vocabulary_id', name='xpk_vocabulary'),
-    Index('idx_vocabulary_vocabulary_id', 'vocabulary_id'),
     comment='DESC: The VOCABULARY table includes a list of the Vocabularies collected from various sources or created de novo by the OMOP community. This reference table is populated with a single record for each Vocabulary source and includes a descriptive name and other associated attributes for the Vocabulary.'
 )
 
@@ -145,7 +144,6 @@ care_site = Table(
     ForeignKeyConstraint(['location_id'], ['location.location_id'], name='fpk_care_site_location_id'),
     ForeignKeyConstraint(['place_of_service_concept_id'], ['concept.concept_id'], name='fpk_care_site_place_of_service_concept_id'),
     PrimaryKeyConstraint('care_site_id', name='xpk_care_site'),
-    Index('idx_care_site_id_1', 'care_site_id'),
     comment='DESC: The CARE_SITE table contains a list of uniquely identified institutional (physical or organizational) units where healthcare delivery is practiced (offices, wards, hospitals, clinics, etc.). | ETL CONVENTIONS: Care site is a unique combination of location_id and place_of_service_source_value. Care site does not take into account the provider (human) information such a specialty. Many source data do not make a distinction between individual and institutional providers. The CARE_SITE table contains the institutional providers. If the source, instead of uniquely identifying individual Care Sites, only provides limited information such as Place of Service, generic or "pooled" Care Site records are listed in the CARE_SITE table. There can be hierarchical and business relationships between Care Sites. For example, wards can belong to clinics or departments, which can in turn belong to hospitals, which in turn can belong to hospital systems, which in turn can belong to HMOs.The relationships between Care Sites are defined in the FACT_RELATIONSHIP table.'
 )
 
@@ -236,6 +234,7 @@ cost = Table(
     ForeignKeyConstraint(['revenue_code_concept_id'], ['concept.concept_id'], name='fpk_cost_revenue_code_concept_id'),
     PrimaryKeyConstraint('cost_id', name='xpk_cost'),
     Index('idx_cost_event_id', 'cost_event_id'),
+    Index('idx_cost_event_domain', 'cost_event_id', 'cost_domain_id', postgresql_include=['total_paid', 'total_charge']),
     comment='DESC: The COST table captures records containing the cost of any medical event recorded in one of the OMOP clinical event tables such as DRUG_EXPOSURE, PROCEDURE_OCCURRENCE, VISIT_OCCURRENCE, VISIT_DETAIL, DEVICE_OCCURRENCE, OBSERVATION or MEASUREMENT.\n\nEach record in the cost table account for the amount of money transacted for the clinical event. So, the COST table may be used to represent both receivables (charges) and payments (paid), each transaction type represented by its COST_CONCEPT_ID. The COST_TYPE_CONCEPT_ID field will use concepts in the Standardized Vocabularies to designate the source (provenance) of the cost data. A reference to the health plan information in the PAYER_PLAN_PERIOD table is stored in the record for information used for the adjudication system to determine the persons benefit for the clinical event. | USER GUIDANCE: When dealing with summary costs, the cost of the goods or services the provider provides is often not known directly, but derived from the hospital charges multiplied by an average cost-to-charge ratio. | ETL CONVENTIONS: One cost record is generated for each response by a payer. In a claims databases, the payment and payment terms reported by the payer for the goods or services billed will generate one cost record. If the source data has payment information for more than one payer (i.e. primary insurance and secondary insurance payment for one entity), then a cost record is created for each reporting payer. Therefore, it is possible for one procedure to have multiple cost records for each payer, but typically it contains one or no record per entity. Payer reimbursement cost records will be identified by using the PAYER_PLAN_ID field. Drug costs are composed of ingredient cost (the amount charged by the wholesale distributor or manufacturer), the dispensing fee (the amount charged by the pharmacy and the sales tax).'
 )
 
@@ -275,13 +274,11 @@ fact_relationship = Table(
     ForeignKeyConstraint(['domain_concept_id_2'], ['concept.concept_id'], name='fpk_fact_relationship_domain_concept_id_2'),
     ForeignKeyConstraint(['relationship_concept_id'], ['concept.concept_id'], name='fpk_fact_relationship_relationship_concept_id'),
     PrimaryKeyConstraint('domain_concept_id_1', 'fact_id_1', 'domain_concept_id_2', 'fact_id_2', 'relationship_concept_id', name='tmp_pk_candiate_key_fact_relationship'),
-    Index('idx_fact_relationship_id1', 'domain_concept_id_1'),
-    Index('idx_fact_relationship_id2', 'domain_concept_id_2'),
-    Index('idx_fact_relationship_id3', 'relationship_concept_id'),
+    Index('idx_fact_relationship_composite', 'domain_concept_id_1', 'fact_id_1', 'domain_concept_id_2', 'fact_id_2', 'relationship_concept_id'),
     comment='DESC: The FACT_RELATIONSHIP table contains records about the relationships between facts stored as records in any table of the CDM. Relationships can be defined between facts from the same domain, or different domains. Examples of Fact Relationships include: [Person relationships](https://athena.ohdsi.org/search-terms/terms?domain=Relationship&standardConcept=Standard&page=2&pageSize=15&query=) (parent-child), care site relationships (hierarchical organizational structure of facilities within a health system), indication relationship (between drug exposures and associated conditions), usage relationships (of devices during the course of an associated procedure), or facts derived from one another (measurements derived from an associated specimen). | ETL CONVENTIONS: All relationships are directional, and each relationship is represented twice symmetrically within the FACT_RELATIONSHIP table. For example, two persons if person_id = 1 is the mother of person_id = 2 two records are in the FACT_RELATIONSHIP table (all strings in fact concept_id records in the Concept table:\n- Person, 1, Person, 2, parent of\n- Person, 2, Person, 1, child of'
 )
 
-metadata = Table(
+metadata_table = Table(
     'metadata', metadata,
     Column('metadata_concept_id', Integer, primary_key=True, nullable=False),
     Column('metadata_type_concept_id', Integer, primary_key=True, nullable=False),
@@ -374,6 +371,7 @@ concept_relationship = Table(
     Index('idx_concept_relationship_id_1', 'concept_id_1'),
     Index('idx_concept_relationship_id_2', 'concept_id_2'),
     Index('idx_concept_relationship_id_3', 'relationship_id'),
+    Index('idx_concept_relationship_pair', 'concept_id_1', 'relationship_id', 'concept_id_2'),
     comment='DESC: The CONCEPT_RELATIONSHIP table contains records that define direct relationships between any two Concepts and the nature or type of the relationship. Each type of a relationship is defined in the RELATIONSHIP table.'
 )
 
@@ -398,7 +396,7 @@ provider = Table(
     ForeignKeyConstraint(['specialty_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_concept_id'),
     ForeignKeyConstraint(['specialty_source_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_source_concept_id'),
     PrimaryKeyConstraint('provider_id', name='xpk_provider'),
-    Index('idx_provider_id_1', 'provider_id'),
+    Index('idx_provider_specialty', 'specialty_concept_id'),
     comment='DESC: The PROVIDER table contains a list of uniquely identified healthcare providers. These are individuals providing hands-on healthcare to patients, such as physicians, nurses, midwives, physical therapists etc. | USER GUIDANCE: Many sources do not make a distinction between individual and institutional providers. The PROVIDER table contains the individual providers. If the source, instead of uniquely identifying individual providers, only provides limited information such as specialty, generic or "pooled" Provider records are listed in the PROVIDER table.'
 )
 
@@ -433,7 +431,6 @@ person = Table(
     ForeignKeyConstraint(['race_source_concept_id'], ['concept.concept_id'], name='fpk_person_race_source_concept_id'),
     PrimaryKeyConstraint('person_id', name='xpk_person'),
     Index('idx_gender', 'gender_concept_id'),
-    Index('idx_person_id', 'person_id'),
     comment='DESC: This table serves as the central identity management for all Persons in the database. It contains records that uniquely identify each person or patient, and some demographic information.  | USER GUIDANCE: All records in this table are independent Persons. | ETL CONVENTIONS: All Persons in a database needs one record in this table, unless they fail data quality requirements specified in the ETL. Persons with no Events should have a record nonetheless. If more than one data source contributes Events to the database, Persons must be reconciled, if possible, across the sources to create one single record per Person. The content of the BIRTH_DATETIME must be equivalent to the content of BIRTH_DAY, BIRTH_MONTH and BIRTH_YEAR. '
 )
 
@@ -469,7 +466,7 @@ dose_era = Table(
     ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_dose_era_unit_concept_id'),
     PrimaryKeyConstraint('dose_era_id', name='xpk_dose_era'),
     Index('idx_dose_era_concept_id_1', 'drug_concept_id'),
-    Index('idx_dose_era_person_id_1', 'person_id'),
+    Index('idx_dose_era_person_start', 'person_id', 'dose_era_start_date', 'drug_concept_id'),
     comment='DESC: A Dose Era is defined as a span of time when the Person is assumed to be exposed to a constant dose of a specific active ingredient. | ETL CONVENTIONS: Dose Eras will be derived from records in the DRUG_EXPOSURE table and the Dose information from the DRUG_STRENGTH table using a standardized algorithm. Dose Form information is not taken into account. So, if the patient changes between different formulations, or different manufacturers with the same formulation, the Dose Era is still spanning the entire time of exposure to the Ingredient. '
 )
 
@@ -486,7 +483,7 @@ drug_era = Table(
     ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_drug_era_person_id'),
     PrimaryKeyConstraint('drug_era_id', name='xpk_drug_era'),
     Index('idx_drug_era_concept_id_1', 'drug_concept_id'),
-    Index('idx_drug_era_person_id_1', 'person_id'),
+    Index('idx_drug_era_person_start', 'person_id', 'drug_era_start_date', 'drug_concept_id'),
     comment='DESC: A Drug Era is defined as a span of time when the Person is assumed to be exposed to a particular active ingredient. A Drug Era is not the same as a Drug Exposure: Exposures are individual records corresponding to the source when Drug was delivered to the Person, while successive periods of Drug Exposures are combined under certain rules to produce continuous Drug Eras. | ETL CONVENTIONS: The SQL script for generating DRUG_ERA records can be found [here](https://ohdsi.github.io/CommonDataModel/sqlScripts.html#drug_eras).'
 )
 
@@ -500,7 +497,8 @@ observation_period = Table(
     ForeignKeyConstraint(['period_type_concept_id'], ['concept.concept_id'], name='fpk_observation_period_period_type_concept_id'),
     ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_observation_period_person_id'),
     PrimaryKeyConstraint('observation_period_id', name='xpk_observation_period'),
-    Index('idx_observation_period_id_1', 'person_id'),
+    Index('idx_observation_period_person_start', 'person_id', 'observation_period_start_date', 'observation_period_end_date'),
+    Index('brin_observation_period_start_date', 'observation_period_start_date', postgresql_using='brin'),
     comment='DESC: This table contains records which define spans of time during which two conditions are expected to hold: (i) Clinical Events that happened to the Person are recorded in the Event tables, and (ii) absense of records indicate such Events did not occur during this span of time. | USER GUIDANCE: For each Person, one or more OBSERVATION_PERIOD records may be present, but they will not overlap or be back to back to each other. Events may exist outside all of the time spans of the OBSERVATION_PERIOD records for a patient, however, absence of an Event outside these time spans cannot be construed as evidence of absence of an Event. Incidence or prevalence rates should only be calculated for the time of active OBSERVATION_PERIOD records. When constructing cohorts, outside Events can be used for inclusion criteria definition, but without any guarantee for the performance of these criteria. Also, OBSERVATION_PERIOD records can be as short as a single day, greatly disturbing the denominator of any rate calculation as part of cohort characterizations. To avoid that, apply minimal observation time as a requirement for any cohort definition. | ETL CONVENTIONS: Each Person needs to have at least one OBSERVATION_PERIOD record, which should represent time intervals with a high capture rate of Clinical Events. Some source data have very similar concepts, such as enrollment periods in insurance claims data. In other source data such as most EHR systems these time spans need to be inferred under a set of assumptions. It is the discretion of the ETL developer to define these assumptions. In many ETL solutions the start date of the first occurrence or the first high quality occurrence of a Clinical Event (Condition, Drug, Procedure, Device, Measurement, Visit) is defined as the start of the OBSERVATION_PERIOD record, and the end date of the last occurrence of last high quality occurrence of a Clinical Event, or the end of the database period becomes the end of the OBSERVATOIN_PERIOD for each Person. If a Person only has a single Clinical Event the OBSERVATION_PERIOD record can be as short as one day. Depending on these definitions it is possible that Clinical Events fall outside the time spans defined by OBSERVATION_PERIOD records. Family history or history of Clinical Events generally are not used to generate OBSERVATION_PERIOD records around the time they are referring to. Any two overlapping or adjacent OBSERVATION_PERIOD records have to be merged into one.'
 )
 
@@ -533,7 +531,9 @@ payer_plan_period = Table(
     ForeignKeyConstraint(['stop_reason_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_concept_id'),
     ForeignKeyConstraint(['stop_reason_source_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_source_concept_id'),
     PrimaryKeyConstraint('payer_plan_period_id', name='xpk_payer_plan_period'),
-    Index('idx_period_person_id_1', 'person_id'),
+    Index('idx_payer_plan_period_person_start', 'person_id', 'payer_plan_period_start_date', 'payer_plan_period_end_date', postgresql_include=['payer_concept_id', 'plan_concept_id']),
+    Index('brin_payer_plan_period_start_date', 'payer_plan_period_start_date', postgresql_using='brin'),
+    Index('idx_payer_plan_period_stop_reason', 'stop_reason_concept_id', postgresql_where=text('stop_reason_concept_id IS NOT NULL')),
     comment='DESC: The PAYER_PLAN_PERIOD table captures details of the period of time that a Person is continuously enrolled under a specific health Plan benefit structure from a given Payer. Each Person receiving healthcare is typically covered by a health benefit plan, which pays for (fully or partially), or directly provides, the care. These benefit plans are provided by payers, such as health insurances or state or government agencies. In each plan the details of the health benefits are defined for the Person or her family, and the health benefit Plan might change over time typically with increasing utilization (reaching certain cost thresholds such as deductibles), plan availability and purchasing choices of the Person. The unique combinations of Payer organizations, health benefit Plans and time periods in which they are valid for a Person are recorded in this table. | USER GUIDANCE: A Person can have multiple, overlapping, Payer_Plan_Periods in this table. For example, medical and drug coverage in the US can be represented by two Payer_Plan_Periods. The details of the benefit structure of the Plan is rarely known, the idea is just to identify that the Plans are different.'
 )
 
@@ -559,7 +559,9 @@ procedure_occurrence = Table(
     ForeignKeyConstraint(['procedure_type_concept_id'], ['concept.concept_id'], name='fpk_procedure_occurrence_procedure_type_concept_id'),
     PrimaryKeyConstraint('procedure_occurrence_id', name='xpk_procedure_occurrence'),
     Index('idx_procedure_concept_id_1', 'procedure_concept_id'),
-    Index('idx_procedure_person_id_1', 'person_id'),
+    Index('idx_procedure_person_date', 'person_id', 'procedure_date', postgresql_include=['procedure_concept_id', 'visit_occurrence_id', 'quantity']),
+    Index('brin_procedure_date', 'procedure_date', postgresql_using='brin'),
+    Index('idx_procedure_source_concept', 'procedure_source_concept_id', postgresql_where=text('procedure_source_concept_id IS NOT NULL')),
     Index('idx_procedure_visit_id_1', 'visit_occurrence_id'),
     comment='DESC: This table contains records of activities or processes ordered by, or carried out by, a healthcare provider on the patient with a diagnostic or therapeutic purpose. | USER GUIDANCE: Lab tests are not a procedure, if something is observed with an expected resulting amount and unit then it should be a measurement. Phlebotomy is a procedure but so trivial that it tends to be rarely captured. It can be assumed that there is a phlebotomy procedure associated with many lab tests, therefore it is unnecessary to add them as separate procedures. If the user finds the same procedure over concurrent days, it is assumed those records are part of a procedure lasting more than a day. This logic is in lieu of the procedure_end_date, which will be added in a future version of the CDM. | ETL CONVENTIONS: If a procedure lasts more than 24 hours, then it should be recorded as a separate record for each day the procedure occurred, this logic is in lieu of the PROCEDURE_END_DATE, which will be added in a future version of the CDM. When dealing with duplicate records, the ETL must determine whether to sum them up into one record or keep them separate. Things to consider are: - Same Procedure - Same PROCEDURE_DATETIME - Same Visit Occurrence or Visit Detail - Same Provider - Same Modifier for Procedures. Source codes and source text fields mapped to Standard Concepts of the Procedure Domain have to be recorded here.'
 )
@@ -589,7 +591,9 @@ specimen = Table(
     ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_specimen_unit_concept_id'),
     PrimaryKeyConstraint('specimen_id', name='xpk_specimen'),
     Index('idx_specimen_concept_id_1', 'specimen_concept_id'),
-    Index('idx_specimen_person_id_1', 'person_id'),
+    Index('idx_specimen_person_id_1', 'person_id', postgresql_include=['specimen_concept_id', 'quantity']),
+    Index('brin_specimen_date', 'specimen_date', postgresql_using='brin'),
+    Index('idx_specimen_anatomic_site', 'anatomic_site_concept_id', postgresql_where=text('anatomic_site_concept_id IS NOT NULL')),
     comment='DESC: The specimen domain contains the records identifying biological samples from a person. | ETL CONVENTIONS: Anatomic site is coded at the most specific level of granularity possible, such that higher level classifications can be derived using the Standardized Vocabularies.'
 )
 
@@ -623,7 +627,8 @@ visit_occurrence = Table(
     ForeignKeyConstraint(['visit_type_concept_id'], ['concept.concept_id'], name='fpk_visit_occurrence_visit_type_concept_id'),
     PrimaryKeyConstraint('visit_occurrence_id', name='xpk_visit_occurrence'),
     Index('idx_visit_concept_id_1', 'visit_concept_id'),
-    Index('idx_visit_person_id_1', 'person_id'),
+    Index('idx_visit_person_date', 'person_id', 'visit_start_date'),
+    Index('brin_visit_start_date', 'visit_start_date', postgresql_using='brin'),
     comment='DESC: This table contains Events where Persons engage with the healthcare system for a duration of time. They are often also called "Encounters". Visits are defined by a configuration of circumstances under which they occur, such as (i) whether the patient comes to a healthcare institution, the other way around, or the interaction is remote, (ii) whether and what kind of trained medical staff is delivering the service during the Visit, and (iii) whether the Visit is transient or for a longer period involving a stay in bed.  | USER GUIDANCE: The configuration defining the Visit are described by Concepts in the Visit Domain, which form a hierarchical structure, but rolling up to generally familiar Visits adopted in most healthcare systems worldwide:\n\n- [Inpatient Visit](https://athena.ohdsi.org/search-terms/terms/9201): Person visiting hospital, at a Care Site, in bed, for duration of more than one day, with physicians and other Providers permanently available to deliver service around the clock \n- [Emergency Room Visit](https://athena.ohdsi.org/search-terms/terms/9203): Person visiting dedicated healthcare institution for treating emergencies, at a Care Site, within one day, with physicians and Providers permanently available to deliver service around the clock\n- [Emergency Room and Inpatient Visit](https://athena.ohdsi.org/search-terms/terms/262): Person visiting ER followed by a subsequent Inpatient Visit, where Emergency department is part of hospital, and transition from the ER to other hospital departments is undefined\n- [Non-hospital institution Visit](https://athena.ohdsi.org/search-terms/terms/42898160): Person visiting dedicated institution for reasons of poor health, at a Care Site, long-term or permanently, with no physician but possibly other Providers permanently available to deliver service around the clock\n- [Outpatient Visit](https://athena.ohdsi.org/search-terms/terms/9202): Person visiting dedicated ambulatory healthcare institution, at a Care Site, within one day, without bed, with physicians or medical Providers delivering service during Visit\n- [Home Visit](https://athena.ohdsi.org/search-terms/terms/581476): Provider visiting Person, without a Care Site, within one day, delivering service\n- [Telehealth Visit](https://athena.ohdsi.org/search-terms/terms/5083): Patient engages with Provider through communication media\n- [Pharmacy Visit](https://athena.ohdsi.org/search-terms/terms/581458): Person visiting pharmacy for dispensing of Drug, at a Care Site, within one day\n- [Laboratory Visit](https://athena.ohdsi.org/search-terms/terms/32036): Patient visiting dedicated institution, at a Care Site, within one day, for the purpose of a Measurement.\n- [Ambulance Visit](https://athena.ohdsi.org/search-terms/terms/581478): Person using transportation service for the purpose of initiating one of the other Visits, without a Care Site, within one day, potentially with Providers accompanying the Visit and delivering service\n- [Case Management Visit](https://athena.ohdsi.org/search-terms/terms/38004193): Person interacting with healthcare system, without a Care Site, within a day, with no Providers involved, for administrative purposes\n\nThe Visit duration, or "length of stay", is defined as VISIT_END_DATE - VISIT_START_DATE. For all Visits this is <1 day, except Inpatient Visits and Non-hospital institution Visits. The CDM also contains the VISIT_DETAIL table where additional information about the Visit is stored, for example, transfers between units during an inpatient Visit. | ETL CONVENTIONS: Visits can be derived easily if the source data contain coding systems for Place of Service or Procedures, like CPT codes for well visits. In those cases, the codes can be looked up and mapped to a Standard Visit Concept. Otherwise, Visit Concepts have to be identified in the ETL process. This table will contain concepts in the Visit domain. These concepts are arranged in a hierarchical structure to facilitate cohort definitions by rolling up to generally familiar Visits adopted in most healthcare systems worldwide. Visits can be adjacent to each other, i.e. the end date of one can be identical with the start date of the other. As a consequence, more than one-day Visits or their descendants can be recorded for the same day. Multi-day visits must not overlap, i.e. share days other than start and end days. It is often the case that some logic should be written for how to define visits and how to assign Visit_Concept_Id. For example, in US claims outpatient visits that appear to occur within the time period of an inpatient visit can be rolled into one with the same Visit_Occurrence_Id. In EHR data inpatient visits that are within one day of each other may be strung together to create one visit. It will all depend on the source data and how encounter records should be translated to visit occurrences. Providers can be associated with a Visit through the PROVIDER_ID field, or indirectly through PROCEDURE_OCCURRENCE records linked both to the VISIT and PROVIDER tables.'
 )
 
@@ -661,7 +666,7 @@ visit_detail = Table(
     ForeignKeyConstraint(['visit_occurrence_id'], ['visit_occurrence.visit_occurrence_id'], name='fpk_visit_detail_visit_occurrence_id'),
     PrimaryKeyConstraint('visit_detail_id', name='xpk_visit_detail'),
     Index('idx_visit_det_concept_id_1', 'visit_detail_concept_id'),
-    Index('idx_visit_det_occ_id', 'visit_occurrence_id'),
+    Index('idx_visit_det_occ_person', 'visit_occurrence_id', 'person_id'),
     Index('idx_visit_det_person_id_1', 'person_id'),
     comment='DESC: The VISIT_DETAIL table is an optional table used to represents details of each record in the parent VISIT_OCCURRENCE table. A good example of this would be the movement between units in a hospital during an inpatient stay or claim lines associated with a one insurance claim. For every record in the VISIT_OCCURRENCE table there may be 0 or more records in the VISIT_DETAIL table with a 1:n relationship where n may be 0. The VISIT_DETAIL table is structurally very similar to VISIT_OCCURRENCE table and belongs to the visit domain. | USER GUIDANCE: The configuration defining the Visit Detail is described by Concepts in the Visit Domain, which form a hierarchical structure. The Visit Detail record will have an associated to the Visit Occurrence record in two ways: <br> 1. The Visit Detail record will have the VISIT_OCCURRENCE_ID it is associated to 2. The VISIT_DETAIL_CONCEPT_ID  will be a descendant of the VISIT_CONCEPT_ID for the Visit. | ETL CONVENTIONS: It is not mandatory that the VISIT_DETAIL table be filled in, but if you find that the logic to create VISIT_OCCURRENCE records includes the roll-up of multiple smaller records to create one picture of a Visit then it is a good idea to use VISIT_DETAIL. In EHR data, for example, a Person may be in the hospital but instead of one over-arching Visit their encounters are recorded as times they interacted with a health care provider. A Person in the hospital interacts with multiple providers multiple times a day so the encounters must be strung together using some heuristic (defined by the ETL) to identify the entire Visit. In this case the encounters would be considered Visit Details and the entire Visit would be the Visit Occurrence. In this example it is also possible to use the Vocabulary to distinguish Visit Details from a Visit Occurrence by setting the VISIT_CONCEPT_ID to [9201](https://athena.ohdsi.org/search-terms/terms/9201) and the VISIT_DETAIL_CONCEPT_IDs either to 9201 or its children to indicate where the patient was in the hospital at the time of care.'
 )
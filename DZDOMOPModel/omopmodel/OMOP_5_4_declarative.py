@@ -27,11 +27,52 @@ SOFTWARE.
 
 '''
 from typing import List, Optional
+from functools import lru_cache
 
-from sqlalchemy import Date, DateTime, ForeignKeyConstraint, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import Date, DateTime, ForeignKeyConstraint, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, WriteOnlyMapped, mapped_column, relationship
 import datetime
 import decimal
+import os
+
+@lru_cache(maxsize=None)
+def _String(length: int) -> String:
+    """Shared String type singletons - one instance per length instead of one per column."""
+    return String(length)
+
+# Shared scalar type singletons - like _String, one instance reused by every
+# column instead of one TypeEngine construction per mapped_column call.
+_Integer = Integer()
+_Numeric = Numeric()
+_Date = Date()
+_DateTime = DateTime()
+_Text = Text()
+
+
+
+def _ddl_comment(text):
+    """Return a table or column DDL comment, or None when OMOP_NO_COMMENTS is set.
+
+    The table blocks and column strings below hold megabytes-scale DESC/USER
+    GUIDANCE/ETL CONVENTIONS text that only matters when DDL is emitted or inspected
+    (create_all, Alembic autogenerate); long-running processes that never create
+    tables can set OMOP_NO_COMMENTS=1 to drop all of it at import time and save the
+    resident strings.
+    """
+    return None if os.environ.get("OMOP_NO_COMMENTS") else text
+
+
+# Column comment literals shared by several tables, hoisted so the module
+# keeps a single str object per text instead of one copy per column.
+_COMMENT_INGREDIENT_CONCEPT_ID = 'USER GUIDANCE: The Concept Id representing the specific drug ingredient.'
+_COMMENT_VISIT_START_MIDNIGHT = ' | ETLCONVENTIONS: If no time is given for the start date of a visit, set it to midnight (00:00:0000).'
+_COMMENT_VISIT_END_MIDNIGHT = 'USER GUIDANCE: If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_datetime, then set the visit_end_datetime to the datetime of the data pull. | ETLCONVENTIONS: If no time is given for the end date of a visit, set it to midnight (00:00:0000).'
+_COMMENT_ADMITTED_FROM = ' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was admitted from. Typically this applies only to visits that have a length of stay, like inpatient visits or long-term care visits.'
+_COMMENT_DISCHARGED_TO = ' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was discharged to after a visit, as in they went home or were moved to long-term care. Typically this applies only to visits that have a length of stay of a day or more.'
+_COMMENT_DATETIME_MIDNIGHT = ' | ETLCONVENTIONS: If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)'
+_COMMENT_DATETIME_NOT_REQUIRED_V6 = ' | ETLCONVENTIONS: This is not required, though it is in v6. If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)'
+_COMMENT_RANGE_UNITS = 'USER GUIDANCE: Ranges have the same unit as the VALUE_AS_NUMBER. These ranges are provided by the source and should remain NULL if not given. | ETLCONVENTIONS: If reference ranges for upper and lower limit of normal as provided (typically by a laboratory) these are stored in the RANGE_HIGH and RANGE_LOW fields. This should be set to NULL if not provided.'
+
 
 class Base(DeclarativeBase):
     pass
@@ -40,7 +81,7 @@ class Base(DeclarativeBase):
 class Cohort(Base):
     __tablename__ = 'cohort'
     __table_args__ = (
-        {'comment': 'DESC: The COHORT table contains records of subjects that satisfy '
+        {'comment': _ddl_comment('DESC: The COHORT table contains records of subjects that satisfy '
                 'a given set of criteria for a duration of time. The definition of '
                 'the cohort is contained within the COHORT_DEFINITION table. It is '
                 'listed as part of the RESULTS schema because it is a table that '
@@ -61,13 +102,13 @@ class Cohort(Base):
                 'cohort at any moment in time. A subject can only have one record '
                 'in the cohort table for any moment of time, i.e. it is not '
                 'possible for a person to contain multiple records indicating '
-                'cohort membership that are overlapping in time'}
+                'cohort membership that are overlapping in time')}
     )
     __mapper_args__ = {"primary_key": ['cohort_definition_id', 'subject_id', 'cohort_start_date', 'cohort_end_date']}
-    cohort_definition_id: Mapped[int] = mapped_column(Integer, )
-    subject_id: Mapped[int] = mapped_column(Integer, )
-    cohort_start_date: Mapped[datetime.date] = mapped_column(Date, )
-    cohort_end_date: Mapped[datetime.date] = mapped_column(Date, )
+    cohort_definition_id: Mapped[int] = mapped_column(_Integer, )
+    subject_id: Mapped[int] = mapped_column(_Integer, )
+    cohort_start_date: Mapped[datetime.date] = mapped_column(_Date, )
+    cohort_end_date: Mapped[datetime.date] = mapped_column(_Date, )
 
 
 class Concept(Base):
@@ -79,10 +120,13 @@ class Concept(Base):
         PrimaryKeyConstraint('concept_id', name='xpk_concept'),
         Index('idx_concept_class_id', 'concept_class_id'),
         Index('idx_concept_code', 'concept_code'),
-        Index('idx_concept_concept_id', 'concept_id'),
         Index('idx_concept_domain_id', 'domain_id'),
         Index('idx_concept_vocabluary_id', 'vocabulary_id'),
-        {'comment': 'DESC: The Standardized Vocabularies contains records, or '
+        Index('idx_concept_vocab_std_domain', 'vocabulary_id', 'standard_concept', 'domain_id', postgresql_include=['concept_id', 'concept_name']),
+        Index('idx_concept_code_vocab', 'concept_code', 'vocabulary_id'),
+        Index('idx_concept_standard', 'standard_concept', postgresql_where=text("standard_concept = 'S'")),
+        Index('brin_concept_valid_end_date', 'valid_end_date', postgresql_using='brin'),
+        {'comment': _ddl_comment('DESC: The Standardized Vocabularies contains records, or '
                 'Concepts, that uniquely identify each fundamental unit of meaning '
                 'used to express clinical information in all domain tables of the '
                 'CDM. Concepts are derived from vocabularies, which represent '
@@ -104,24 +148,25 @@ class Concept(Base):
                 'Records in the Standardized Vocabularies tables are derived from '
                 'national or international vocabularies such as SNOMED-CT, RxNorm, '
                 'and LOINC, or custom Concepts defined to cover various aspects of '
-                'observational data analysis. '}
+                'observational data analysis. ')}
     )
 
-    concept_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A unique identifier for each Concept across all domains.')
-    concept_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: An unambiguous, meaningful and descriptive name for the Concept.')
-    domain_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: A foreign key to the [DOMAIN](https://ohdsi.github.io/CommonDataModel/cdm531.html#domain) table the Concept belongs to.')
-    vocabulary_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: A foreign key to the [VOCABULARY](https://ohdsi.github.io/CommonDataModel/cdm531.html#vocabulary)\ntable indicating from which source the\nConcept has been adapted.')
-    concept_class_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: The attribute or concept class of the\nConcept. Examples are "Clinical Drug",\n"Ingredient", "Clinical Finding" etc.')
-    concept_code: Mapped[str] = mapped_column(String(50), comment='USER GUIDANCE: The concept code represents the identifier\nof the Concept in the source vocabulary,\nsuch as SNOMED-CT concept IDs,\nRxNorm RXCUIs etc. Note that concept\ncodes are not unique across vocabularies.')
-    valid_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the Concept was first\nrecorded. The default value is\n1-Jan-1970, meaning, the Concept has no\n(known) date of inception.')
-    valid_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the Concept became\ninvalid because it was deleted or\nsuperseded (updated) by a new concept.\nThe default value is 31-Dec-2099,\nmeaning, the Concept is valid until it\nbecomes deprecated.')
-    standard_concept: Mapped[Optional[str]] = mapped_column(String(1), comment='USER GUIDANCE: This flag determines where a Concept is\na Standard Concept, i.e. is used in the\ndata, a Classification Concept, or a\nnon-standard Source Concept. The\nallowable values are "S" (Standard\nConcept) and "C" (Classification\nConcept), otherwise the content is NULL.')
-    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1), comment='USER GUIDANCE: Reason the Concept was invalidated.\nPossible values are D (deleted), U\n(replaced with an update) or NULL when\nvalid_end_date has the default value.')
+    __mapper_args__ = {"eager_defaults": False}
+    concept_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for each Concept across all domains.'))
+    concept_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: An unambiguous, meaningful and descriptive name for the Concept.'))
+    domain_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: A foreign key to the [DOMAIN](https://ohdsi.github.io/CommonDataModel/cdm531.html#domain) table the Concept belongs to.'))
+    vocabulary_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: A foreign key to the [VOCABULARY](https://ohdsi.github.io/CommonDataModel/cdm531.html#vocabulary)\ntable indicating from which source the\nConcept has been adapted.'))
+    concept_class_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The attribute or concept class of the\nConcept. Examples are "Clinical Drug",\n"Ingredient", "Clinical Finding" etc.'))
+    concept_code: Mapped[str] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: The concept code represents the identifier\nof the Concept in the source vocabulary,\nsuch as SNOMED-CT concept IDs,\nRxNorm RXCUIs etc. Note that concept\ncodes are not unique across vocabularies.'))
+    valid_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the Concept was first\nrecorded. The default value is\n1-Jan-1970, meaning, the Concept has no\n(known) date of inception.'))
+    valid_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the Concept became\ninvalid because it was deleted or\nsuperseded (updated) by a new concept.\nThe default value is 31-Dec-2099,\nmeaning, the Concept is valid until it\nbecomes deprecated.'))
+    standard_concept: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: This flag determines where a Concept is\na Standard Concept, i.e. is used in the\ndata, a Classification Concept, or a\nnon-standard Source Concept. The\nallowable values are "S" (Standard\nConcept) and "C" (Classification\nConcept), otherwise the content is NULL.'))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Reason the Concept was invalidated.\nPossible values are D (deleted), U\n(replaced with an update) or NULL when\nvalid_end_date has the default value.'))
 
-    concept_class: Mapped['ConceptClass'] = relationship('ConceptClass', foreign_keys=[concept_class_id], back_populates='concepts')
-    domain: Mapped['Domain'] = relationship('Domain', foreign_keys=[domain_id], back_populates='concepts')
-    vocabulary: Mapped['Vocabulary'] = relationship('Vocabulary', foreign_keys=[vocabulary_id], back_populates='concepts')
-    concept_classes: Mapped[List['ConceptClass']] = relationship('ConceptClass', foreign_keys='[ConceptClass.concept_class_concept_id]', back_populates='concept_class_concept')
+    concept_class: Mapped['ConceptClass'] = relationship('ConceptClass', foreign_keys=[concept_class_id], back_populates='concepts', lazy='selectin')
+    domain: Mapped['Domain'] = relationship('Domain', foreign_keys=[domain_id], back_populates='concepts', lazy='selectin')
+    vocabulary: Mapped['Vocabulary'] = relationship('Vocabulary', foreign_keys=[vocabulary_id], back_populates='concepts', lazy='selectin')
+    concept_classes: Mapped[List['ConceptClass']] = relationship('ConceptClass', foreign_keys='[ConceptClass.concept_class_concept_id]', back_populates='concept_class_concept', lazy='raise_on_sql')
 
 
 class ConceptClass(Base):
@@ -129,19 +174,18 @@ class ConceptClass(Base):
     __table_args__ = (
         ForeignKeyConstraint(['concept_class_concept_id'], ['concept.concept_id'], name='fpk_concept_class_concept_class_concept_id'),
         PrimaryKeyConstraint('concept_class_id', name='xpk_concept_class'),
-        Index('idx_concept_class_class_id', 'concept_class_id'),
-        {'comment': 'DESC: The CONCEPT_CLASS table is a reference table, which '
+        {'comment': _ddl_comment('DESC: The CONCEPT_CLASS table is a reference table, which '
                 'includes a list of the classifications used to differentiate '
                 'Concepts within a given Vocabulary. This reference table is '
-                'populated with a single record for each Concept Class.'}
+                'populated with a single record for each Concept Class.')}
     )
 
-    concept_class_id: Mapped[str] = mapped_column(String(20), primary_key=True, comment='USER GUIDANCE: A unique key for each class.')
-    concept_class_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: The name describing the Concept Class, e.g.\nClinical Finding, Ingredient, etc.')
-    concept_class_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A Concept that represents the Concept Class.')
+    concept_class_id: Mapped[str] = mapped_column(_String(20), primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique key for each class.'))
+    concept_class_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The name describing the Concept Class, e.g.\nClinical Finding, Ingredient, etc.'))
+    concept_class_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A Concept that represents the Concept Class.'))
 
-    concepts: Mapped[List['Concept']] = relationship('Concept', foreign_keys='[Concept.concept_class_id]', back_populates='concept_class')
-    concept_class_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_class_concept_id])
+    concepts: WriteOnlyMapped['Concept'] = relationship('Concept', foreign_keys='[Concept.concept_class_id]', back_populates='concept_class', lazy='write_only')
+    concept_class_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_class_concept_id], lazy='raise_on_sql')
 
 
 class Domain(Base):
@@ -149,8 +193,7 @@ class Domain(Base):
     __table_args__ = (
         ForeignKeyConstraint(['domain_concept_id'], ['concept.concept_id'], name='fpk_domain_domain_concept_id'),
         PrimaryKeyConstraint('domain_id', name='xpk_domain'),
-        Index('idx_domain_domain_id', 'domain_id'),
-        {'comment': 'DESC: The DOMAIN table includes a list of OMOP-defined Domains '
+        {'comment': _ddl_comment('DESC: The DOMAIN table includes a list of OMOP-defined Domains '
                 'the Concepts of the Standardized Vocabularies can belong to. A '
                 'Domain defines the set of allowable Concepts for the standardized '
                 'fields in the CDM tables. For example, the "Condition" Domain '
@@ -158,16 +201,16 @@ class Domain(Base):
                 'these Concepts can only be stored in the condition_concept_id '
                 'field of the CONDITION_OCCURRENCE and CONDITION_ERA tables. This '
                 'reference table is populated with a single record for each Domain '
-                'and includes a descriptive name for the Domain.'}
+                'and includes a descriptive name for the Domain.')}
     )
 
-    domain_id: Mapped[str] = mapped_column(String(20), primary_key=True, comment='USER GUIDANCE: A unique key for each domain.')
-    domain_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: The name describing the Domain, e.g.\nCondition, Procedure, Measurement\netc.')
-    domain_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A Concept representing the Domain Concept the DOMAIN record belongs to.')
+    domain_id: Mapped[str] = mapped_column(_String(20), primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique key for each domain.'))
+    domain_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The name describing the Domain, e.g.\nCondition, Procedure, Measurement\netc.'))
+    domain_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A Concept representing the Domain Concept the DOMAIN record belongs to.'))
 
-    concepts: Mapped[List['Concept']] = relationship('Concept', foreign_keys='[Concept.domain_id]', back_populates='domain')
-    domain_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id])
-    costs: Mapped[List['Cost']] = relationship('Cost', back_populates='cost_domain')
+    concepts: WriteOnlyMapped['Concept'] = relationship('Concept', foreign_keys='[Concept.domain_id]', back_populates='domain', lazy='write_only')
+    domain_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id], lazy='raise_on_sql')
+    costs: WriteOnlyMapped['Cost'] = relationship('Cost', back_populates='cost_domain', lazy='write_only')
 
 
 class Vocabulary(Base):
@@ -175,45 +218,44 @@ class Vocabulary(Base):
     __table_args__ = (
         ForeignKeyConstraint(['vocabulary_concept_id'], ['concept.concept_id'], name='fpk_vocabulary_vocabulary_concept_id'),
         PrimaryKeyConstraint('vocabulary_id', name='xpk_vocabulary'),
-        Index('idx_vocabulary_vocabulary_id', 'vocabulary_id'),
-        {'comment': 'DESC: The VOCABULARY table includes a list of the Vocabularies '
+        {'comment': _ddl_comment('DESC: The VOCABULARY table includes a list of the Vocabularies '
                 'collected from various sources or created de novo by the OMOP '
                 'community. This reference table is populated with a single record '
                 'for each Vocabulary source and includes a descriptive name and '
-                'other associated attributes for the Vocabulary.'}
+                'other associated attributes for the Vocabulary.')}
     )
 
-    vocabulary_id: Mapped[str] = mapped_column(String(20), primary_key=True, comment='USER GUIDANCE: A unique identifier for each Vocabulary, such\nas ICD9CM, SNOMED, Visit.')
-    vocabulary_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: The name describing the vocabulary, for\nexample, International Classification of\nDiseases, Ninth Revision, Clinical\nModification, Volume 1 and 2 (NCHS) etc.')
-    vocabulary_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A Concept that represents the Vocabulary the VOCABULARY record belongs to.')
-    vocabulary_reference: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: External reference to documentation or\navailable download of the about the\nvocabulary.')
-    vocabulary_version: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: Version of the Vocabulary as indicated in\nthe source.')
+    vocabulary_id: Mapped[str] = mapped_column(_String(20), primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for each Vocabulary, such\nas ICD9CM, SNOMED, Visit.'))
+    vocabulary_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The name describing the vocabulary, for\nexample, International Classification of\nDiseases, Ninth Revision, Clinical\nModification, Volume 1 and 2 (NCHS) etc.'))
+    vocabulary_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A Concept that represents the Vocabulary the VOCABULARY record belongs to.'))
+    vocabulary_reference: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: External reference to documentation or\navailable download of the about the\nvocabulary.'))
+    vocabulary_version: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: Version of the Vocabulary as indicated in\nthe source.'))
 
-    concepts: Mapped[List['Concept']] = relationship('Concept', foreign_keys='[Concept.vocabulary_id]', back_populates='vocabulary')
-    vocabulary_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[vocabulary_concept_id])
-    source_to_concept_maps: Mapped[List['SourceToConceptMap']] = relationship('SourceToConceptMap', back_populates='target_vocabulary')
+    concepts: WriteOnlyMapped['Concept'] = relationship('Concept', foreign_keys='[Concept.vocabulary_id]', back_populates='vocabulary', lazy='write_only')
+    vocabulary_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[vocabulary_concept_id], lazy='raise_on_sql')
+    source_to_concept_maps: WriteOnlyMapped['SourceToConceptMap'] = relationship('SourceToConceptMap', back_populates='target_vocabulary', lazy='write_only')
 
 
 class CdmSource(Base):
     __tablename__ = 'cdm_source'
     __table_args__ = (
         ForeignKeyConstraint(['cdm_version_concept_id'], ['concept.concept_id'], name='fpk_cdm_source_cdm_version_concept_id'),
-        {'comment': 'DESC: The CDM_SOURCE table contains detail about the source '
+        {'comment': _ddl_comment('DESC: The CDM_SOURCE table contains detail about the source '
                 'database and the process used to transform the data into the OMOP '
-                'Common Data Model.'}
+                'Common Data Model.')}
     )
     __mapper_args__ = {"primary_key": ['cdm_source_abbreviation', 'cdm_holder', 'cdm_version_concept_id', 'vocabulary_version']}
-    cdm_source_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: The name of the CDM instance.')
-    cdm_source_abbreviation: Mapped[str] = mapped_column(String(25), comment='USER GUIDANCE: The abbreviation of the CDM instance.')
-    cdm_holder: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: The holder of the CDM instance.')
-    source_release_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The release date of the source data.')
-    cdm_release_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The release data of the CDM instance.')
-    cdm_version_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the version of the CDM. | ETLCONVENTIONS: You can find all concepts that represent the CDM versions using the query: SELECT * FROM CONCEPT WHERE VOCABULARY_ID = "CDM" AND CONCEPT_CLASS = "CDM"')
-    vocabulary_version: Mapped[str] = mapped_column(String(20), comment=' | ETLCONVENTIONS: You can find the version of your Vocabulary using the query: SELECT vocabulary_version from vocabulary where vocabulary_id = "None"')
-    source_description: Mapped[Optional[str]] = mapped_column(Text, comment='USER GUIDANCE: The description of the CDM instance.')
-    source_documentation_reference: Mapped[Optional[str]] = mapped_column(String(255))
-    cdm_etl_reference: Mapped[Optional[str]] = mapped_column(String(255), comment=' | ETLCONVENTIONS: Put the link to the CDM version used.')
-    cdm_version: Mapped[Optional[str]] = mapped_column(String(10))
+    cdm_source_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The name of the CDM instance.'))
+    cdm_source_abbreviation: Mapped[str] = mapped_column(_String(25), comment=_ddl_comment('USER GUIDANCE: The abbreviation of the CDM instance.'))
+    cdm_holder: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The holder of the CDM instance.'))
+    source_release_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The release date of the source data.'))
+    cdm_release_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The release data of the CDM instance.'))
+    cdm_version_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id representing the version of the CDM. | ETLCONVENTIONS: You can find all concepts that represent the CDM versions using the query: SELECT * FROM CONCEPT WHERE VOCABULARY_ID = "CDM" AND CONCEPT_CLASS = "CDM"'))
+    vocabulary_version: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment(' | ETLCONVENTIONS: You can find the version of your Vocabulary using the query: SELECT vocabulary_version from vocabulary where vocabulary_id = "None"'))
+    source_description: Mapped[Optional[str]] = mapped_column(_Text, comment=_ddl_comment('USER GUIDANCE: The description of the CDM instance.'))
+    source_documentation_reference: Mapped[Optional[str]] = mapped_column(_String(255))
+    cdm_etl_reference: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment(' | ETLCONVENTIONS: Put the link to the CDM version used.'))
+    cdm_version: Mapped[Optional[str]] = mapped_column(_String(10))
 
     cdm_version_concept: Mapped['Concept'] = relationship('Concept')
 
@@ -223,7 +265,7 @@ class CohortDefinition(Base):
     __table_args__ = (
         ForeignKeyConstraint(['definition_type_concept_id'], ['concept.concept_id'], name='fpk_cohort_definition_definition_type_concept_id'),
         ForeignKeyConstraint(['subject_concept_id'], ['concept.concept_id'], name='fpk_cohort_definition_subject_concept_id'),
-        {'comment': 'DESC: The COHORT_DEFINITION table contains records defining a '
+        {'comment': _ddl_comment('DESC: The COHORT_DEFINITION table contains records defining a '
                 'Cohort derived from the data through the associated description '
                 'and syntax and upon instantiation (execution of the algorithm) '
                 'placed into the COHORT table. Cohorts are a set of subjects that '
@@ -231,19 +273,19 @@ class CohortDefinition(Base):
                 'of time. The COHORT_DEFINITION table provides a standardized '
                 'structure for maintaining the rules governing the inclusion of a '
                 'subject into a cohort, and can store operational programming code '
-                'to instantiate the cohort within the OMOP Common Data Model.'}
+                'to instantiate the cohort within the OMOP Common Data Model.')}
     )
     __mapper_args__ = {"primary_key": ['cohort_definition_id', 'definition_type_concept_id', 'subject_concept_id']}
-    cohort_definition_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This is the identifier given to the cohort, usually by the ATLAS application')
-    cohort_definition_name: Mapped[str] = mapped_column(String(255), comment='USER GUIDANCE: A short description of the cohort')
-    definition_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Type defining what kind of Cohort Definition the record represents and how the syntax may be executed.')
-    subject_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field contains a Concept that represents the domain of the subjects that are members of the cohort (e.g., Person, Provider, Visit).')
-    cohort_definition_description: Mapped[Optional[str]] = mapped_column(Text, comment='USER GUIDANCE: A complete description of the cohort.')
-    cohort_definition_syntax: Mapped[Optional[str]] = mapped_column(Text, comment='USER GUIDANCE: Syntax or code to operationalize the Cohort Definition.')
-    cohort_initiation_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: A date to indicate when the Cohort was initiated in the COHORT table.')
+    cohort_definition_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the identifier given to the cohort, usually by the ATLAS application'))
+    cohort_definition_name: Mapped[str] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: A short description of the cohort'))
+    definition_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Type defining what kind of Cohort Definition the record represents and how the syntax may be executed.'))
+    subject_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field contains a Concept that represents the domain of the subjects that are members of the cohort (e.g., Person, Provider, Visit).'))
+    cohort_definition_description: Mapped[Optional[str]] = mapped_column(_Text, comment=_ddl_comment('USER GUIDANCE: A complete description of the cohort.'))
+    cohort_definition_syntax: Mapped[Optional[str]] = mapped_column(_Text, comment=_ddl_comment('USER GUIDANCE: Syntax or code to operationalize the Cohort Definition.'))
+    cohort_initiation_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: A date to indicate when the Cohort was initiated in the COHORT table.'))
 
-    definition_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[definition_type_concept_id])
-    subject_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[subject_concept_id])
+    definition_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[definition_type_concept_id], lazy='raise_on_sql')
+    subject_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[subject_concept_id], lazy='raise_on_sql')
 
 
 class ConceptAncestor(Base):
@@ -253,7 +295,7 @@ class ConceptAncestor(Base):
         ForeignKeyConstraint(['descendant_concept_id'], ['concept.concept_id'], name='fpk_concept_ancestor_descendant_concept_id'),
         Index('idx_concept_ancestor_id_1', 'ancestor_concept_id'),
         Index('idx_concept_ancestor_id_2', 'descendant_concept_id'),
-        {'comment': 'DESC: The CONCEPT_ANCESTOR table is designed to simplify '
+        {'comment': _ddl_comment('DESC: The CONCEPT_ANCESTOR table is designed to simplify '
                 'observational analysis by providing the complete hierarchical '
                 'relationships between Concepts. Only direct parent-child '
                 'relationships between Concepts are stored in the '
@@ -268,16 +310,16 @@ class ConceptAncestor(Base):
                 'ancestor.\n'
                 '\n'
                 'This table is entirely derived from the CONCEPT, '
-                'CONCEPT_RELATIONSHIP and RELATIONSHIP tables.'}
+                'CONCEPT_RELATIONSHIP and RELATIONSHIP tables.')}
     )
-    __mapper_args__ = {"primary_key": ['ancestor_concept_id', 'descendant_concept_id', 'min_levels_of_separation', 'max_levels_of_separation']}
-    ancestor_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id for the higher-level concept\nthat forms the ancestor in the relationship.')
-    descendant_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id for the lower-level concept\nthat forms the descendant in the\nrelationship.')
-    min_levels_of_separation: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The minimum separation in number of\nlevels of hierarchy between ancestor and\ndescendant concepts. This is an attribute\nthat is used to simplify hierarchic analysis.')
-    max_levels_of_separation: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The maximum separation in number of\nlevels of hierarchy between ancestor and\ndescendant concepts. This is an attribute\nthat is used to simplify hierarchic analysis.')
+    __mapper_args__ = {"primary_key": ['ancestor_concept_id', 'descendant_concept_id', 'min_levels_of_separation', 'max_levels_of_separation'], "eager_defaults": False}
+    ancestor_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id for the higher-level concept\nthat forms the ancestor in the relationship.'))
+    descendant_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id for the lower-level concept\nthat forms the descendant in the\nrelationship.'))
+    min_levels_of_separation: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The minimum separation in number of\nlevels of hierarchy between ancestor and\ndescendant concepts. This is an attribute\nthat is used to simplify hierarchic analysis.'))
+    max_levels_of_separation: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The maximum separation in number of\nlevels of hierarchy between ancestor and\ndescendant concepts. This is an attribute\nthat is used to simplify hierarchic analysis.'))
 
-    ancestor_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ancestor_concept_id])
-    descendant_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[descendant_concept_id])
+    ancestor_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ancestor_concept_id], lazy='raise_on_sql')
+    descendant_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[descendant_concept_id], lazy='raise_on_sql')
 
 
 class ConceptSynonym(Base):
@@ -286,16 +328,19 @@ class ConceptSynonym(Base):
         ForeignKeyConstraint(['concept_id'], ['concept.concept_id'], name='fpk_concept_synonym_concept_id'),
         ForeignKeyConstraint(['language_concept_id'], ['concept.concept_id'], name='fpk_concept_synonym_language_concept_id'),
         Index('idx_concept_synonym_id', 'concept_id'),
-        {'comment': 'DESC: The CONCEPT_SYNONYM table is used to store alternate names '
-                'and descriptions for Concepts.'}
+        {'comment': _ddl_comment('DESC: The CONCEPT_SYNONYM table is used to store alternate names '
+                'and descriptions for Concepts.')}
     )
-    __mapper_args__ = {"primary_key": ['concept_id', 'concept_synonym_name', 'language_concept_id']}
-    concept_id: Mapped[int] = mapped_column(Integer, )
-    concept_synonym_name: Mapped[str] = mapped_column(String(1000), )
-    language_concept_id: Mapped[int] = mapped_column(Integer, )
+    # the OMOP DDL defines no primary key for this table. The composite key below
+    # (including the up-to-1000-char synonym name) only gives the ORM mapper an
+    # identity - no database index is built from it.
+    __mapper_args__ = {"primary_key": ['concept_id', 'concept_synonym_name', 'language_concept_id'], "eager_defaults": False}
+    concept_id: Mapped[int] = mapped_column(_Integer, )
+    concept_synonym_name: Mapped[str] = mapped_column(_String(1000), )
+    language_concept_id: Mapped[int] = mapped_column(_Integer, )
 
-    concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id])
-    language_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[language_concept_id])
+    concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id], lazy='raise_on_sql')
+    language_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[language_concept_id], lazy='raise_on_sql')
 
 
 class Cost(Base):
@@ -308,7 +353,8 @@ class Cost(Base):
         ForeignKeyConstraint(['revenue_code_concept_id'], ['concept.concept_id'], name='fpk_cost_revenue_code_concept_id'),
         PrimaryKeyConstraint('cost_id', name='xpk_cost'),
         Index('idx_cost_event_id', 'cost_event_id'),
-        {'comment': 'DESC: The COST table captures records containing the cost of any '
+        Index('idx_cost_event_domain', 'cost_event_id', 'cost_domain_id', postgresql_include=['total_paid', 'total_charge']),
+        {'comment': _ddl_comment('DESC: The COST table captures records containing the cost of any '
                 'medical event recorded in one of the OMOP clinical event tables '
                 'such as DRUG_EXPOSURE, PROCEDURE_OCCURRENCE, VISIT_OCCURRENCE, '
                 'VISIT_DETAIL, DEVICE_OCCURRENCE, OBSERVATION or MEASUREMENT.\n'
@@ -339,37 +385,40 @@ class Cost(Base):
                 'PAYER_PLAN_ID field. Drug costs are composed of ingredient cost '
                 '(the amount charged by the wholesale distributor or '
                 'manufacturer), the dispensing fee (the amount charged by the '
-                'pharmacy and the sales tax).'}
+                'pharmacy and the sales tax).')}
     )
 
-    cost_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    cost_event_id: Mapped[int] = mapped_column(Integer)
-    cost_domain_id: Mapped[str] = mapped_column(String(20))
-    cost_type_concept_id: Mapped[int] = mapped_column(Integer)
-    currency_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    total_charge: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    total_cost: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    total_paid: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_by_payer: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_by_patient: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_patient_copay: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_patient_coinsurance: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_patient_deductible: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_by_primary: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_ingredient_cost: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    paid_dispensing_fee: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    payer_plan_period_id: Mapped[Optional[int]] = mapped_column(Integer)
-    amount_allowed: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
-    revenue_code_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    revenue_code_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: Revenue codes are a method to charge for a class of procedures and conditions in the U.S. hospital system.')
-    drg_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    drg_source_value: Mapped[Optional[str]] = mapped_column(String(3), comment='USER GUIDANCE: Diagnosis Related Groups are US codes used to classify hospital cases into one of approximately 500 groups. ')
-
-    cost_domain: Mapped['Domain'] = relationship('Domain', back_populates='costs')
-    cost_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cost_type_concept_id])
-    currency_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[currency_concept_id])
-    drg_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drg_concept_id])
-    revenue_code_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[revenue_code_concept_id])
+    # fetch the autoincrement ids eagerly; with insertmanyvalues this folds into
+    # one batched INSERT .. RETURNING instead of a post-flush SELECT per row.
+    __mapper_args__ = {"eager_defaults": True}
+    cost_id: Mapped[int] = mapped_column(_Integer, primary_key=True)
+    cost_event_id: Mapped[int] = mapped_column(_Integer)
+    cost_domain_id: Mapped[str] = mapped_column(_String(20))
+    cost_type_concept_id: Mapped[int] = mapped_column(_Integer)
+    currency_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    total_charge: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    total_cost: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    total_paid: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_by_payer: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_by_patient: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_patient_copay: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_patient_coinsurance: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_patient_deductible: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_by_primary: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_ingredient_cost: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    paid_dispensing_fee: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    payer_plan_period_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    amount_allowed: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric)
+    revenue_code_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    revenue_code_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: Revenue codes are a method to charge for a class of procedures and conditions in the U.S. hospital system.'))
+    drg_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    drg_source_value: Mapped[Optional[str]] = mapped_column(_String(3), comment=_ddl_comment('USER GUIDANCE: Diagnosis Related Groups are US codes used to classify hospital cases into one of approximately 500 groups. '))
+
+    cost_domain: Mapped['Domain'] = relationship('Domain', back_populates='costs', lazy='raise_on_sql')
+    cost_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cost_type_concept_id], lazy='raise_on_sql')
+    currency_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[currency_concept_id], lazy='raise_on_sql')
+    drg_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drg_concept_id], lazy='raise_on_sql')
+    revenue_code_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[revenue_code_concept_id], lazy='raise_on_sql')
 
 
 class DrugStrength(Base):
@@ -382,31 +431,31 @@ class DrugStrength(Base):
         ForeignKeyConstraint(['numerator_unit_concept_id'], ['concept.concept_id'], name='fpk_drug_strength_numerator_unit_concept_id'),
         Index('idx_drug_strength_id_1', 'drug_concept_id'),
         Index('idx_drug_strength_id_2', 'ingredient_concept_id'),
-        {'comment': 'DESC: The DRUG_STRENGTH table contains structured content about '
+        {'comment': _ddl_comment('DESC: The DRUG_STRENGTH table contains structured content about '
                 'the amount or concentration and associated units of a specific '
                 'ingredient contained within a particular drug product. This table '
                 'is supplemental information to support standardized analysis of '
-                'drug utilization.'}
+                'drug utilization.')}
     )
     __mapper_args__ = {"primary_key": ['drug_concept_id', 'ingredient_concept_id']}
-    drug_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept representing the Branded Drug or Clinical Drug Product.')
-    ingredient_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept representing the active ingredient contained within the drug product. | ETLCONVENTIONS: Combination Drugs will have more than one record in this table, one for each active Ingredient.')
-    valid_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the Concept was first\nrecorded. The default value is\n1-Jan-1970.')
-    valid_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when then Concept became invalid.')
-    amount_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: The numeric value or the amount of active ingredient contained within the drug product.')
-    amount_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Concept representing the Unit of measure for the amount of active ingredient contained within the drug product. ')
-    numerator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: The concentration of the active ingredient contained within the drug product.')
-    numerator_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Concept representing the Unit of measure for the concentration of active ingredient.')
-    denominator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: The amount of total liquid (or other divisible product, such as ointment, gel, spray, etc.).')
-    denominator_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Concept representing the denominator unit for the concentration of active ingredient.')
-    box_size: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The number of units of Clinical Branded Drug or Quantified Clinical or Branded Drug contained in a box as dispensed to the patient.')
-    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1), comment='USER GUIDANCE: Reason the concept was invalidated. Possible values are D (deleted), U (replaced with an update) or NULL when valid_end_date has the default value.')
-
-    amount_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[amount_unit_concept_id])
-    denominator_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[denominator_unit_concept_id])
-    drug_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_concept_id])
-    ingredient_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ingredient_concept_id])
-    numerator_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[numerator_unit_concept_id])
+    drug_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept representing the Branded Drug or Clinical Drug Product.'))
+    ingredient_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept representing the active ingredient contained within the drug product. | ETLCONVENTIONS: Combination Drugs will have more than one record in this table, one for each active Ingredient.'))
+    valid_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the Concept was first\nrecorded. The default value is\n1-Jan-1970.'))
+    valid_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when then Concept became invalid.'))
+    amount_value: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: The numeric value or the amount of active ingredient contained within the drug product.'))
+    amount_unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept representing the Unit of measure for the amount of active ingredient contained within the drug product. '))
+    numerator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: The concentration of the active ingredient contained within the drug product.'))
+    numerator_unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept representing the Unit of measure for the concentration of active ingredient.'))
+    denominator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: The amount of total liquid (or other divisible product, such as ointment, gel, spray, etc.).'))
+    denominator_unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept representing the denominator unit for the concentration of active ingredient.'))
+    box_size: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The number of units of Clinical Branded Drug or Quantified Clinical or Branded Drug contained in a box as dispensed to the patient.'))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Reason the concept was invalidated. Possible values are D (deleted), U (replaced with an update) or NULL when valid_end_date has the default value.'))
+
+    amount_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[amount_unit_concept_id], lazy='raise_on_sql')
+    denominator_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[denominator_unit_concept_id], lazy='raise_on_sql')
+    drug_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_concept_id], lazy='raise_on_sql')
+    ingredient_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ingredient_concept_id], lazy='raise_on_sql')
+    numerator_unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[numerator_unit_concept_id], lazy='raise_on_sql')
 
 
 class FactRelationship(Base):
@@ -415,10 +464,8 @@ class FactRelationship(Base):
         ForeignKeyConstraint(['domain_concept_id_1'], ['concept.concept_id'], name='fpk_fact_relationship_domain_concept_id_1'),
         ForeignKeyConstraint(['domain_concept_id_2'], ['concept.concept_id'], name='fpk_fact_relationship_domain_concept_id_2'),
         ForeignKeyConstraint(['relationship_concept_id'], ['concept.concept_id'], name='fpk_fact_relationship_relationship_concept_id'),
-        Index('idx_fact_relationship_id1', 'domain_concept_id_1'),
-        Index('idx_fact_relationship_id2', 'domain_concept_id_2'),
-        Index('idx_fact_relationship_id3', 'relationship_concept_id'),
-        {'comment': 'DESC: The FACT_RELATIONSHIP table contains records about the '
+        Index('idx_fact_relationship_composite', 'domain_concept_id_1', 'fact_id_1', 'domain_concept_id_2', 'fact_id_2', 'relationship_concept_id'),
+        {'comment': _ddl_comment('DESC: The FACT_RELATIONSHIP table contains records about the '
                 'relationships between facts stored as records in any table of the '
                 'CDM. Relationships can be defined between facts from the same '
                 'domain, or different domains. Examples of Fact Relationships '
@@ -437,18 +484,18 @@ class FactRelationship(Base):
                 'FACT_RELATIONSHIP table (all strings in fact concept_id records '
                 'in the Concept table:\n'
                 '- Person, 1, Person, 2, parent of\n'
-                '- Person, 2, Person, 1, child of'}
+                '- Person, 2, Person, 1, child of')}
     )
     __mapper_args__ = {"primary_key": ['domain_concept_id_1', 'fact_id_1', 'domain_concept_id_2', 'fact_id_2', 'relationship_concept_id']}
-    domain_concept_id_1: Mapped[int] = mapped_column(Integer, )
-    fact_id_1: Mapped[int] = mapped_column(Integer, )
-    domain_concept_id_2: Mapped[int] = mapped_column(Integer, )
-    fact_id_2: Mapped[int] = mapped_column(Integer, )
-    relationship_concept_id: Mapped[int] = mapped_column(Integer, )
+    domain_concept_id_1: Mapped[int] = mapped_column(_Integer, )
+    fact_id_1: Mapped[int] = mapped_column(_Integer, )
+    domain_concept_id_2: Mapped[int] = mapped_column(_Integer, )
+    fact_id_2: Mapped[int] = mapped_column(_Integer, )
+    relationship_concept_id: Mapped[int] = mapped_column(_Integer, )
 
-    domain_concept_1: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id_1])
-    domain_concept_2: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id_2])
-    relationship_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[relationship_concept_id])
+    domain_concept_1: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id_1], lazy='raise_on_sql')
+    domain_concept_2: Mapped['Concept'] = relationship('Concept', foreign_keys=[domain_concept_id_2], lazy='raise_on_sql')
+    relationship_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[relationship_concept_id], lazy='raise_on_sql')
 
 
 class Location(Base):
@@ -456,8 +503,7 @@ class Location(Base):
     __table_args__ = (
         ForeignKeyConstraint(['country_concept_id'], ['concept.concept_id'], name='fpk_location_country_concept_id'),
         PrimaryKeyConstraint('location_id', name='xpk_location'),
-        Index('idx_location_id_1', 'location_id'),
-        {'comment': 'DESC: The LOCATION table represents a generic way to capture '
+        {'comment': _ddl_comment('DESC: The LOCATION table represents a generic way to capture '
                 'physical location or address information of Persons and Care '
                 'Sites. | USER GUIDANCE: The current iteration of the LOCATION '
                 'table is US centric. Until a major release to correct this, '
@@ -469,25 +515,25 @@ class Location(Base):
                 'the table. Locations do not contain names, such as the name of a '
                 'hospital. In order to construct a full address that can be used '
                 'in the postal service, the address information from the Location '
-                'needs to be combined with information from the Care Site.'}
+                'needs to be combined with information from the Care Site.')}
     )
 
-    location_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to a unique Location. | ETLCONVENTIONS: Each instance of a Location in the source data should be assigned this unique key.')
-    address_1: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the first line of the address.')
-    address_2: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the second line of the address')
-    city: Mapped[Optional[str]] = mapped_column(String(50))
-    state: Mapped[Optional[str]] = mapped_column(String(2))
-    zip: Mapped[Optional[str]] = mapped_column(String(9), comment=' | ETLCONVENTIONS: Zip codes are handled as strings of up to 9 characters length. For US addresses, these represent either a 3-digit abbreviated Zip code as provided by many sources for patient protection reasons, the full 5-digit Zip or the 9-digit (ZIP + 4) codes. Unless for specific reasons analytical methods should expect and utilize only the first 3 digits. For international addresses, different rules apply.')
-    county: Mapped[Optional[str]] = mapped_column(String(20))
-    location_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: Put the verbatim value for the location here, as it shows up in the source. ')
-    country_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the country. Values should conform to the [Geography](https://athena.ohdsi.org/search-terms/terms?domain=Geography&standardConcept=Standard&page=1&pageSize=15&query=&boosts) domain. ')
-    country_source_value: Mapped[Optional[str]] = mapped_column(String(80), comment='USER GUIDANCE: The name of the country.')
-    latitude: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment=' | ETLCONVENTIONS: Must be between -90 and 90.')
-    longitude: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment=' | ETLCONVENTIONS: Must be between -180 and 180.')
+    location_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to a unique Location. | ETLCONVENTIONS: Each instance of a Location in the source data should be assigned this unique key.'))
+    address_1: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This is the first line of the address.'))
+    address_2: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This is the second line of the address'))
+    city: Mapped[Optional[str]] = mapped_column(_String(50))
+    state: Mapped[Optional[str]] = mapped_column(_String(2))
+    zip: Mapped[Optional[str]] = mapped_column(_String(9), comment=_ddl_comment(' | ETLCONVENTIONS: Zip codes are handled as strings of up to 9 characters length. For US addresses, these represent either a 3-digit abbreviated Zip code as provided by many sources for patient protection reasons, the full 5-digit Zip or the 9-digit (ZIP + 4) codes. Unless for specific reasons analytical methods should expect and utilize only the first 3 digits. For international addresses, different rules apply.'))
+    county: Mapped[Optional[str]] = mapped_column(_String(20))
+    location_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: Put the verbatim value for the location here, as it shows up in the source. '))
+    country_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id representing the country. Values should conform to the [Geography](https://athena.ohdsi.org/search-terms/terms?domain=Geography&standardConcept=Standard&page=1&pageSize=15&query=&boosts) domain. '))
+    country_source_value: Mapped[Optional[str]] = mapped_column(_String(80), comment=_ddl_comment('USER GUIDANCE: The name of the country.'))
+    latitude: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment(' | ETLCONVENTIONS: Must be between -90 and 90.'))
+    longitude: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment(' | ETLCONVENTIONS: Must be between -180 and 180.'))
 
-    country_concept: Mapped['Concept'] = relationship('Concept')
-    care_sites: Mapped[List['CareSite']] = relationship('CareSite', back_populates='location')
-    persons: Mapped[List['Person']] = relationship('Person', back_populates='location')
+    country_concept: Mapped['Concept'] = relationship('Concept', lazy='raise_on_sql')
+    care_sites: WriteOnlyMapped['CareSite'] = relationship('CareSite', back_populates='location', lazy='write_only')
+    persons: WriteOnlyMapped['Person'] = relationship('Person', back_populates='location', lazy='write_only')
 
 
 class Metadata(Base):
@@ -498,23 +544,23 @@ class Metadata(Base):
         ForeignKeyConstraint(['value_as_concept_id'], ['concept.concept_id'], name='fpk_metadata_value_as_concept_id'),
         PrimaryKeyConstraint('metadata_id', name='xpk_metadata'),
         Index('idx_metadata_concept_id_1', 'metadata_concept_id'),
-        {'comment': 'DESC: The METADATA table contains metadata information about a '
-                'dataset that has been transformed to the OMOP Common Data Model.'}
+        {'comment': _ddl_comment('DESC: The METADATA table contains metadata information about a '
+                'dataset that has been transformed to the OMOP Common Data Model.')}
     )
 
-    metadata_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to a Metadata record. | ETLCONVENTIONS: Attribute value is auto-generated')
-    metadata_concept_id: Mapped[int] = mapped_column(Integer)
-    metadata_type_concept_id: Mapped[int] = mapped_column(Integer)
-    name: Mapped[str] = mapped_column(String(250))
-    value_as_string: Mapped[Optional[str]] = mapped_column(String(250))
-    value_as_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: This is the numerical value of the result of the Metadata, if applicable and available. It is not expected that all Metadata will have numeric results, rather, this field is here to house values should they exist. ')
-    metadata_date: Mapped[Optional[datetime.date]] = mapped_column(Date)
-    metadata_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
-
-    metadata_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[metadata_concept_id])
-    metadata_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[metadata_type_concept_id])
-    value_as_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[value_as_concept_id])
+    metadata_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to a Metadata record. | ETLCONVENTIONS: Attribute value is auto-generated'))
+    metadata_concept_id: Mapped[int] = mapped_column(_Integer)
+    metadata_type_concept_id: Mapped[int] = mapped_column(_Integer)
+    name: Mapped[str] = mapped_column(_String(250))
+    value_as_string: Mapped[Optional[str]] = mapped_column(_String(250))
+    value_as_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: This is the numerical value of the result of the Metadata, if applicable and available. It is not expected that all Metadata will have numeric results, rather, this field is here to house values should they exist. '))
+    metadata_date: Mapped[Optional[datetime.date]] = mapped_column(_Date)
+    metadata_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime)
+
+    metadata_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[metadata_concept_id], lazy='raise_on_sql')
+    metadata_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[metadata_type_concept_id], lazy='raise_on_sql')
+    value_as_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[value_as_concept_id], lazy='raise_on_sql')
 
 
 class NoteNlp(Base):
@@ -526,28 +572,31 @@ class NoteNlp(Base):
         PrimaryKeyConstraint('note_nlp_id', name='xpk_note_nlp'),
         Index('idx_note_nlp_concept_id_1', 'note_nlp_concept_id'),
         Index('idx_note_nlp_note_id_1', 'note_id'),
-        {'comment': 'DESC: The NOTE_NLP table encodes all output of NLP on clinical '
-                'notes. Each row represents a single extracted term from a note.'}
+        {'comment': _ddl_comment('DESC: The NOTE_NLP table encodes all output of NLP on clinical '
+                'notes. Each row represents a single extracted term from a note.')}
     )
 
-    note_nlp_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A unique identifier for the NLP record.')
-    note_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This is the NOTE_ID for the NOTE record the NLP record is associated to.')
-    lexical_variant: Mapped[str] = mapped_column(String(250), comment='USER GUIDANCE: Raw text extracted from the NLP tool.')
-    nlp_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date of the note processing.')
-    section_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: The SECTION_CONCEPT_ID should be used to represent the note section contained in the NOTE_NLP record. These concepts can be found as parts of document panels and are based on the type of note written, i.e. a discharge summary. These panels can be found as concepts with the relationship "Subsumes" to CONCEPT_ID [45875957](https://athena.ohdsi.org/search-terms/terms/45875957).')
-    snippet: Mapped[Optional[str]] = mapped_column(String(250), comment='USER GUIDANCE: A small window of text surrounding the term')
-    offset: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: Character offset of the extracted term in the input note')
-    note_nlp_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    note_nlp_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    nlp_system: Mapped[Optional[str]] = mapped_column(String(250), comment=' | ETLCONVENTIONS: Name and version of the NLP system that extracted the term. Useful for data provenance.')
-    nlp_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: The date and time of the note processing.')
-    term_exists: Mapped[Optional[str]] = mapped_column(String(1), comment=' | ETLCONVENTIONS: Term_exists is defined as a flag that indicates if the patient actually has or had the condition. Any of the following modifiers would make Term_exists false:\nNegation = true\nSubject = [anything other than the patient]\nConditional = true/li>\nRule_out = true\nUncertain = very low certainty or any lower certainties\nA complete lack of modifiers would make Term_exists true.\n')
-    term_temporal: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: Term_temporal is to indicate if a condition is present or just in the past. The following would be past:<br><br>\n- History = true\n- Concept_date = anything before the time of the report')
-    term_modifiers: Mapped[Optional[str]] = mapped_column(String(2000), comment=' | ETLCONVENTIONS: For the modifiers that are there, they would have to have these values:<br><br>\n- Negation = false\n- Subject = patient\n- Conditional = false\n- Rule_out = false\n- Uncertain = true or high or moderate or even low (could argue about low). Term_modifiers will concatenate all modifiers for different types of entities (conditions, drugs, labs etc) into one string. Lab values will be saved as one of the modifiers. ')
-
-    note_nlp_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[note_nlp_concept_id])
-    note_nlp_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[note_nlp_source_concept_id])
-    section_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[section_concept_id])
+    # fetch the autoincrement ids eagerly; with insertmanyvalues this folds into
+    # one batched INSERT .. RETURNING instead of a post-flush SELECT per row.
+    __mapper_args__ = {"eager_defaults": True}
+    note_nlp_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for the NLP record.'))
+    note_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the NOTE_ID for the NOTE record the NLP record is associated to.'))
+    lexical_variant: Mapped[str] = mapped_column(_String(250), comment=_ddl_comment('USER GUIDANCE: Raw text extracted from the NLP tool.'))
+    nlp_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date of the note processing.'))
+    section_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: The SECTION_CONCEPT_ID should be used to represent the note section contained in the NOTE_NLP record. These concepts can be found as parts of document panels and are based on the type of note written, i.e. a discharge summary. These panels can be found as concepts with the relationship "Subsumes" to CONCEPT_ID [45875957](https://athena.ohdsi.org/search-terms/terms/45875957).'))
+    snippet: Mapped[Optional[str]] = mapped_column(_String(250), comment=_ddl_comment('USER GUIDANCE: A small window of text surrounding the term'))
+    offset: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: Character offset of the extracted term in the input note'))
+    note_nlp_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    note_nlp_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    nlp_system: Mapped[Optional[str]] = mapped_column(_String(250), comment=_ddl_comment(' | ETLCONVENTIONS: Name and version of the NLP system that extracted the term. Useful for data provenance.'))
+    nlp_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment('USER GUIDANCE: The date and time of the note processing.'))
+    term_exists: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment(' | ETLCONVENTIONS: Term_exists is defined as a flag that indicates if the patient actually has or had the condition. Any of the following modifiers would make Term_exists false:\nNegation = true\nSubject = [anything other than the patient]\nConditional = true/li>\nRule_out = true\nUncertain = very low certainty or any lower certainties\nA complete lack of modifiers would make Term_exists true.\n'))
+    term_temporal: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: Term_temporal is to indicate if a condition is present or just in the past. The following would be past:<br><br>\n- History = true\n- Concept_date = anything before the time of the report'))
+    term_modifiers: Mapped[Optional[str]] = mapped_column(_String(2000), comment=_ddl_comment(' | ETLCONVENTIONS: For the modifiers that are there, they would have to have these values:<br><br>\n- Negation = false\n- Subject = patient\n- Conditional = false\n- Rule_out = false\n- Uncertain = true or high or moderate or even low (could argue about low). Term_modifiers will concatenate all modifiers for different types of entities (conditions, drugs, labs etc) into one string. Lab values will be saved as one of the modifiers. '))
+
+    note_nlp_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[note_nlp_concept_id], lazy='raise_on_sql')
+    note_nlp_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[note_nlp_source_concept_id], lazy='raise_on_sql')
+    section_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[section_concept_id], lazy='raise_on_sql')
 
 
 class Relationship(Base):
@@ -556,20 +605,20 @@ class Relationship(Base):
         ForeignKeyConstraint(['relationship_concept_id'], ['concept.concept_id'], name='fpk_relationship_relationship_concept_id'),
         PrimaryKeyConstraint('relationship_id', name='xpk_relationship'),
         Index('idx_relationship_rel_id', 'relationship_id'),
-        {'comment': 'DESC: The RELATIONSHIP table provides a reference list of all '
+        {'comment': _ddl_comment('DESC: The RELATIONSHIP table provides a reference list of all '
                 'types of relationships that can be used to associate any two '
-                'concepts in the CONCEPT_RELATIONSHP table.'}
+                'concepts in the CONCEPT_RELATIONSHP table.')}
     )
 
-    relationship_id: Mapped[str] = mapped_column(String(20), primary_key=True, comment='USER GUIDANCE: The type of relationship captured by the\nrelationship record.')
-    relationship_name: Mapped[str] = mapped_column(String(255))
-    is_hierarchical: Mapped[str] = mapped_column(String(1), comment='USER GUIDANCE: Defines whether a relationship defines\nconcepts into classes or hierarchies. Values\nare 1 for hierarchical relationship or 0 if not.')
-    defines_ancestry: Mapped[str] = mapped_column(String(1), comment='USER GUIDANCE: Defines whether a hierarchical relationship\ncontributes to the concept_ancestor table.\nThese are subsets of the hierarchical\nrelationships. Valid values are 1 or 0.')
-    reverse_relationship_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: The identifier for the relationship used to\ndefine the reverse relationship between two\nconcepts.')
-    relationship_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A foreign key that refers to an identifier in\nthe [CONCEPT](https://ohdsi.github.io/CommonDataModel/cdm531.html#concept) table for the unique\nrelationship concept.')
+    relationship_id: Mapped[str] = mapped_column(_String(20), primary_key=True, comment=_ddl_comment('USER GUIDANCE: The type of relationship captured by the\nrelationship record.'))
+    relationship_name: Mapped[str] = mapped_column(_String(255))
+    is_hierarchical: Mapped[str] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Defines whether a relationship defines\nconcepts into classes or hierarchies. Values\nare 1 for hierarchical relationship or 0 if not.'))
+    defines_ancestry: Mapped[str] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Defines whether a hierarchical relationship\ncontributes to the concept_ancestor table.\nThese are subsets of the hierarchical\nrelationships. Valid values are 1 or 0.'))
+    reverse_relationship_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The identifier for the relationship used to\ndefine the reverse relationship between two\nconcepts.'))
+    relationship_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A foreign key that refers to an identifier in\nthe [CONCEPT](https://ohdsi.github.io/CommonDataModel/cdm531.html#concept) table for the unique\nrelationship concept.'))
 
     relationship_concept: Mapped['Concept'] = relationship('Concept')
-    concept_relationships: Mapped[List['ConceptRelationship']] = relationship('ConceptRelationship', back_populates='relationship_')
+    concept_relationships: WriteOnlyMapped['ConceptRelationship'] = relationship('ConceptRelationship', back_populates='relationship_', lazy='write_only')
 
 
 class SourceToConceptMap(Base):
@@ -582,7 +631,7 @@ class SourceToConceptMap(Base):
         Index('idx_source_to_concept_map_2', 'target_vocabulary_id'),
         Index('idx_source_to_concept_map_3', 'target_concept_id'),
         Index('idx_source_to_concept_map_c', 'source_code'),
-        {'comment': 'DESC: The source to concept map table is a legacy data structure '
+        {'comment': _ddl_comment('DESC: The source to concept map table is a legacy data structure '
                 'within the OMOP Common Data Model, recommended for use in ETL '
                 'processes to maintain local source codes which are not available '
                 'as Concepts in the Standardized Vocabularies, and to establish '
@@ -590,22 +639,22 @@ class SourceToConceptMap(Base):
                 'target_concept_ids that can be used to populate the Common Data '
                 'Model tables. The SOURCE_TO_CONCEPT_MAP table is no longer '
                 'populated with content within the Standardized Vocabularies '
-                'published to the OMOP community.'}
+                'published to the OMOP community.')}
     )
     __mapper_args__ = {"primary_key": ['source_code', 'source_concept_id', 'source_vocabulary_id', 'target_concept_id', 'target_vocabulary_id', 'valid_start_date', 'valid_end_date']}
-    source_code: Mapped[str] = mapped_column(String(50), comment='USER GUIDANCE: The source code being translated\ninto a Standard Concept.')
-    source_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A foreign key to the Source\nConcept that is being translated\ninto a Standard Concept. | ETLCONVENTIONS: This is either 0 or should be a number above 2 billion, which are the Concepts reserved for site-specific codes and mappings. ')
-    source_vocabulary_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: A foreign key to the\nVOCABULARY table defining the\nvocabulary of the source code that\nis being translated to a Standard\nConcept.')
-    target_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The target Concept\nto which the source code is being\nmapped.')
-    target_vocabulary_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: The Vocabulary of the target Concept.')
-    valid_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the mapping\ninstance was first recorded.')
-    valid_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the mapping\ninstance became invalid because it\nwas deleted or superseded\n(updated) by a new relationship.\nDefault value is 31-Dec-2099.')
-    source_code_description: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: An optional description for the\nsource code. This is included as a\nconvenience to compare the\ndescription of the source code to\nthe name of the concept.')
-    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1), comment='USER GUIDANCE: Reason the mapping instance was invalidated. Possible values are D (deleted), U (replaced with an update) or NULL when valid_end_date has the default value.')
+    source_code: Mapped[str] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: The source code being translated\ninto a Standard Concept.'))
+    source_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A foreign key to the Source\nConcept that is being translated\ninto a Standard Concept. | ETLCONVENTIONS: This is either 0 or should be a number above 2 billion, which are the Concepts reserved for site-specific codes and mappings. '))
+    source_vocabulary_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: A foreign key to the\nVOCABULARY table defining the\nvocabulary of the source code that\nis being translated to a Standard\nConcept.'))
+    target_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The target Concept\nto which the source code is being\nmapped.'))
+    target_vocabulary_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The Vocabulary of the target Concept.'))
+    valid_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the mapping\ninstance was first recorded.'))
+    valid_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the mapping\ninstance became invalid because it\nwas deleted or superseded\n(updated) by a new relationship.\nDefault value is 31-Dec-2099.'))
+    source_code_description: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: An optional description for the\nsource code. This is included as a\nconvenience to compare the\ndescription of the source code to\nthe name of the concept.'))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Reason the mapping instance was invalidated. Possible values are D (deleted), U (replaced with an update) or NULL when valid_end_date has the default value.'))
 
-    source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[source_concept_id])
-    target_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[target_concept_id])
-    target_vocabulary: Mapped['Vocabulary'] = relationship('Vocabulary', back_populates='source_to_concept_maps')
+    source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[source_concept_id], lazy='raise_on_sql')
+    target_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[target_concept_id], lazy='raise_on_sql')
+    target_vocabulary: Mapped['Vocabulary'] = relationship('Vocabulary', back_populates='source_to_concept_maps', lazy='raise_on_sql')
 
 
 class CareSite(Base):
@@ -614,8 +663,7 @@ class CareSite(Base):
         ForeignKeyConstraint(['location_id'], ['location.location_id'], name='fpk_care_site_location_id'),
         ForeignKeyConstraint(['place_of_service_concept_id'], ['concept.concept_id'], name='fpk_care_site_place_of_service_concept_id'),
         PrimaryKeyConstraint('care_site_id', name='xpk_care_site'),
-        Index('idx_care_site_id_1', 'care_site_id'),
-        {'comment': 'DESC: The CARE_SITE table contains a list of uniquely identified '
+        {'comment': _ddl_comment('DESC: The CARE_SITE table contains a list of uniquely identified '
                 'institutional (physical or organizational) units where healthcare '
                 'delivery is practiced (offices, wards, hospitals, clinics, etc.). '
                 '| ETL CONVENTIONS: Care site is a unique combination of '
@@ -631,22 +679,22 @@ class CareSite(Base):
                 'example, wards can belong to clinics or departments, which can in '
                 'turn belong to hospitals, which in turn can belong to hospital '
                 'systems, which in turn can belong to HMOs.The relationships '
-                'between Care Sites are defined in the FACT_RELATIONSHIP table.'}
+                'between Care Sites are defined in the FACT_RELATIONSHIP table.')}
     )
 
-    care_site_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment=' | ETLCONVENTIONS: Assign an ID to each combination of a location and nature of the site - the latter could be the Place of Service, name or another characteristic in your source data.')
-    care_site_name: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: The name of the care_site as it appears in the source data')
-    place_of_service_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is a high-level way of characterizing a Care Site. Typically, however, Care Sites can provide care in multiple settings (inpatient, outpatient, etc.) and this granularity should be reflected in the visit. | ETLCONVENTIONS: Choose the concept in the visit domain that best represents the setting in which healthcare is provided in the Care Site. If most visits in a Care Site are Inpatient, then the place_of_service_concept_id should represent Inpatient. If information is present about a unique Care Site (e.g. Pharmacy) then a Care Site record should be created. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=2&pageSize=15&query=).')
-    location_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The location_id from the LOCATION table representing the physical location of the care_site.')
-    care_site_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: The identifier of the care_site as it appears in the source data. This could be an identifier separate from the name of the care_site.')
-    place_of_service_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: Put the place of service of the care_site as it appears in the source data.')
+    care_site_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment(' | ETLCONVENTIONS: Assign an ID to each combination of a location and nature of the site - the latter could be the Place of Service, name or another characteristic in your source data.'))
+    care_site_name: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: The name of the care_site as it appears in the source data'))
+    place_of_service_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is a high-level way of characterizing a Care Site. Typically, however, Care Sites can provide care in multiple settings (inpatient, outpatient, etc.) and this granularity should be reflected in the visit. | ETLCONVENTIONS: Choose the concept in the visit domain that best represents the setting in which healthcare is provided in the Care Site. If most visits in a Care Site are Inpatient, then the place_of_service_concept_id should represent Inpatient. If information is present about a unique Care Site (e.g. Pharmacy) then a Care Site record should be created. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=2&pageSize=15&query=).'))
+    location_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The location_id from the LOCATION table representing the physical location of the care_site.'))
+    care_site_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: The identifier of the care_site as it appears in the source data. This could be an identifier separate from the name of the care_site.'))
+    place_of_service_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: Put the place of service of the care_site as it appears in the source data.'))
 
-    location: Mapped['Location'] = relationship('Location', back_populates='care_sites')
-    place_of_service_concept: Mapped['Concept'] = relationship('Concept')
-    providers: Mapped[List['Provider']] = relationship('Provider', back_populates='care_site')
-    persons: Mapped[List['Person']] = relationship('Person', back_populates='care_site')
-    visit_occurrences: Mapped[List['VisitOccurrence']] = relationship('VisitOccurrence', back_populates='care_site')
-    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='care_site')
+    location: Mapped['Location'] = relationship('Location', back_populates='care_sites', lazy='raise_on_sql')
+    place_of_service_concept: Mapped['Concept'] = relationship('Concept', lazy='raise_on_sql')
+    providers: WriteOnlyMapped['Provider'] = relationship('Provider', back_populates='care_site', lazy='write_only')
+    persons: WriteOnlyMapped['Person'] = relationship('Person', back_populates='care_site', lazy='write_only')
+    visit_occurrences: WriteOnlyMapped['VisitOccurrence'] = relationship('VisitOccurrence', back_populates='care_site', lazy='write_only')
+    visit_details: WriteOnlyMapped['VisitDetail'] = relationship('VisitDetail', back_populates='care_site', lazy='write_only')
 
 
 class ConceptRelationship(Base):
@@ -658,22 +706,23 @@ class ConceptRelationship(Base):
         Index('idx_concept_relationship_id_1', 'concept_id_1'),
         Index('idx_concept_relationship_id_2', 'concept_id_2'),
         Index('idx_concept_relationship_id_3', 'relationship_id'),
-        {'comment': 'DESC: The CONCEPT_RELATIONSHIP table contains records that define '
+        Index('idx_concept_relationship_pair', 'concept_id_1', 'relationship_id', 'concept_id_2'),
+        {'comment': _ddl_comment('DESC: The CONCEPT_RELATIONSHIP table contains records that define '
                 'direct relationships between any two Concepts and the nature or '
                 'type of the relationship. Each type of a relationship is defined '
-                'in the RELATIONSHIP table.'}
+                'in the RELATIONSHIP table.')}
     )
     __mapper_args__ = {"primary_key": ['concept_id_1', 'concept_id_2', 'relationship_id', 'valid_start_date', 'valid_end_date']}
-    concept_id_1: Mapped[int] = mapped_column(Integer, )
-    concept_id_2: Mapped[int] = mapped_column(Integer, )
-    relationship_id: Mapped[str] = mapped_column(String(20), comment='USER GUIDANCE: The relationship between CONCEPT_ID_1 and CONCEPT_ID_2. Please see the [Vocabulary Conventions](https://ohdsi.github.io/CommonDataModel/dataModelConventions.html#concept_relationships). for more information. ')
-    valid_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the relationship is first recorded.')
-    valid_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the relationship is invalidated.')
-    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1), comment='USER GUIDANCE: Reason the relationship was invalidated. Possible values are "D" (deleted), "U" (updated) or NULL. ')
+    concept_id_1: Mapped[int] = mapped_column(_Integer, )
+    concept_id_2: Mapped[int] = mapped_column(_Integer, )
+    relationship_id: Mapped[str] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The relationship between CONCEPT_ID_1 and CONCEPT_ID_2. Please see the [Vocabulary Conventions](https://ohdsi.github.io/CommonDataModel/dataModelConventions.html#concept_relationships). for more information. '))
+    valid_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the relationship is first recorded.'))
+    valid_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the relationship is invalidated.'))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(_String(1), comment=_ddl_comment('USER GUIDANCE: Reason the relationship was invalidated. Possible values are "D" (deleted), "U" (updated) or NULL. '))
 
-    concept_1: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id_1])
-    concept_2: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id_2])
-    relationship_: Mapped['Relationship'] = relationship('Relationship', back_populates='concept_relationships')
+    concept_1: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id_1], lazy='raise_on_sql')
+    concept_2: Mapped['Concept'] = relationship('Concept', foreign_keys=[concept_id_2], lazy='raise_on_sql')
+    relationship_: Mapped['Relationship'] = relationship('Relationship', back_populates='concept_relationships', lazy='raise_on_sql')
 
 
 class Provider(Base):
@@ -685,8 +734,8 @@ class Provider(Base):
         ForeignKeyConstraint(['specialty_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_concept_id'),
         ForeignKeyConstraint(['specialty_source_concept_id'], ['concept.concept_id'], name='fpk_provider_specialty_source_concept_id'),
         PrimaryKeyConstraint('provider_id', name='xpk_provider'),
-        Index('idx_provider_id_1', 'provider_id'),
-        {'comment': 'DESC: The PROVIDER table contains a list of uniquely identified '
+        Index('idx_provider_specialty', 'specialty_concept_id'),
+        {'comment': _ddl_comment('DESC: The PROVIDER table contains a list of uniquely identified '
                 'healthcare providers. These are individuals providing hands-on '
                 'healthcare to patients, such as physicians, nurses, midwives, '
                 'physical therapists etc. | USER GUIDANCE: Many sources do not '
@@ -695,38 +744,38 @@ class Provider(Base):
                 'If the source, instead of uniquely identifying individual '
                 'providers, only provides limited information such as specialty, '
                 'generic or "pooled" Provider records are listed in the PROVIDER '
-                'table.'}
+                'table.')}
     )
 
-    provider_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: It is assumed that every provider with a different unique identifier is in fact a different person and should be treated independently. | ETLCONVENTIONS: This identifier can be the original id from the source data provided it is an integer, otherwise it can be an autogenerated number.')
-    provider_name: Mapped[Optional[str]] = mapped_column(String(255), comment=' | ETLCONVENTIONS: This field is not necessary as it is not necessary to have the actual identity of the Provider. Rather, the idea is to uniquely and anonymously identify providers of care across the database.')
-    npi: Mapped[Optional[str]] = mapped_column(String(20), comment='USER GUIDANCE: This is the National Provider Number issued to health care providers in the US by the Centers for Medicare and Medicaid Services (CMS).')
-    dea: Mapped[Optional[str]] = mapped_column(String(20), comment='USER GUIDANCE: This is the identifier issued by the DEA, a US federal agency, that allows a provider to write prescriptions for controlled substances.')
-    specialty_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field either represents the most common specialty that occurs in the data or the most specific concept that represents all specialties listed, should the provider have more than one. This includes physician specialties such as internal medicine, emergency medicine, etc. and allied health professionals such as nurses, midwives, and pharmacists. | ETLCONVENTIONS: If a Provider has more than one Specialty, there are two options: 1. Choose a concept_id which is a common ancestor to the multiple specialties, or, 2. Choose the specialty that occurs most often for the provider. Concepts in this field should be Standard with a domain of Provider. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Provider&standardConcept=Standard&page=1&pageSize=15&query=).')
-    care_site_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the CARE_SITE_ID for the location that the provider primarily practices in. | ETLCONVENTIONS: If a Provider has more than one Care Site, the main or most often exerted CARE_SITE_ID should be recorded.')
-    year_of_birth: Mapped[Optional[int]] = mapped_column(Integer)
-    gender_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field represents the recorded gender of the provider in the source data. | ETLCONVENTIONS: If given, put a concept from the gender domain representing the recorded gender of the provider. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Gender&standardConcept=Standard&page=1&pageSize=15&query=).')
-    provider_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: Use this field to link back to providers in the source data. This is typically used for error checking of ETL logic. | ETLCONVENTIONS: Some use cases require the ability to link back to providers in the source data. This field allows for the storing of the provider identifier as it appears in the source.')
-    specialty_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the kind of provider or specialty as it appears in the source data. This includes physician specialties such as internal medicine, emergency medicine, etc. and allied health professionals such as nurses, midwives, and pharmacists. | ETLCONVENTIONS: Put the kind of provider as it appears in the source data. This field is up to the discretion of the ETL-er as to whether this should be the coded value from the source or the text description of the lookup value.')
-    specialty_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is often zero as many sites use proprietary codes to store physician speciality. | ETLCONVENTIONS: If the source data codes provider specialty in an OMOP supported vocabulary store the concept_id here.')
-    gender_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is provider"s gender as it appears in the source data. | ETLCONVENTIONS: Put the provider"s gender as it appears in the source data. This field is up to the discretion of the ETL-er as to whether this should be the coded value from the source or the text description of the lookup value.')
-    gender_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is often zero as many sites use proprietary codes to store provider gender. | ETLCONVENTIONS: If the source data codes provider gender in an OMOP supported vocabulary store the concept_id here.')
-
-    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='providers')
-    gender_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_concept_id])
-    gender_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_source_concept_id])
-    specialty_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specialty_concept_id])
-    specialty_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specialty_source_concept_id])
-    persons: Mapped[List['Person']] = relationship('Person', back_populates='provider')
-    visit_occurrences: Mapped[List['VisitOccurrence']] = relationship('VisitOccurrence', back_populates='provider')
-    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='provider')
-    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='provider')
-    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='provider')
-    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='provider')
-    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='provider')
-    notes: Mapped[List['Note']] = relationship('Note', back_populates='provider')
-    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='provider')
-    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='provider')
+    provider_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: It is assumed that every provider with a different unique identifier is in fact a different person and should be treated independently. | ETLCONVENTIONS: This identifier can be the original id from the source data provided it is an integer, otherwise it can be an autogenerated number.'))
+    provider_name: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment(' | ETLCONVENTIONS: This field is not necessary as it is not necessary to have the actual identity of the Provider. Rather, the idea is to uniquely and anonymously identify providers of care across the database.'))
+    npi: Mapped[Optional[str]] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: This is the National Provider Number issued to health care providers in the US by the Centers for Medicare and Medicaid Services (CMS).'))
+    dea: Mapped[Optional[str]] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: This is the identifier issued by the DEA, a US federal agency, that allows a provider to write prescriptions for controlled substances.'))
+    specialty_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field either represents the most common specialty that occurs in the data or the most specific concept that represents all specialties listed, should the provider have more than one. This includes physician specialties such as internal medicine, emergency medicine, etc. and allied health professionals such as nurses, midwives, and pharmacists. | ETLCONVENTIONS: If a Provider has more than one Specialty, there are two options: 1. Choose a concept_id which is a common ancestor to the multiple specialties, or, 2. Choose the specialty that occurs most often for the provider. Concepts in this field should be Standard with a domain of Provider. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Provider&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    care_site_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the CARE_SITE_ID for the location that the provider primarily practices in. | ETLCONVENTIONS: If a Provider has more than one Care Site, the main or most often exerted CARE_SITE_ID should be recorded.'))
+    year_of_birth: Mapped[Optional[int]] = mapped_column(_Integer)
+    gender_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field represents the recorded gender of the provider in the source data. | ETLCONVENTIONS: If given, put a concept from the gender domain representing the recorded gender of the provider. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Gender&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    provider_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: Use this field to link back to providers in the source data. This is typically used for error checking of ETL logic. | ETLCONVENTIONS: Some use cases require the ability to link back to providers in the source data. This field allows for the storing of the provider identifier as it appears in the source.'))
+    specialty_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This is the kind of provider or specialty as it appears in the source data. This includes physician specialties such as internal medicine, emergency medicine, etc. and allied health professionals such as nurses, midwives, and pharmacists. | ETLCONVENTIONS: Put the kind of provider as it appears in the source data. This field is up to the discretion of the ETL-er as to whether this should be the coded value from the source or the text description of the lookup value.'))
+    specialty_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is often zero as many sites use proprietary codes to store physician speciality. | ETLCONVENTIONS: If the source data codes provider specialty in an OMOP supported vocabulary store the concept_id here.'))
+    gender_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This is provider"s gender as it appears in the source data. | ETLCONVENTIONS: Put the provider"s gender as it appears in the source data. This field is up to the discretion of the ETL-er as to whether this should be the coded value from the source or the text description of the lookup value.'))
+    gender_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is often zero as many sites use proprietary codes to store provider gender. | ETLCONVENTIONS: If the source data codes provider gender in an OMOP supported vocabulary store the concept_id here.'))
+
+    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='providers', lazy='raise_on_sql')
+    gender_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_concept_id], lazy='raise_on_sql')
+    gender_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_source_concept_id], lazy='raise_on_sql')
+    specialty_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specialty_concept_id], lazy='raise_on_sql')
+    specialty_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specialty_source_concept_id], lazy='raise_on_sql')
+    persons: Mapped[List['Person']] = relationship('Person', back_populates='provider', lazy='raise_on_sql')
+    visit_occurrences: Mapped[List['VisitOccurrence']] = relationship('VisitOccurrence', back_populates='provider', lazy='raise_on_sql')
+    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='provider', lazy='raise_on_sql')
+    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='provider', lazy='raise_on_sql')
+    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='provider', lazy='raise_on_sql')
+    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='provider', lazy='raise_on_sql')
+    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='provider', lazy='raise_on_sql')
+    notes: Mapped[List['Note']] = relationship('Note', back_populates='provider', lazy='raise_on_sql')
+    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='provider', lazy='raise_on_sql')
+    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='provider', lazy='raise_on_sql')
 
 
 class Person(Base):
@@ -743,8 +792,7 @@ class Person(Base):
         ForeignKeyConstraint(['race_source_concept_id'], ['concept.concept_id'], name='fpk_person_race_source_concept_id'),
         PrimaryKeyConstraint('person_id', name='xpk_person'),
         Index('idx_gender', 'gender_concept_id'),
-        Index('idx_person_id', 'person_id'),
-        {'comment': 'DESC: This table serves as the central identity management for '
+        {'comment': _ddl_comment('DESC: This table serves as the central identity management for '
                 'all Persons in the database. It contains records that uniquely '
                 'identify each person or patient, and some demographic '
                 'information.  | USER GUIDANCE: All records in this table are '
@@ -755,53 +803,56 @@ class Person(Base):
                 'contributes Events to the database, Persons must be reconciled, '
                 'if possible, across the sources to create one single record per '
                 'Person. The content of the BIRTH_DATETIME must be equivalent to '
-                'the content of BIRTH_DAY, BIRTH_MONTH and BIRTH_YEAR. '}
+                'the content of BIRTH_DAY, BIRTH_MONTH and BIRTH_YEAR. ')}
     )
 
-    person_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: It is assumed that every person with a different unique identifier is in fact a different person and should be treated independently. | ETLCONVENTIONS: Any person linkage that needs to occur to uniquely identify Persons ought to be done prior to writing this table. This identifier can be the original id from the source data provided if it is an integer, otherwise it can be an autogenerated number.')
-    gender_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field is meant to capture the biological sex at birth of the Person. This field should not be used to study gender identity issues. | ETLCONVENTIONS: Use the gender or sex value present in the data under the assumption that it is the biological sex at birth. If the source data captures gender identity it should be stored in the [OBSERVATION](https://ohdsi.github.io/CommonDataModel/cdm531.html#observation) table. [Accepted gender concepts](http://athena.ohdsi.org/search-terms/terms?domain=Gender&standardConcept=Standard&page=1&pageSize=15&query=)')
-    year_of_birth: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Compute age using year_of_birth. | ETLCONVENTIONS: For data sources with date of birth, the year should be extracted. For data sources where the year of birth is not available, the approximate year of birth could be derived based on age group categorization, if available.')
-    race_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field captures race or ethnic background of the person. | ETLCONVENTIONS: Only use this field if you have information about race or ethnic background. The Vocabulary contains Concepts about the main races and ethnic backgrounds in a hierarchical system. Due to the imprecise nature of human races and ethnic backgrounds, this is not a perfect system. Mixed races are not supported. If a clear race or ethnic background cannot be established, use Concept_Id 0. [Accepted Race Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Race&standardConcept=Standard&page=1&pageSize=15&query=).')
-    ethnicity_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field captures Ethnicity as defined by the Office of Management and Budget (OMB) of the US Government: it distinguishes only between "Hispanic" and "Not Hispanic". Races and ethnic backgrounds are not stored here. | ETLCONVENTIONS: Only use this field if you have US-based data and a source of this information. Do not attempt to infer Ethnicity from the race or ethnic background of the Person. [Accepted ethnicity concepts](http://athena.ohdsi.org/search-terms/terms?domain=Ethnicity&standardConcept=Standard&page=1&pageSize=15&query=)')
-    month_of_birth: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: For data sources that provide the precise date of birth, the month should be extracted and stored in this field.')
-    day_of_birth: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: For data sources that provide the precise date of birth, the day should be extracted and stored in this field.')
-    birth_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: This field is not required but highly encouraged. For data sources that provide the precise datetime of birth, that value should be stored in this field. If birth_datetime is not provided in the source, use the following logic to infer the date: If day_of_birth is null and month_of_birth is not null then use the first of the month in that year. If month_of_birth is null or if day_of_birth AND month_of_birth are both null and the person has records during their year of birth then use the date of the earliest record, otherwise use the 15th of June of that year. If time of birth is not given use midnight (00:00:0000).')
-    location_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The location refers to the physical address of the person. This field should capture the last known location of the person.  | ETLCONVENTIONS: Put the location_id from the [LOCATION](https://ohdsi.github.io/CommonDataModel/cdm531.html#location) table here that represents the most granular location information for the person. This could represent anything from postal code or parts thereof, state, or county for example. Since many databases contain deidentified data, it is common that the precision of the location is reduced to prevent re-identification. This field should capture the last known location. ')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Provider refers to the last known primary care provider (General Practitioner). | ETLCONVENTIONS: Put the provider_id from the [PROVIDER](https://ohdsi.github.io/CommonDataModel/cdm531.html#provider) table of the last known general practitioner of the person. If there are multiple providers, it is up to the ETL to decide which to put here.')
-    care_site_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Care Site refers to where the Provider typically provides the primary care.')
-    person_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: Use this field to link back to persons in the source data. This is typically used for error checking of ETL logic. | ETLCONVENTIONS: Some use cases require the ability to link back to persons in the source data. This field allows for the storing of the person value as it appears in the source. This field is not required but strongly recommended.')
-    gender_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field is used to store the biological sex of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: Put the biological sex of the person as it appears in the source data.')
-    gender_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes biological sex in a non-standard vocabulary, store the concept_id here.')
-    race_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field is used to store the race of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: Put the race of the person as it appears in the source data.')
-    race_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes race in an OMOP supported vocabulary store the concept_id here.')
-    ethnicity_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field is used to store the ethnicity of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: If the person has an ethnicity other than the OMB standard of "Hispanic" or "Not Hispanic" store that value from the source data here.')
-    ethnicity_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes ethnicity in an OMOP supported vocabulary, store the concept_id here.')
-
-    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='persons')
-    ethnicity_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ethnicity_concept_id])
-    ethnicity_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ethnicity_source_concept_id])
-    gender_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_concept_id])
-    gender_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_source_concept_id])
-    location: Mapped['Location'] = relationship('Location', back_populates='persons')
-    provider: Mapped['Provider'] = relationship('Provider', back_populates='persons')
-    race_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[race_concept_id])
-    race_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[race_source_concept_id])
-    condition_eras: Mapped[List['ConditionEra']] = relationship('ConditionEra', back_populates='person')
-    dose_eras: Mapped[List['DoseEra']] = relationship('DoseEra', back_populates='person')
-    drug_eras: Mapped[List['DrugEra']] = relationship('DrugEra', back_populates='person')
-    episodes: Mapped[List['Episode']] = relationship('Episode', back_populates='person')
-    observation_periods: Mapped[List['ObservationPeriod']] = relationship('ObservationPeriod', back_populates='person')
-    payer_plan_periods: Mapped[List['PayerPlanPeriod']] = relationship('PayerPlanPeriod', back_populates='person')
-    specimens: Mapped[List['Specimen']] = relationship('Specimen', back_populates='person')
-    visit_occurrences: Mapped[List['VisitOccurrence']] = relationship('VisitOccurrence', back_populates='person')
-    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='person')
-    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='person')
-    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='person')
-    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='person')
-    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='person')
-    notes: Mapped[List['Note']] = relationship('Note', back_populates='person')
-    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='person')
-    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='person')
+    # fetch the autoincrement ids eagerly (one batched INSERT .. RETURNING with
+    # insertmanyvalues) and skip the deleted-rowcount check on bulk deletes.
+    __mapper_args__ = {"eager_defaults": True, "confirm_deleted_rows": False}
+    person_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: It is assumed that every person with a different unique identifier is in fact a different person and should be treated independently. | ETLCONVENTIONS: Any person linkage that needs to occur to uniquely identify Persons ought to be done prior to writing this table. This identifier can be the original id from the source data provided if it is an integer, otherwise it can be an autogenerated number.'))
+    gender_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field is meant to capture the biological sex at birth of the Person. This field should not be used to study gender identity issues. | ETLCONVENTIONS: Use the gender or sex value present in the data under the assumption that it is the biological sex at birth. If the source data captures gender identity it should be stored in the [OBSERVATION](https://ohdsi.github.io/CommonDataModel/cdm531.html#observation) table. [Accepted gender concepts](http://athena.ohdsi.org/search-terms/terms?domain=Gender&standardConcept=Standard&page=1&pageSize=15&query=)'))
+    year_of_birth: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Compute age using year_of_birth. | ETLCONVENTIONS: For data sources with date of birth, the year should be extracted. For data sources where the year of birth is not available, the approximate year of birth could be derived based on age group categorization, if available.'))
+    race_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field captures race or ethnic background of the person. | ETLCONVENTIONS: Only use this field if you have information about race or ethnic background. The Vocabulary contains Concepts about the main races and ethnic backgrounds in a hierarchical system. Due to the imprecise nature of human races and ethnic backgrounds, this is not a perfect system. Mixed races are not supported. If a clear race or ethnic background cannot be established, use Concept_Id 0. [Accepted Race Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Race&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    ethnicity_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field captures Ethnicity as defined by the Office of Management and Budget (OMB) of the US Government: it distinguishes only between "Hispanic" and "Not Hispanic". Races and ethnic backgrounds are not stored here. | ETLCONVENTIONS: Only use this field if you have US-based data and a source of this information. Do not attempt to infer Ethnicity from the race or ethnic background of the Person. [Accepted ethnicity concepts](http://athena.ohdsi.org/search-terms/terms?domain=Ethnicity&standardConcept=Standard&page=1&pageSize=15&query=)'))
+    month_of_birth: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: For data sources that provide the precise date of birth, the month should be extracted and stored in this field.'))
+    day_of_birth: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: For data sources that provide the precise date of birth, the day should be extracted and stored in this field.'))
+    birth_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(' | ETLCONVENTIONS: This field is not required but highly encouraged. For data sources that provide the precise datetime of birth, that value should be stored in this field. If birth_datetime is not provided in the source, use the following logic to infer the date: If day_of_birth is null and month_of_birth is not null then use the first of the month in that year. If month_of_birth is null or if day_of_birth AND month_of_birth are both null and the person has records during their year of birth then use the date of the earliest record, otherwise use the 15th of June of that year. If time of birth is not given use midnight (00:00:0000).'))
+    location_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The location refers to the physical address of the person. This field should capture the last known location of the person.  | ETLCONVENTIONS: Put the location_id from the [LOCATION](https://ohdsi.github.io/CommonDataModel/cdm531.html#location) table here that represents the most granular location information for the person. This could represent anything from postal code or parts thereof, state, or county for example. Since many databases contain deidentified data, it is common that the precision of the location is reduced to prevent re-identification. This field should capture the last known location. '))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Provider refers to the last known primary care provider (General Practitioner). | ETLCONVENTIONS: Put the provider_id from the [PROVIDER](https://ohdsi.github.io/CommonDataModel/cdm531.html#provider) table of the last known general practitioner of the person. If there are multiple providers, it is up to the ETL to decide which to put here.'))
+    care_site_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Care Site refers to where the Provider typically provides the primary care.'))
+    person_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: Use this field to link back to persons in the source data. This is typically used for error checking of ETL logic. | ETLCONVENTIONS: Some use cases require the ability to link back to persons in the source data. This field allows for the storing of the person value as it appears in the source. This field is not required but strongly recommended.'))
+    gender_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field is used to store the biological sex of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: Put the biological sex of the person as it appears in the source data.'))
+    gender_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes biological sex in a non-standard vocabulary, store the concept_id here.'))
+    race_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field is used to store the race of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: Put the race of the person as it appears in the source data.'))
+    race_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes race in an OMOP supported vocabulary store the concept_id here.'))
+    ethnicity_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field is used to store the ethnicity of the person from the source data. It is not intended for use in standard analytics but for reference only. | ETLCONVENTIONS: If the person has an ethnicity other than the OMB standard of "Hispanic" or "Not Hispanic" store that value from the source data here.'))
+    ethnicity_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Due to the small number of options, this tends to be zero. | ETLCONVENTIONS: If the source data codes ethnicity in an OMOP supported vocabulary, store the concept_id here.'))
+
+    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='persons', lazy='raise_on_sql')
+    ethnicity_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ethnicity_concept_id], lazy='raise_on_sql')
+    ethnicity_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[ethnicity_source_concept_id], lazy='raise_on_sql')
+    gender_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_concept_id], lazy='raise_on_sql')
+    gender_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[gender_source_concept_id], lazy='raise_on_sql')
+    location: Mapped['Location'] = relationship('Location', back_populates='persons', lazy='raise_on_sql')
+    provider: Mapped['Provider'] = relationship('Provider', back_populates='persons', lazy='raise_on_sql')
+    race_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[race_concept_id], lazy='raise_on_sql')
+    race_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[race_source_concept_id], lazy='raise_on_sql')
+    condition_eras: Mapped[List['ConditionEra']] = relationship('ConditionEra', back_populates='person', lazy='raise_on_sql')
+    dose_eras: Mapped[List['DoseEra']] = relationship('DoseEra', back_populates='person', lazy='raise_on_sql')
+    drug_eras: Mapped[List['DrugEra']] = relationship('DrugEra', back_populates='person', lazy='raise_on_sql')
+    episodes: Mapped[List['Episode']] = relationship('Episode', back_populates='person', lazy='raise_on_sql')
+    observation_periods: Mapped[List['ObservationPeriod']] = relationship('ObservationPeriod', back_populates='person', lazy='raise_on_sql')
+    payer_plan_periods: Mapped[List['PayerPlanPeriod']] = relationship('PayerPlanPeriod', back_populates='person', lazy='raise_on_sql')
+    specimens: Mapped[List['Specimen']] = relationship('Specimen', back_populates='person', lazy='raise_on_sql')
+    visit_occurrences: Mapped[List['VisitOccurrence']] = relationship('VisitOccurrence', back_populates='person', lazy='raise_on_sql')
+    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='person', lazy='raise_on_sql')
+    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='person', lazy='raise_on_sql')
+    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='person', lazy='raise_on_sql')
+    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='person', lazy='raise_on_sql')
+    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='person', lazy='raise_on_sql')
+    notes: Mapped[List['Note']] = relationship('Note', back_populates='person', lazy='raise_on_sql')
+    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='person', lazy='raise_on_sql')
+    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='person', lazy='raise_on_sql')
 
 
 class ConditionEra(Base):
@@ -812,7 +863,7 @@ class ConditionEra(Base):
         PrimaryKeyConstraint('condition_era_id', name='xpk_condition_era'),
         Index('idx_condition_era_concept_id_1', 'condition_concept_id'),
         Index('idx_condition_era_person_id_1', 'person_id'),
-        {'comment': 'DESC: A Condition Era is defined as a span of time when the '
+        {'comment': _ddl_comment('DESC: A Condition Era is defined as a span of time when the '
                 'Person is assumed to have a given condition. Similar to Drug '
                 'Eras, Condition Eras are chronological periods of Condition '
                 'Occurrence. Combining individual Condition Occurrences into a '
@@ -845,15 +896,15 @@ class ConditionEra(Base):
                 'Occurrence. Condition Eras are built with a Persistence Window of '
                 '30 days, meaning, if no occurrence of the same '
                 'condition_concept_id happens within 30 days of any one '
-                'occurrence, it will be considered the condition_era_end_date.'}
+                'occurrence, it will be considered the condition_era_end_date.')}
     )
 
-    condition_era_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    person_id: Mapped[int] = mapped_column(Integer)
-    condition_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the Condition.')
-    condition_era_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The start date for the Condition Era\nconstructed from the individual\ninstances of Condition Occurrences.\nIt is the start date of the very first\nchronologically recorded instance of\nthe condition with at least 31 days since any prior record of the same Condition. ')
-    condition_era_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The end date for the Condition Era\nconstructed from the individual\ninstances of Condition Occurrences.\nIt is the end date of the final\ncontinuously recorded instance of the\nCondition.')
-    condition_occurrence_count: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The number of individual Condition\nOccurrences used to construct the\ncondition era.')
+    condition_era_id: Mapped[int] = mapped_column(_Integer, primary_key=True)
+    person_id: Mapped[int] = mapped_column(_Integer)
+    condition_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id representing the Condition.'))
+    condition_era_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The start date for the Condition Era\nconstructed from the individual\ninstances of Condition Occurrences.\nIt is the start date of the very first\nchronologically recorded instance of\nthe condition with at least 31 days since any prior record of the same Condition. '))
+    condition_era_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The end date for the Condition Era\nconstructed from the individual\ninstances of Condition Occurrences.\nIt is the end date of the final\ncontinuously recorded instance of the\nCondition.'))
+    condition_occurrence_count: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The number of individual Condition\nOccurrences used to construct the\ncondition era.'))
 
     condition_concept: Mapped['Concept'] = relationship('Concept')
     person: Mapped['Person'] = relationship('Person', back_populates='condition_eras')
@@ -867,24 +918,28 @@ class Death(Base):
         ForeignKeyConstraint(['death_type_concept_id'], ['concept.concept_id'], name='fpk_death_death_type_concept_id'),
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_death_person_id'),
         Index('idx_death_person_id_1', 'person_id'),
-        {'comment': 'DESC: The death domain contains the clinical event for how and '
+        {'comment': _ddl_comment('DESC: The death domain contains the clinical event for how and '
                 'when a Person dies. A person can have up to one record if the '
                 'source system contains evidence about the Death, such as: '
                 'Condition in an administrative claim, status of enrollment into a '
-                'health plan, or explicit record in EHR data.'}
+                'health plan, or explicit record in EHR data.')}
     )
+    # Mapper-only key: the CDM DDL deliberately gives death no PRIMARY KEY
+    # constraint, so this must not become primary_key=True on the column. A
+    # single-column mapper key keeps session.get(Death, person_id) on the fast
+    # scalar identity-map path regardless.
     __mapper_args__ = {"primary_key": ['person_id']}
-    person_id: Mapped[int] = mapped_column(Integer, )
-    death_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date the person was deceased. | ETLCONVENTIONS: If the precise date include day or month is not known or not allowed, December is used as the default month, and the last day of the month the default day.')
-    death_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If not available set time to midnight (00:00:00)')
-    death_type_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the provenance of the death record, i.e., where it came from. It is possible that an administrative claims database would source death information from a government file so do not assume the Death Type is the same as the Visit Type, etc. | ETLCONVENTIONS: Use the type concept that be reflects the source of the death record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    cause_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the Standard Concept representing the Person"s cause of death, if available. | ETLCONVENTIONS: There is no specified domain for this concept, just choose the Standard Concept Id that best represents the person"s cause of death.')
-    cause_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: If available, put the source code representing the cause of death here. ')
-    cause_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the cause of death was coded using a Vocabulary present in the OMOP Vocabularies put the CONCEPT_ID representing the cause of death here.')
+    person_id: Mapped[int] = mapped_column(_Integer, )
+    death_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date the person was deceased. | ETLCONVENTIONS: If the precise date include day or month is not known or not allowed, December is used as the default month, and the last day of the month the default day.'))
+    death_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(' | ETLCONVENTIONS: If not available set time to midnight (00:00:00)'))
+    death_type_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the provenance of the death record, i.e., where it came from. It is possible that an administrative claims database would source death information from a government file so do not assume the Death Type is the same as the Visit Type, etc. | ETLCONVENTIONS: Use the type concept that be reflects the source of the death record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    cause_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the Standard Concept representing the Person"s cause of death, if available. | ETLCONVENTIONS: There is no specified domain for this concept, just choose the Standard Concept Id that best represents the person"s cause of death.'))
+    cause_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: If available, put the source code representing the cause of death here. '))
+    cause_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the cause of death was coded using a Vocabulary present in the OMOP Vocabularies put the CONCEPT_ID representing the cause of death here.'))
 
-    cause_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cause_concept_id])
-    cause_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cause_source_concept_id])
-    death_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[death_type_concept_id])
+    cause_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cause_concept_id], lazy='raise_on_sql')
+    cause_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[cause_source_concept_id], lazy='raise_on_sql')
+    death_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[death_type_concept_id], lazy='raise_on_sql')
 
 
 class DoseEra(Base):
@@ -895,8 +950,8 @@ class DoseEra(Base):
         ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_dose_era_unit_concept_id'),
         PrimaryKeyConstraint('dose_era_id', name='xpk_dose_era'),
         Index('idx_dose_era_concept_id_1', 'drug_concept_id'),
-        Index('idx_dose_era_person_id_1', 'person_id'),
-        {'comment': 'DESC: A Dose Era is defined as a span of time when the Person is '
+        Index('idx_dose_era_person_start', 'person_id', 'dose_era_start_date', 'drug_concept_id'),
+        {'comment': _ddl_comment('DESC: A Dose Era is defined as a span of time when the Person is '
                 'assumed to be exposed to a constant dose of a specific active '
                 'ingredient. | ETL CONVENTIONS: Dose Eras will be derived from '
                 'records in the DRUG_EXPOSURE table and the Dose information from '
@@ -904,20 +959,20 @@ class DoseEra(Base):
                 'information is not taken into account. So, if the patient changes '
                 'between different formulations, or different manufacturers with '
                 'the same formulation, the Dose Era is still spanning the entire '
-                'time of exposure to the Ingredient. '}
+                'time of exposure to the Ingredient. ')}
     )
 
-    dose_era_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    person_id: Mapped[int] = mapped_column(Integer)
-    drug_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the specific drug ingredient.')
-    unit_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the unit of the specific drug ingredient.')
-    dose_value: Mapped[decimal.Decimal] = mapped_column(Numeric, comment='USER GUIDANCE: The numeric value of the dosage of the drug_ingredient.')
-    dose_era_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date the Person started on the specific dosage, with at least 31 days since any prior exposure.')
-    dose_era_end_date: Mapped[datetime.date] = mapped_column(Date, comment=' | ETLCONVENTIONS: The date the Person was no longer exposed to the dosage of the specific drug ingredient. An era is ended if there are 31 days or more between dosage records.')
+    dose_era_id: Mapped[int] = mapped_column(_Integer, primary_key=True)
+    person_id: Mapped[int] = mapped_column(_Integer)
+    drug_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment(_COMMENT_INGREDIENT_CONCEPT_ID))
+    unit_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Concept Id representing the unit of the specific drug ingredient.'))
+    dose_value: Mapped[float] = mapped_column(Numeric(asdecimal=False), comment=_ddl_comment('USER GUIDANCE: The numeric value of the dosage of the drug_ingredient.'))  # asdecimal=False: hydrate floats, not Decimal - same NUMERIC DDL, far cheaper per-row for era analytics
+    dose_era_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date the Person started on the specific dosage, with at least 31 days since any prior exposure.'))
+    dose_era_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment(' | ETLCONVENTIONS: The date the Person was no longer exposed to the dosage of the specific drug ingredient. An era is ended if there are 31 days or more between dosage records.'))
 
-    drug_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_concept_id])
-    person: Mapped['Person'] = relationship('Person', back_populates='dose_eras')
-    unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[unit_concept_id])
+    drug_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_concept_id], lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='dose_eras', lazy='raise_on_sql')
+    unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[unit_concept_id], lazy='raise_on_sql')
 
 
 class DrugEra(Base):
@@ -927,8 +982,8 @@ class DrugEra(Base):
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_drug_era_person_id'),
         PrimaryKeyConstraint('drug_era_id', name='xpk_drug_era'),
         Index('idx_drug_era_concept_id_1', 'drug_concept_id'),
-        Index('idx_drug_era_person_id_1', 'person_id'),
-        {'comment': 'DESC: A Drug Era is defined as a span of time when the Person is '
+        Index('idx_drug_era_person_start', 'person_id', 'drug_era_start_date', 'drug_concept_id'),
+        {'comment': _ddl_comment('DESC: A Drug Era is defined as a span of time when the Person is '
                 'assumed to be exposed to a particular active ingredient. A Drug '
                 'Era is not the same as a Drug Exposure: Exposures are individual '
                 'records corresponding to the source when Drug was delivered to '
@@ -936,19 +991,22 @@ class DrugEra(Base):
                 'combined under certain rules to produce continuous Drug Eras. | '
                 'ETL CONVENTIONS: The SQL script for generating DRUG_ERA records '
                 'can be found '
-                '[here](https://ohdsi.github.io/CommonDataModel/sqlScripts.html#drug_eras).'}
+                '[here](https://ohdsi.github.io/CommonDataModel/sqlScripts.html#drug_eras).')}
     )
 
-    drug_era_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    person_id: Mapped[int] = mapped_column(Integer)
-    drug_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Concept Id representing the specific drug ingredient.')
-    drug_era_start_date: Mapped[datetime.date] = mapped_column(Date, comment=' | ETLCONVENTIONS: The Drug Era Start Date is the start date of the first Drug Exposure for a given ingredient, with at least 31 days since the previous exposure. ')
-    drug_era_end_date: Mapped[datetime.date] = mapped_column(Date, comment=' | ETLCONVENTIONS: The Drug Era End Date is the end date of the last Drug Exposure. The End Date of each Drug Exposure is either taken from the field drug_exposure_end_date or, as it is typically not available, inferred using the following rules:\nFor pharmacy prescription data, the date when the drug was dispensed plus the number of days of supply are used to extrapolate the End Date for the Drug Exposure. Depending on the country-specific healthcare system, this supply information is either explicitly provided in the day_supply field or inferred from package size or similar information.\nFor Procedure Drugs, usually the drug is administered on a single date (i.e., the administration date).\nA standard Persistence Window of 30 days (gap, slack) is permitted between two subsequent such extrapolated DRUG_EXPOSURE records to be considered to be merged into a single Drug Era.')
-    drug_exposure_count: Mapped[Optional[int]] = mapped_column(Integer)
-    gap_days: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: The Gap Days determine how many total drug-free days are observed between all Drug Exposure events that contribute to a DRUG_ERA record. It is assumed that the drugs are "not stockpiled" by the patient, i.e. that if a new drug prescription or refill is observed (a new DRUG_EXPOSURE record is written), the remaining supply from the previous events is abandoned.   The difference between Persistence Window and Gap Days is that the former is the maximum drug-free time allowed between two subsequent DRUG_EXPOSURE records, while the latter is the sum of actual drug-free days for the given Drug Era under the above assumption of non-stockpiling.')
+    # fetch the autoincrement ids eagerly (one batched INSERT .. RETURNING with
+    # insertmanyvalues) and skip the deleted-rowcount check on bulk deletes.
+    __mapper_args__ = {"eager_defaults": True, "confirm_deleted_rows": False}
+    drug_era_id: Mapped[int] = mapped_column(_Integer, primary_key=True)
+    person_id: Mapped[int] = mapped_column(_Integer)
+    drug_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment(_COMMENT_INGREDIENT_CONCEPT_ID))
+    drug_era_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment(' | ETLCONVENTIONS: The Drug Era Start Date is the start date of the first Drug Exposure for a given ingredient, with at least 31 days since the previous exposure. '))
+    drug_era_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment(' | ETLCONVENTIONS: The Drug Era End Date is the end date of the last Drug Exposure. The End Date of each Drug Exposure is either taken from the field drug_exposure_end_date or, as it is typically not available, inferred using the following rules:\nFor pharmacy prescription data, the date when the drug was dispensed plus the number of days of supply are used to extrapolate the End Date for the Drug Exposure. Depending on the country-specific healthcare system, this supply information is either explicitly provided in the day_supply field or inferred from package size or similar information.\nFor Procedure Drugs, usually the drug is administered on a single date (i.e., the administration date).\nA standard Persistence Window of 30 days (gap, slack) is permitted between two subsequent such extrapolated DRUG_EXPOSURE records to be considered to be merged into a single Drug Era.'))
+    drug_exposure_count: Mapped[Optional[int]] = mapped_column(_Integer)
+    gap_days: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: The Gap Days determine how many total drug-free days are observed between all Drug Exposure events that contribute to a DRUG_ERA record. It is assumed that the drugs are "not stockpiled" by the patient, i.e. that if a new drug prescription or refill is observed (a new DRUG_EXPOSURE record is written), the remaining supply from the previous events is abandoned.   The difference between Persistence Window and Gap Days is that the former is the maximum drug-free time allowed between two subsequent DRUG_EXPOSURE records, while the latter is the sum of actual drug-free days for the given Drug Era under the above assumption of non-stockpiling.'))
 
-    drug_concept: Mapped['Concept'] = relationship('Concept')
-    person: Mapped['Person'] = relationship('Person', back_populates='drug_eras')
+    drug_concept: Mapped['Concept'] = relationship('Concept', lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='drug_eras', lazy='raise_on_sql')
 
 
 class Episode(Base):
@@ -960,7 +1018,7 @@ class Episode(Base):
         ForeignKeyConstraint(['episode_type_concept_id'], ['concept.concept_id'], name='fpk_episode_episode_type_concept_id'),
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_episode_person_id'),
         PrimaryKeyConstraint('episode_id', name='xpk_episode'),
-        {'comment': 'DESC: The EPISODE table aggregates lower-level clinical events '
+        {'comment': _ddl_comment('DESC: The EPISODE table aggregates lower-level clinical events '
                 '(VISIT_OCCURRENCE, DRUG_EXPOSURE, PROCEDURE_OCCURRENCE, '
                 'DEVICE_EXPOSURE) into a higher-level abstraction representing '
                 'clinically and analytically relevant disease phases,outcomes and '
@@ -974,22 +1032,22 @@ class Episode(Base):
                 'source data does not have all episodes that are relevant to the '
                 'therapeutic area, write only those you can easily derive from the '
                 'data. It is understood that that table is not currently expected '
-                'to be comprehensive. '}
+                'to be comprehensive. ')}
     )
 
-    episode_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A unique identifier for each Episode.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the PERSON for whom the episode is recorded.')
-    episode_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The EPISODE_CONCEPT_ID represents the kind abstraction related to the disease phase, outcome or treatment. | ETLCONVENTIONS: Choose a concept in the Episode domain that best represents the ongoing disease phase, outcome, or treatment. Please see [article] for cancers and [article] for non-cancers describing how these are defined. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Episode&page=1&pageSize=15&query=)')
-    episode_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date when the Episode beings.  | ETLCONVENTIONS: Please see [article] for how to define an Episode start date.')
-    episode_object_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A Standard Concept representing the disease phase, outcome, or other abstraction of which the episode consists.  For example, if the EPISODE_CONCEPT_ID is [treatment regimen](https://athena.ohdsi.org/search-terms/terms/32531) then the EPISODE_OBJECT_CONCEPT_ID should contain the chemotherapy regimen concept, like [Afatinib monotherapy](https://athena.ohdsi.org/search-terms/terms/35804392).  | ETLCONVENTIONS: Episode entries from the "Disease Episode" concept class should have an episode_object_concept_id that comes from the Condition domain.  Episode entries from the "Treatment Episode" concept class should have an episode_object_concept_id that scome from the "Procedure" domain or "Regimen" concept class.')
-    episode_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Episode record, as in whether the episode was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the EPISODE_TYPE_CONCEPT_ID that best represents the provenance of the record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    episode_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: The date and time when the Episode begins.')
-    episode_end_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: The date when the instance of the Episode is considered to have ended. | ETLCONVENTIONS: Please see [article] for how to define an Episode end date.')
-    episode_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: The date when the instance of the Episode is considered to have ended.')
-    episode_parent_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to find the Episode that subsumes the given Episode record. This is used in the case that an Episode are nested into each other. | ETLCONVENTIONS: If there are multiple nested levels to how Episodes are represented, the EPISODE_PARENT_ID can be used to record this relationship. ')
-    episode_number: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: For sequences of episodes, this is used to indicate the order the episodes occurred. For example, lines of treatment could be indicated here.  | ETLCONVENTIONS: Please see [article] for the details of how to count episodes.')
-    episode_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: The source code for the Episdoe as it appears in the source data. This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    episode_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: A foreign key to a Episode Concept that refers to the code used in the source. | ETLCONVENTIONS: Given that the Episodes are user-defined it is unlikely that there will be a Source Concept available. If that is the case then set this field to zero. ')
+    episode_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for each Episode.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the PERSON for whom the episode is recorded.'))
+    episode_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The EPISODE_CONCEPT_ID represents the kind abstraction related to the disease phase, outcome or treatment. | ETLCONVENTIONS: Choose a concept in the Episode domain that best represents the ongoing disease phase, outcome, or treatment. Please see [article] for cancers and [article] for non-cancers describing how these are defined. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Episode&page=1&pageSize=15&query=)'))
+    episode_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the Episode beings.  | ETLCONVENTIONS: Please see [article] for how to define an Episode start date.'))
+    episode_object_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A Standard Concept representing the disease phase, outcome, or other abstraction of which the episode consists.  For example, if the EPISODE_CONCEPT_ID is [treatment regimen](https://athena.ohdsi.org/search-terms/terms/32531) then the EPISODE_OBJECT_CONCEPT_ID should contain the chemotherapy regimen concept, like [Afatinib monotherapy](https://athena.ohdsi.org/search-terms/terms/35804392).  | ETLCONVENTIONS: Episode entries from the "Disease Episode" concept class should have an episode_object_concept_id that comes from the Condition domain.  Episode entries from the "Treatment Episode" concept class should have an episode_object_concept_id that scome from the "Procedure" domain or "Regimen" concept class.'))
+    episode_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Episode record, as in whether the episode was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the EPISODE_TYPE_CONCEPT_ID that best represents the provenance of the record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    episode_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment('USER GUIDANCE: The date and time when the Episode begins.'))
+    episode_end_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date when the instance of the Episode is considered to have ended. | ETLCONVENTIONS: Please see [article] for how to define an Episode end date.'))
+    episode_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment('USER GUIDANCE: The date when the instance of the Episode is considered to have ended.'))
+    episode_parent_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to find the Episode that subsumes the given Episode record. This is used in the case that an Episode are nested into each other. | ETLCONVENTIONS: If there are multiple nested levels to how Episodes are represented, the EPISODE_PARENT_ID can be used to record this relationship. '))
+    episode_number: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: For sequences of episodes, this is used to indicate the order the episodes occurred. For example, lines of treatment could be indicated here.  | ETLCONVENTIONS: Please see [article] for the details of how to count episodes.'))
+    episode_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: The source code for the Episdoe as it appears in the source data. This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    episode_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A foreign key to a Episode Concept that refers to the code used in the source. | ETLCONVENTIONS: Given that the Episodes are user-defined it is unlikely that there will be a Source Concept available. If that is the case then set this field to zero. '))
 
     episode_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[episode_concept_id])
     episode_object_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[episode_object_concept_id])
@@ -1005,8 +1063,9 @@ class ObservationPeriod(Base):
         ForeignKeyConstraint(['period_type_concept_id'], ['concept.concept_id'], name='fpk_observation_period_period_type_concept_id'),
         ForeignKeyConstraint(['person_id'], ['person.person_id'], name='fpk_observation_period_person_id'),
         PrimaryKeyConstraint('observation_period_id', name='xpk_observation_period'),
-        Index('idx_observation_period_id_1', 'person_id'),
-        {'comment': 'DESC: This table contains records which define spans of time '
+        Index('idx_observation_period_person_start', 'person_id', 'observation_period_start_date', 'observation_period_end_date'),
+        Index('brin_observation_period_start_date', 'observation_period_start_date', postgresql_using='brin'),
+        {'comment': _ddl_comment('DESC: This table contains records which define spans of time '
                 'during which two conditions are expected to hold: (i) Clinical '
                 'Events that happened to the Person are recorded in the Event '
                 'tables, and (ii) absense of records indicate such Events did not '
@@ -1046,17 +1105,20 @@ class ObservationPeriod(Base):
                 'Events generally are not used to generate OBSERVATION_PERIOD '
                 'records around the time they are referring to. Any two '
                 'overlapping or adjacent OBSERVATION_PERIOD records have to be '
-                'merged into one.'}
+                'merged into one.')}
     )
 
-    observation_period_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A Person can have multiple discrete Observation Periods which are identified by the Observation_Period_Id. | ETLCONVENTIONS: Assign a unique observation_period_id to each discrete Observation Period for a Person.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Person ID of the PERSON record for which the Observation Period is recorded.')
-    observation_period_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the start date of the Observation Period. | ETLCONVENTIONS: It is often the case that the idea of Observation Periods does not exist in source data. In those cases, the observation_period_start_date can be inferred as the earliest Event date available for the Person. In insurance claim data, the Observation Period can be considered as the time period the Person is enrolled with a payer. If a Person switches plans but stays with the same payer, and therefore capturing of data continues, that change would be captured in [PAYER_PLAN_PERIOD](https://ohdsi.github.io/CommonDataModel/cdm531.html#payer_plan_period).')
-    observation_period_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the end date of the period for which we can assume that all events for a Person are recorded. | ETLCONVENTIONS: It is often the case that the idea of Observation Periods does not exist in source data. In those cases, the observation_period_end_date can be inferred as the last Event date available for the Person. In insurance claim data, the Observation Period can be considered as the time period the Person is enrolled with a payer.')
-    period_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Observation Period as in whether the period was determined from an insurance enrollment file, EHR healthcare encounters, or other sources. | ETLCONVENTIONS: Choose the observation_period_type_concept_id that best represents how the period was determined. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    observation_period_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A Person can have multiple discrete Observation Periods which are identified by the Observation_Period_Id. | ETLCONVENTIONS: Assign a unique observation_period_id to each discrete Observation Period for a Person.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Person ID of the PERSON record for which the Observation Period is recorded.'))
+    observation_period_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the start date of the Observation Period. | ETLCONVENTIONS: It is often the case that the idea of Observation Periods does not exist in source data. In those cases, the observation_period_start_date can be inferred as the earliest Event date available for the Person. In insurance claim data, the Observation Period can be considered as the time period the Person is enrolled with a payer. If a Person switches plans but stays with the same payer, and therefore capturing of data continues, that change would be captured in [PAYER_PLAN_PERIOD](https://ohdsi.github.io/CommonDataModel/cdm531.html#payer_plan_period).'))
+    observation_period_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the end date of the period for which we can assume that all events for a Person are recorded. | ETLCONVENTIONS: It is often the case that the idea of Observation Periods does not exist in source data. In those cases, the observation_period_end_date can be inferred as the last Event date available for the Person. In insurance claim data, the Observation Period can be considered as the time period the Person is enrolled with a payer.'))
+    period_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Observation Period as in whether the period was determined from an insurance enrollment file, EHR healthcare encounters, or other sources. | ETLCONVENTIONS: Choose the observation_period_type_concept_id that best represents how the period was determined. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
 
-    period_type_concept: Mapped['Concept'] = relationship('Concept')
-    person: Mapped['Person'] = relationship('Person', back_populates='observation_periods')
+    period_type_concept: Mapped['Concept'] = relationship('Concept', lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='observation_periods', lazy='raise_on_sql')
 
 
 class PayerPlanPeriod(Base):
@@ -1072,8 +1134,10 @@ class PayerPlanPeriod(Base):
         ForeignKeyConstraint(['stop_reason_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_concept_id'),
         ForeignKeyConstraint(['stop_reason_source_concept_id'], ['concept.concept_id'], name='fpk_payer_plan_period_stop_reason_source_concept_id'),
         PrimaryKeyConstraint('payer_plan_period_id', name='xpk_payer_plan_period'),
-        Index('idx_period_person_id_1', 'person_id'),
-        {'comment': 'DESC: The PAYER_PLAN_PERIOD table captures details of the period '
+        Index('idx_payer_plan_period_person_start', 'person_id', 'payer_plan_period_start_date', 'payer_plan_period_end_date', postgresql_include=['payer_concept_id', 'plan_concept_id']),
+        Index('brin_payer_plan_period_start_date', 'payer_plan_period_start_date', postgresql_using='brin'),
+        Index('idx_payer_plan_period_stop_reason', 'stop_reason_concept_id', postgresql_where=text('stop_reason_concept_id IS NOT NULL')),
+        {'comment': _ddl_comment('DESC: The PAYER_PLAN_PERIOD table captures details of the period '
                 'of time that a Person is continuously enrolled under a specific '
                 'health Plan benefit structure from a given Payer. Each Person '
                 'receiving healthcare is typically covered by a health benefit '
@@ -1091,36 +1155,39 @@ class PayerPlanPeriod(Base):
                 'Payer_Plan_Periods in this table. For example, medical and drug '
                 'coverage in the US can be represented by two Payer_Plan_Periods. '
                 'The details of the benefit structure of the Plan is rarely known, '
-                'the idea is just to identify that the Plans are different.'}
+                'the idea is just to identify that the Plans are different.')}
     )
 
-    payer_plan_period_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A unique identifier for each unique combination of a Person, Payer, Plan, and Period of time.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The Person covered by the Plan. | ETLCONVENTIONS: A single Person can have multiple, overlapping, PAYER_PLAN_PERIOD records')
-    payer_plan_period_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Start date of Plan coverage.')
-    payer_plan_period_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: End date of Plan coverage.')
-    payer_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field represents the organization who reimburses the provider which administers care to the Person. | ETLCONVENTIONS: Map the Payer directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same payer, though the name of the Payer is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Payer&standardConcept=Standard&page=1&pageSize=15&query=).')
-    payer_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the Payer as it appears in the source data.')
-    payer_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the source data codes the Payer in an OMOP supported vocabulary store the concept_id here.')
-    plan_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field represents the specific health benefit Plan the Person is enrolled in. | ETLCONVENTIONS: Map the Plan directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same health benefit Plan though the name of the Plan is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Plan&standardConcept=Standard&page=1&pageSize=15&query=).')
-    plan_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the health benefit Plan of the Person as it appears in the source data.')
-    plan_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the source data codes the Plan in an OMOP supported vocabulary store the concept_id here.')
-    sponsor_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field represents the sponsor of the Plan who finances the Plan. This includes self-insured, small group health plan and large group health plan. | ETLCONVENTIONS: Map the sponsor directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same sponsor though the name of the sponsor is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Sponsor&standardConcept=Standard&page=1&pageSize=15&query=).')
-    sponsor_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: The Plan sponsor as it appears in the source data.')
-    sponsor_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the source data codes the sponsor in an OMOP supported vocabulary store the concept_id here.')
-    family_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: The common identifier for all people (often a family) that covered by the same policy. | ETLCONVENTIONS: Often these are the common digits of the enrollment id of the policy members.')
-    stop_reason_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field represents the reason the Person left the Plan, if known. | ETLCONVENTIONS: Map the stop reason directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Plan+Stop+Reason&standardConcept=Standard&page=1&pageSize=15&query=).')
-    stop_reason_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: The Plan stop reason as it appears in the source data.')
-    stop_reason_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the source data codes the stop reason in an OMOP supported vocabulary store the concept_id here.')
-
-    payer_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[payer_concept_id])
-    payer_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[payer_source_concept_id])
-    person: Mapped['Person'] = relationship('Person', back_populates='payer_plan_periods')
-    plan_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[plan_concept_id])
-    plan_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[plan_source_concept_id])
-    sponsor_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[sponsor_concept_id])
-    sponsor_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[sponsor_source_concept_id])
-    stop_reason_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[stop_reason_concept_id])
-    stop_reason_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[stop_reason_source_concept_id])
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    payer_plan_period_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for each unique combination of a Person, Payer, Plan, and Period of time.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Person covered by the Plan. | ETLCONVENTIONS: A single Person can have multiple, overlapping, PAYER_PLAN_PERIOD records'))
+    payer_plan_period_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Start date of Plan coverage.'))
+    payer_plan_period_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: End date of Plan coverage.'))
+    payer_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field represents the organization who reimburses the provider which administers care to the Person. | ETLCONVENTIONS: Map the Payer directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same payer, though the name of the Payer is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Payer&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    payer_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: This is the Payer as it appears in the source data.'))
+    payer_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the source data codes the Payer in an OMOP supported vocabulary store the concept_id here.'))
+    plan_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field represents the specific health benefit Plan the Person is enrolled in. | ETLCONVENTIONS: Map the Plan directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same health benefit Plan though the name of the Plan is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Plan&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    plan_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: This is the health benefit Plan of the Person as it appears in the source data.'))
+    plan_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the source data codes the Plan in an OMOP supported vocabulary store the concept_id here.'))
+    sponsor_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field represents the sponsor of the Plan who finances the Plan. This includes self-insured, small group health plan and large group health plan. | ETLCONVENTIONS: Map the sponsor directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. The point is to stratify on this information and identify if Persons have the same sponsor though the name of the sponsor is not necessary. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Sponsor&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    sponsor_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: The Plan sponsor as it appears in the source data.'))
+    sponsor_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the source data codes the sponsor in an OMOP supported vocabulary store the concept_id here.'))
+    family_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: The common identifier for all people (often a family) that covered by the same policy. | ETLCONVENTIONS: Often these are the common digits of the enrollment id of the policy members.'))
+    stop_reason_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field represents the reason the Person left the Plan, if known. | ETLCONVENTIONS: Map the stop reason directly to a standard CONCEPT_ID. If one does not exists please contact the vocabulary team. There is no global controlled vocabulary available for this information. [Accepted Concepts](http://athena.ohdsi.org/search-terms/terms?domain=Plan+Stop+Reason&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    stop_reason_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: The Plan stop reason as it appears in the source data.'))
+    stop_reason_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the source data codes the stop reason in an OMOP supported vocabulary store the concept_id here.'))
+
+    payer_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[payer_concept_id], viewonly=True, lazy='raise_on_sql')
+    payer_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[payer_source_concept_id], viewonly=True, lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='payer_plan_periods', lazy='raise_on_sql')
+    plan_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[plan_concept_id], viewonly=True, lazy='raise_on_sql')
+    plan_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[plan_source_concept_id], viewonly=True, lazy='raise_on_sql')
+    sponsor_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[sponsor_concept_id], viewonly=True, lazy='raise_on_sql')
+    sponsor_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[sponsor_source_concept_id], viewonly=True, lazy='raise_on_sql')
+    stop_reason_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[stop_reason_concept_id], viewonly=True, lazy='raise_on_sql')
+    stop_reason_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[stop_reason_source_concept_id], viewonly=True, lazy='raise_on_sql')
 
 
 class Specimen(Base):
@@ -1134,36 +1201,41 @@ class Specimen(Base):
         ForeignKeyConstraint(['unit_concept_id'], ['concept.concept_id'], name='fpk_specimen_unit_concept_id'),
         PrimaryKeyConstraint('specimen_id', name='xpk_specimen'),
         Index('idx_specimen_concept_id_1', 'specimen_concept_id'),
-        Index('idx_specimen_person_id_1', 'person_id'),
-        {'comment': 'DESC: The specimen domain contains the records identifying '
+        Index('idx_specimen_person_id_1', 'person_id', postgresql_include=['specimen_concept_id', 'quantity']),
+        Index('brin_specimen_date', 'specimen_date', postgresql_using='brin'),
+        Index('idx_specimen_anatomic_site', 'anatomic_site_concept_id', postgresql_where=text('anatomic_site_concept_id IS NOT NULL')),
+        {'comment': _ddl_comment('DESC: The specimen domain contains the records identifying '
                 'biological samples from a person. | ETL CONVENTIONS: Anatomic '
                 'site is coded at the most specific level of granularity possible, '
                 'such that higher level classifications can be derived using the '
-                'Standardized Vocabularies.'}
+                'Standardized Vocabularies.')}
     )
 
-    specimen_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: Unique identifier for each specimen.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The person from whom the specimen is collected.')
-    specimen_concept_id: Mapped[int] = mapped_column(Integer, comment=' | ETLCONVENTIONS: The standard CONCEPT_ID that the SPECIMEN_SOURCE_VALUE maps to in the specimen domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Specimen&standardConcept=Standard&page=1&pageSize=15&query=)')
-    specimen_type_concept_id: Mapped[int] = mapped_column(Integer, comment=' | ETLCONVENTIONS: Put the source of the specimen record, as in an EHR system. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Type+Concept&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    specimen_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date the specimen was collected.')
-    specimen_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
-    quantity: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: The amount of specimen collected from the person.')
-    unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The unit for the quantity of the specimen. | ETLCONVENTIONS: Map the UNIT_SOURCE_VALUE to a Standard Concept in the Unit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Unit&standardConcept=Standard&page=1&pageSize=15&query=)')
-    anatomic_site_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the site on the body where the specimen is from. | ETLCONVENTIONS: Map the ANATOMIC_SITE_SOURCE_VALUE to a Standard Concept in the Spec Anatomic Site domain. This should be coded at the lowest level of granularity [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Spec+Anatomic+Site&conceptClass=Body+Structure&page=4&pageSize=15&query=)')
-    disease_status_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
-    specimen_source_id: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This is the identifier for the specimen from the source system. ')
-    specimen_source_value: Mapped[Optional[str]] = mapped_column(String(50))
-    unit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This unit for the quantity of the specimen, as represented in the source.')
-    anatomic_site_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This is the site on the body where the specimen was taken from, as represented in the source.')
-    disease_status_source_value: Mapped[Optional[str]] = mapped_column(String(50))
-
-    anatomic_site_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[anatomic_site_concept_id])
-    disease_status_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[disease_status_concept_id])
-    person: Mapped['Person'] = relationship('Person', back_populates='specimens')
-    specimen_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specimen_concept_id])
-    specimen_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specimen_type_concept_id])
-    unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[unit_concept_id])
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    specimen_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: Unique identifier for each specimen.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The person from whom the specimen is collected.'))
+    specimen_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: The standard CONCEPT_ID that the SPECIMEN_SOURCE_VALUE maps to in the specimen domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Specimen&standardConcept=Standard&page=1&pageSize=15&query=)'))
+    specimen_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: Put the source of the specimen record, as in an EHR system. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Type+Concept&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    specimen_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date the specimen was collected.'))
+    specimen_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime)
+    quantity: Mapped[Optional[float]] = mapped_column(Numeric(asdecimal=False), comment=_ddl_comment('USER GUIDANCE: The amount of specimen collected from the person.'))  # asdecimal=False: hydrate floats, not Decimal - same NUMERIC DDL, far cheaper per-row for specimen analytics
+    unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The unit for the quantity of the specimen. | ETLCONVENTIONS: Map the UNIT_SOURCE_VALUE to a Standard Concept in the Unit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Unit&standardConcept=Standard&page=1&pageSize=15&query=)'))
+    anatomic_site_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the site on the body where the specimen is from. | ETLCONVENTIONS: Map the ANATOMIC_SITE_SOURCE_VALUE to a Standard Concept in the Spec Anatomic Site domain. This should be coded at the lowest level of granularity [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Spec+Anatomic+Site&conceptClass=Body+Structure&page=4&pageSize=15&query=)'))
+    disease_status_concept_id: Mapped[Optional[int]] = mapped_column(_Integer)
+    specimen_source_id: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This is the identifier for the specimen from the source system. '))
+    specimen_source_value: Mapped[Optional[str]] = mapped_column(_String(50))
+    unit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: This unit for the quantity of the specimen, as represented in the source.'))
+    anatomic_site_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: This is the site on the body where the specimen was taken from, as represented in the source.'))
+    disease_status_source_value: Mapped[Optional[str]] = mapped_column(_String(50))
+
+    anatomic_site_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[anatomic_site_concept_id], viewonly=True, lazy='raise_on_sql')
+    disease_status_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[disease_status_concept_id], viewonly=True, lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='specimens', lazy='raise_on_sql')
+    specimen_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specimen_concept_id], viewonly=True, lazy='raise_on_sql')
+    specimen_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[specimen_type_concept_id], viewonly=True, lazy='raise_on_sql')
+    unit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[unit_concept_id], viewonly=True, lazy='raise_on_sql')
 
 
 class VisitOccurrence(Base):
@@ -1180,8 +1252,9 @@ class VisitOccurrence(Base):
         ForeignKeyConstraint(['visit_type_concept_id'], ['concept.concept_id'], name='fpk_visit_occurrence_visit_type_concept_id'),
         PrimaryKeyConstraint('visit_occurrence_id', name='xpk_visit_occurrence'),
         Index('idx_visit_concept_id_1', 'visit_concept_id'),
-        Index('idx_visit_person_id_1', 'person_id'),
-        {'comment': 'DESC: This table contains Events where Persons engage with the '
+        Index('idx_visit_person_date', 'person_id', 'visit_start_date'),
+        Index('brin_visit_start_date', 'visit_start_date', postgresql_using='brin'),
+        {'comment': _ddl_comment('DESC: This table contains Events where Persons engage with the '
                 'healthcare system for a duration of time. They are often also '
                 'called "Encounters". Visits are defined by a configuration of '
                 'circumstances under which they occur, such as (i) whether the '
@@ -1277,44 +1350,47 @@ class VisitOccurrence(Base):
                 'data and how encounter records should be translated to visit '
                 'occurrences. Providers can be associated with a Visit through the '
                 'PROVIDER_ID field, or indirectly through PROCEDURE_OCCURRENCE '
-                'records linked both to the VISIT and PROVIDER tables.'}
+                'records linked both to the VISIT and PROVIDER tables.')}
     )
 
-    visit_occurrence_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: Use this to identify unique interactions between a person and the health care system. This identifier links across the other CDM event tables to associate events with a visit. | ETLCONVENTIONS: This should be populated by creating a unique identifier for each unique interaction between a person and the healthcare system where the person receives a medical good or service over a span of time.')
-    person_id: Mapped[int] = mapped_column(Integer)
-    visit_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field contains a concept id representing the kind of visit, like inpatient or outpatient. All concepts in this field should be standard and belong to the Visit domain. | ETLCONVENTIONS: Populate this field based on the kind of visit that took place for the person. For example this could be "Inpatient Visit", "Outpatient Visit", "Ambulatory Visit", etc. This table will contain standard concepts in the Visit domain. These concepts are arranged in a hierarchical structure to facilitate cohort definitions by rolling up to generally familiar Visits adopted in most healthcare systems worldwide. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).')
-    visit_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: For inpatient visits, the start date is typically the admission date. For outpatient visits the start date and end date will be the same. | ETLCONVENTIONS: When populating VISIT_START_DATE, you should think about the patient experience to make decisions on how to define visits. In the case of an inpatient visit this should be the date the patient was admitted to the hospital or institution. In all other cases this should be the date of the patient-provider interaction.')
-    visit_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: For inpatient visits the end date is typically the discharge date.  If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_date, then set the visit_end_date to the date of the data pull. | ETLCONVENTIONS: Visit end dates are mandatory. If end dates are not provided in the source there are three ways in which to derive them:\n- Outpatient Visit: visit_end_datetime = visit_start_datetime\n- Emergency Room Visit: visit_end_datetime = visit_start_datetime\n- Inpatient Visit: Usually there is information about discharge. If not, you should be able to derive the end date from the sudden decline of activity or from the absence of inpatient procedures/drugs.\n- Non-hospital institution Visits: Particularly for claims data, if end dates are not provided assume the visit is for the duration of month that it occurs.\nFor Inpatient Visits ongoing at the date of ETL, put date of processing the data into visit_end_datetime and visit_type_concept_id with 32220 "Still patient" to identify the visit as incomplete.\n- All other Visits: visit_end_datetime = visit_start_datetime. If this is a one-day visit the end date should match the start date.')
-    visit_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to understand the provenance of the visit record, or where the record comes from. | ETLCONVENTIONS: Populate this field based on the provenance of the visit record, as in whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    visit_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If no time is given for the start date of a visit, set it to midnight (00:00:0000).')
-    visit_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_datetime, then set the visit_end_datetime to the datetime of the data pull. | ETLCONVENTIONS: If no time is given for the end date of a visit, set it to midnight (00:00:0000).')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: There will only be one provider per visit record and the ETL document should clearly state how they were chosen (attending, admitting, etc.). If there are multiple providers associated with a visit in the source, this can be reflected in the event tables (CONDITION_OCCURRENCE, PROCEDURE_OCCURRENCE, etc.) or in the VISIT_DETAIL table. | ETLCONVENTIONS: If there are multiple providers associated with a visit, you will need to choose which one to put here. The additional providers can be stored in the [VISIT_DETAIL](https://ohdsi.github.io/CommonDataModel/cdm531.html#visit_detail) table.')
-    care_site_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field provides information about the Care Site where the Visit took place. | ETLCONVENTIONS: There should only be one Care Site associated with a Visit.')
-    visit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the kind of visit that took place (inpatient, outpatient, emergency, etc.) | ETLCONVENTIONS: If there is information about the kind of visit in the source data that value should be stored here. If a visit is an amalgamation of visits from the source then use a hierarchy to choose the visit source value, such as IP -> ER-> OP. This should line up with the logic chosen to determine how visits are created.')
-    visit_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the visit source value is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    admitted_from_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to determine where the patient was admitted from. This concept is part of the visit domain and can indicate if a patient was admitted to the hospital from a long-term care facility, for example. | ETLCONVENTIONS: If available, map the admitted_from_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=). If a person was admitted from home, set this to 0.')
-    admitted_from_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was admitted from. Typically this applies only to visits that have a length of stay, like inpatient visits or long-term care visits.')
-    discharged_to_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to determine where the patient was discharged to after a visit. This concept is part of the visit domain and can indicate if a patient was transferred to another hospital or sent to a long-term care facility, for example.  It is assumed that a person is discharged to home therefore there is not a standard concept id for "home".  Use concept id = 0 when a person is discharged to home. | ETLCONVENTIONS: If available, map the discharged_to_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).')
-    discharged_to_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was discharged to after a visit, as in they went home or were moved to long-term care. Typically this applies only to visits that have a length of stay of a day or more.')
-    preceding_visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to find the visit that occurred for the person prior to the given visit. There could be a few days or a few years in between. | ETLCONVENTIONS: This field can be used to link a visit immediately preceding the current visit. Note this is not symmetrical, and there is no such thing as a "following_visit_id".')
-
-    admitted_from_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[admitted_from_concept_id])
-    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='visit_occurrences')
-    discharged_to_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[discharged_to_concept_id])
-    person: Mapped['Person'] = relationship('Person', back_populates='visit_occurrences')
-    preceding_visit_occurrence: Mapped['VisitOccurrence'] = relationship('VisitOccurrence', remote_side=[visit_occurrence_id])
-    provider: Mapped['Provider'] = relationship('Provider', back_populates='visit_occurrences')
-    visit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_concept_id])
-    visit_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_source_concept_id])
-    visit_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_type_concept_id])
-    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='visit_occurrence')
-    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='visit_occurrence')
-    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='visit_occurrence')
-    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='visit_occurrence')
-    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='visit_occurrence')
-    notes: Mapped[List['Note']] = relationship('Note', back_populates='visit_occurrence')
-    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='visit_occurrence')
-    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='visit_occurrence')
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    visit_occurrence_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: Use this to identify unique interactions between a person and the health care system. This identifier links across the other CDM event tables to associate events with a visit. | ETLCONVENTIONS: This should be populated by creating a unique identifier for each unique interaction between a person and the healthcare system where the person receives a medical good or service over a span of time.'))
+    person_id: Mapped[int] = mapped_column(_Integer)
+    visit_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field contains a concept id representing the kind of visit, like inpatient or outpatient. All concepts in this field should be standard and belong to the Visit domain. | ETLCONVENTIONS: Populate this field based on the kind of visit that took place for the person. For example this could be "Inpatient Visit", "Outpatient Visit", "Ambulatory Visit", etc. This table will contain standard concepts in the Visit domain. These concepts are arranged in a hierarchical structure to facilitate cohort definitions by rolling up to generally familiar Visits adopted in most healthcare systems worldwide. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    visit_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: For inpatient visits, the start date is typically the admission date. For outpatient visits the start date and end date will be the same. | ETLCONVENTIONS: When populating VISIT_START_DATE, you should think about the patient experience to make decisions on how to define visits. In the case of an inpatient visit this should be the date the patient was admitted to the hospital or institution. In all other cases this should be the date of the patient-provider interaction.'))
+    visit_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: For inpatient visits the end date is typically the discharge date.  If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_date, then set the visit_end_date to the date of the data pull. | ETLCONVENTIONS: Visit end dates are mandatory. If end dates are not provided in the source there are three ways in which to derive them:\n- Outpatient Visit: visit_end_datetime = visit_start_datetime\n- Emergency Room Visit: visit_end_datetime = visit_start_datetime\n- Inpatient Visit: Usually there is information about discharge. If not, you should be able to derive the end date from the sudden decline of activity or from the absence of inpatient procedures/drugs.\n- Non-hospital institution Visits: Particularly for claims data, if end dates are not provided assume the visit is for the duration of month that it occurs.\nFor Inpatient Visits ongoing at the date of ETL, put date of processing the data into visit_end_datetime and visit_type_concept_id with 32220 "Still patient" to identify the visit as incomplete.\n- All other Visits: visit_end_datetime = visit_start_datetime. If this is a one-day visit the end date should match the start date.'))
+    visit_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to understand the provenance of the visit record, or where the record comes from. | ETLCONVENTIONS: Populate this field based on the provenance of the visit record, as in whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    visit_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_VISIT_START_MIDNIGHT))
+    visit_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_VISIT_END_MIDNIGHT))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: There will only be one provider per visit record and the ETL document should clearly state how they were chosen (attending, admitting, etc.). If there are multiple providers associated with a visit in the source, this can be reflected in the event tables (CONDITION_OCCURRENCE, PROCEDURE_OCCURRENCE, etc.) or in the VISIT_DETAIL table. | ETLCONVENTIONS: If there are multiple providers associated with a visit, you will need to choose which one to put here. The additional providers can be stored in the [VISIT_DETAIL](https://ohdsi.github.io/CommonDataModel/cdm531.html#visit_detail) table.'))
+    care_site_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field provides information about the Care Site where the Visit took place. | ETLCONVENTIONS: There should only be one Care Site associated with a Visit.'))
+    visit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the kind of visit that took place (inpatient, outpatient, emergency, etc.) | ETLCONVENTIONS: If there is information about the kind of visit in the source data that value should be stored here. If a visit is an amalgamation of visits from the source then use a hierarchy to choose the visit source value, such as IP -> ER-> OP. This should line up with the logic chosen to determine how visits are created.'))
+    visit_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the visit source value is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    admitted_from_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to determine where the patient was admitted from. This concept is part of the visit domain and can indicate if a patient was admitted to the hospital from a long-term care facility, for example. | ETLCONVENTIONS: If available, map the admitted_from_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=). If a person was admitted from home, set this to 0.'))
+    admitted_from_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(_COMMENT_ADMITTED_FROM))
+    discharged_to_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to determine where the patient was discharged to after a visit. This concept is part of the visit domain and can indicate if a patient was transferred to another hospital or sent to a long-term care facility, for example.  It is assumed that a person is discharged to home therefore there is not a standard concept id for "home".  Use concept id = 0 when a person is discharged to home. | ETLCONVENTIONS: If available, map the discharged_to_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    discharged_to_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(_COMMENT_DISCHARGED_TO))
+    preceding_visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to find the visit that occurred for the person prior to the given visit. There could be a few days or a few years in between. | ETLCONVENTIONS: This field can be used to link a visit immediately preceding the current visit. Note this is not symmetrical, and there is no such thing as a "following_visit_id".'))
+
+    admitted_from_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[admitted_from_concept_id], lazy='raise_on_sql')
+    care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='visit_occurrences', lazy='raise_on_sql')
+    discharged_to_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[discharged_to_concept_id], lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='visit_occurrences', lazy='raise_on_sql')
+    preceding_visit_occurrence: Mapped['VisitOccurrence'] = relationship('VisitOccurrence', remote_side=[visit_occurrence_id], lazy='raise_on_sql')
+    provider: Mapped['Provider'] = relationship('Provider', back_populates='visit_occurrences', lazy='raise_on_sql')
+    visit_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_concept_id], lazy='raise_on_sql')
+    visit_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_source_concept_id], lazy='raise_on_sql')
+    visit_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[visit_type_concept_id], lazy='raise_on_sql')
+    visit_details: Mapped[List['VisitDetail']] = relationship('VisitDetail', back_populates='visit_occurrence', lazy='raise_on_sql')
+    condition_occurrences: Mapped[List['ConditionOccurrence']] = relationship('ConditionOccurrence', back_populates='visit_occurrence', lazy='raise_on_sql')
+    device_exposures: Mapped[List['DeviceExposure']] = relationship('DeviceExposure', back_populates='visit_occurrence', lazy='raise_on_sql')
+    drug_exposures: Mapped[List['DrugExposure']] = relationship('DrugExposure', back_populates='visit_occurrence', lazy='raise_on_sql')
+    measurements: Mapped[List['Measurement']] = relationship('Measurement', back_populates='visit_occurrence', lazy='raise_on_sql')
+    notes: Mapped[List['Note']] = relationship('Note', back_populates='visit_occurrence', lazy='raise_on_sql')
+    observations: Mapped[List['Observation']] = relationship('Observation', back_populates='visit_occurrence', lazy='raise_on_sql')
+    procedure_occurrences: Mapped[List['ProcedureOccurrence']] = relationship('ProcedureOccurrence', back_populates='visit_occurrence', lazy='raise_on_sql')
 
 
 class EpisodeEvent(Base):
@@ -1322,7 +1398,7 @@ class EpisodeEvent(Base):
     __table_args__ = (
         ForeignKeyConstraint(['episode_event_field_concept_id'], ['concept.concept_id'], name='fpk_episode_event_episode_event_field_concept_id'),
         ForeignKeyConstraint(['episode_id'], ['episode.episode_id'], name='fpk_episode_event_episode_id'),
-        {'comment': 'DESC: The EPISODE_EVENT table connects qualifying clinical events '
+        {'comment': _ddl_comment('DESC: The EPISODE_EVENT table connects qualifying clinical events '
                 '(such as CONDITION_OCCURRENCE, DRUG_EXPOSURE, '
                 'PROCEDURE_OCCURRENCE, MEASUREMENT) to the appropriate EPISODE '
                 'entry. For example, linking the precise location of the '
@@ -1331,12 +1407,12 @@ class EpisodeEvent(Base):
                 'of the FACT_RELATIONSHIP table for linking low-level events to '
                 'abstracted Episodes. | ETL CONVENTIONS: Some episodes may not '
                 'have links to any underlying clinical events. For such episodes, '
-                'the EPISODE_EVENT table is not populated.'}
+                'the EPISODE_EVENT table is not populated.')}
     )
     __mapper_args__ = {"primary_key": ['episode_id', 'event_id', 'episode_event_field_concept_id']}
-    episode_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to link the EPISODE_EVENT record to its EPISODE. | ETLCONVENTIONS: Put the EPISODE_ID that subsumes the EPISODE_EVENT record here.')
-    event_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field is the primary key of the linked record in the database. For example, if the Episode Event is a Condition Occurrence, then the CONDITION_OCCURRENCE_ID of the linked record goes in this field.  | ETLCONVENTIONS: Put the primary key of the linked record here. ')
-    episode_event_field_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the EVENT_ID came from. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?vocabulary=CDM&conceptClass=Field&page=1&pageSize=15&query=)')
+    episode_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to link the EPISODE_EVENT record to its EPISODE. | ETLCONVENTIONS: Put the EPISODE_ID that subsumes the EPISODE_EVENT record here.'))
+    event_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field is the primary key of the linked record in the database. For example, if the Episode Event is a Condition Occurrence, then the CONDITION_OCCURRENCE_ID of the linked record goes in this field.  | ETLCONVENTIONS: Put the primary key of the linked record here. '))
+    episode_event_field_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the EVENT_ID came from. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?vocabulary=CDM&conceptClass=Field&page=1&pageSize=15&query=)'))
 
     episode_event_field_concept: Mapped['Concept'] = relationship('Concept')
     episode: Mapped['Episode'] = relationship('Episode', back_populates='episode_events')
@@ -1358,9 +1434,9 @@ class VisitDetail(Base):
         ForeignKeyConstraint(['visit_occurrence_id'], ['visit_occurrence.visit_occurrence_id'], name='fpk_visit_detail_visit_occurrence_id'),
         PrimaryKeyConstraint('visit_detail_id', name='xpk_visit_detail'),
         Index('idx_visit_det_concept_id_1', 'visit_detail_concept_id'),
-        Index('idx_visit_det_occ_id', 'visit_occurrence_id'),
+        Index('idx_visit_det_occ_person', 'visit_occurrence_id', 'person_id'),
         Index('idx_visit_det_person_id_1', 'person_id'),
-        {'comment': 'DESC: The VISIT_DETAIL table is an optional table used to '
+        {'comment': _ddl_comment('DESC: The VISIT_DETAIL table is an optional table used to '
                 'represents details of each record in the parent VISIT_OCCURRENCE '
                 'table. A good example of this would be the movement between units '
                 'in a hospital during an inpatient stay or claim lines associated '
@@ -1394,28 +1470,31 @@ class VisitDetail(Base):
                 '[9201](https://athena.ohdsi.org/search-terms/terms/9201) and the '
                 'VISIT_DETAIL_CONCEPT_IDs either to 9201 or its children to '
                 'indicate where the patient was in the hospital at the time of '
-                'care.'}
+                'care.')}
     )
 
-    visit_detail_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: Use this to identify unique interactions between a person and the health care system. This identifier links across the other CDM event tables to associate events with a visit detail. | ETLCONVENTIONS: This should be populated by creating a unique identifier for each unique interaction between a person and the healthcare system where the person receives a medical good or service over a span of time.')
-    person_id: Mapped[int] = mapped_column(Integer)
-    visit_detail_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field contains a concept id representing the kind of visit detail, like inpatient or outpatient. All concepts in this field should be standard and belong to the Visit domain. | ETLCONVENTIONS: Populate this field based on the kind of visit that took place for the person. For example this could be "Inpatient Visit", "Outpatient Visit", "Ambulatory Visit", etc. This table will contain standard concepts in the Visit domain. These concepts are arranged in a hierarchical structure to facilitate cohort definitions by rolling up to generally familiar Visits adopted in most healthcare systems worldwide. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).')
-    visit_detail_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: This is the date of the start of the encounter. This may or may not be equal to the date of the Visit the Visit Detail is associated with. | ETLCONVENTIONS: When populating VISIT_DETAIL_START_DATE, you should think about the patient experience to make decisions on how to define visits. Most likely this should be the date of the patient-provider interaction.')
-    visit_detail_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: This the end date of the patient-provider interaction.  If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_date, then set the visit_end_date to the date of the data pull. | ETLCONVENTIONS: Visit Detail end dates are mandatory. If end dates are not provided in the source there are three ways in which to derive them:<br>\n- Outpatient Visit Detail: visit_detail_end_datetime = visit_detail_start_datetime\n- Emergency Room Visit Detail: visit_detail_end_datetime = visit_detail_start_datetime\n- Inpatient Visit Detail: Usually there is information about discharge. If not, you should be able to derive the end date from the sudden decline of activity or from the absence of inpatient procedures/drugs.\n- Non-hospital institution Visit Details: Particularly for claims data, if end dates are not provided assume the visit is for the duration of month that it occurs.<br>\nFor Inpatient Visit Details ongoing at the date of ETL, put date of processing the data into visit_detai_end_datetime and visit_detail_type_concept_id with 32220 "Still patient" to identify the visit as incomplete.\nAll other Visits Details: visit_detail_end_datetime = visit_detail_start_datetime. ')
-    visit_detail_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to understand the provenance of the visit detail record, or where the record comes from. | ETLCONVENTIONS: Populate this field based on the provenance of the visit detail record, as in whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    visit_occurrence_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to link the VISIT_DETAIL record to its VISIT_OCCURRENCE. | ETLCONVENTIONS: Put the VISIT_OCCURRENCE_ID that subsumes the VISIT_DETAIL record here.')
-    visit_detail_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If no time is given for the start date of a visit, set it to midnight (00:00:0000).')
-    visit_detail_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_datetime, then set the visit_end_datetime to the datetime of the data pull. | ETLCONVENTIONS: If no time is given for the end date of a visit, set it to midnight (00:00:0000).')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: There will only be one provider per  **visit** record and the ETL document should clearly state how they were chosen (attending, admitting, etc.). This is a typical reason for leveraging the VISIT_DETAIL table as even though each VISIT_DETAIL record can only have one provider, there is no limit to the number of VISIT_DETAIL records that can be associated to a VISIT_OCCURRENCE record. | ETLCONVENTIONS: The additional providers associated to a Visit can be stored in this table where each VISIT_DETAIL record represents a different provider.')
-    care_site_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field provides information about the Care Site where the Visit Detail took place. | ETLCONVENTIONS: There should only be one Care Site associated with a Visit Detail.')
-    visit_detail_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the kind of visit detail that took place (inpatient, outpatient, emergency, etc.) | ETLCONVENTIONS: If there is information about the kind of visit detail in the source data that value should be stored here. If a visit is an amalgamation of visits from the source then use a hierarchy to choose the VISIT_DETAIL_SOURCE_VALUE, such as IP -> ER-> OP. This should line up with the logic chosen to determine how visits are created.')
-    visit_detail_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: If the VISIT_DETAIL_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    admitted_from_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to determine where the patient was admitted from. This concept is part of the visit domain and can indicate if a patient was admitted to the hospital from a long-term care facility, for example. | ETLCONVENTIONS: If available, map the admitted_from_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=). If the person was admitted from home, set this to 0.')
-    admitted_from_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was admitted from. Typically this applies only to visits that have a length of stay, like inpatient visits or long-term care visits.')
-    discharged_to_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating where a person was discharged to after a visit, as in they went home or were moved to long-term care. Typically this applies only to visits that have a length of stay of a day or more.')
-    discharged_to_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to determine where the patient was discharged to after a visit. This concept is part of the visit domain and can indicate if a patient was transferred to another hospital or sent to a long-term care facility, for example.  It is assumed that a person is discharged to home therefore there is not a standard concept id for "home".  Use concept id = 0 when a person is discharged to home. | ETLCONVENTIONS: If available, map the DISCHARGE_TO_SOURCE_VALUE to a Standard Concept in the Visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).')
-    preceding_visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to find the visit detail that occurred for the person prior to the given visit detail record. There could be a few days or a few years in between. | ETLCONVENTIONS: The PRECEDING_VISIT_DETAIL_ID can be used to link a visit immediately preceding the current Visit Detail. Note this is not symmetrical, and there is no such thing as a "following_visit_id".')
-    parent_visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: Use this field to find the visit detail that subsumes the given visit detail record. This is used in the case that a visit detail record needs to be nested beyond the VISIT_OCCURRENCE/VISIT_DETAIL relationship. | ETLCONVENTIONS: If there are multiple nested levels to how Visits are represented in the source, the VISIT_DETAIL_PARENT_ID can be used to record this relationship. ')
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    visit_detail_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: Use this to identify unique interactions between a person and the health care system. This identifier links across the other CDM event tables to associate events with a visit detail. | ETLCONVENTIONS: This should be populated by creating a unique identifier for each unique interaction between a person and the healthcare system where the person receives a medical good or service over a span of time.'))
+    person_id: Mapped[int] = mapped_column(_Integer)
+    visit_detail_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field contains a concept id representing the kind of visit detail, like inpatient or outpatient. All concepts in this field should be standard and belong to the Visit domain. | ETLCONVENTIONS: Populate this field based on the kind of visit that took place for the person. For example this could be "Inpatient Visit", "Outpatient Visit", "Ambulatory Visit", etc. This table will contain standard concepts in the Visit domain. These concepts are arranged in a hierarchical structure to facilitate cohort definitions by rolling up to generally familiar Visits adopted in most healthcare systems worldwide. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    visit_detail_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: This is the date of the start of the encounter. This may or may not be equal to the date of the Visit the Visit Detail is associated with. | ETLCONVENTIONS: When populating VISIT_DETAIL_START_DATE, you should think about the patient experience to make decisions on how to define visits. Most likely this should be the date of the patient-provider interaction.'))
+    visit_detail_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: This the end date of the patient-provider interaction.  If a Person is still an inpatient in the hospital at the time of the data extract and does not have a visit_end_date, then set the visit_end_date to the date of the data pull. | ETLCONVENTIONS: Visit Detail end dates are mandatory. If end dates are not provided in the source there are three ways in which to derive them:<br>\n- Outpatient Visit Detail: visit_detail_end_datetime = visit_detail_start_datetime\n- Emergency Room Visit Detail: visit_detail_end_datetime = visit_detail_start_datetime\n- Inpatient Visit Detail: Usually there is information about discharge. If not, you should be able to derive the end date from the sudden decline of activity or from the absence of inpatient procedures/drugs.\n- Non-hospital institution Visit Details: Particularly for claims data, if end dates are not provided assume the visit is for the duration of month that it occurs.<br>\nFor Inpatient Visit Details ongoing at the date of ETL, put date of processing the data into visit_detai_end_datetime and visit_detail_type_concept_id with 32220 "Still patient" to identify the visit as incomplete.\nAll other Visits Details: visit_detail_end_datetime = visit_detail_start_datetime. '))
+    visit_detail_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to understand the provenance of the visit detail record, or where the record comes from. | ETLCONVENTIONS: Populate this field based on the provenance of the visit detail record, as in whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    visit_occurrence_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to link the VISIT_DETAIL record to its VISIT_OCCURRENCE. | ETLCONVENTIONS: Put the VISIT_OCCURRENCE_ID that subsumes the VISIT_DETAIL record here.'))
+    visit_detail_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_VISIT_START_MIDNIGHT))
+    visit_detail_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_VISIT_END_MIDNIGHT))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: There will only be one provider per  **visit** record and the ETL document should clearly state how they were chosen (attending, admitting, etc.). This is a typical reason for leveraging the VISIT_DETAIL table as even though each VISIT_DETAIL record can only have one provider, there is no limit to the number of VISIT_DETAIL records that can be associated to a VISIT_OCCURRENCE record. | ETLCONVENTIONS: The additional providers associated to a Visit can be stored in this table where each VISIT_DETAIL record represents a different provider.'))
+    care_site_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field provides information about the Care Site where the Visit Detail took place. | ETLCONVENTIONS: There should only be one Care Site associated with a Visit Detail.'))
+    visit_detail_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the kind of visit detail that took place (inpatient, outpatient, emergency, etc.) | ETLCONVENTIONS: If there is information about the kind of visit detail in the source data that value should be stored here. If a visit is an amalgamation of visits from the source then use a hierarchy to choose the VISIT_DETAIL_SOURCE_VALUE, such as IP -> ER-> OP. This should line up with the logic chosen to determine how visits are created.'))
+    visit_detail_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: If the VISIT_DETAIL_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    admitted_from_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to determine where the patient was admitted from. This concept is part of the visit domain and can indicate if a patient was admitted to the hospital from a long-term care facility, for example. | ETLCONVENTIONS: If available, map the admitted_from_source_value to a standard concept in the visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=). If the person was admitted from home, set this to 0.'))
+    admitted_from_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(_COMMENT_ADMITTED_FROM))
+    discharged_to_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(_COMMENT_DISCHARGED_TO))
+    discharged_to_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to determine where the patient was discharged to after a visit. This concept is part of the visit domain and can indicate if a patient was transferred to another hospital or sent to a long-term care facility, for example.  It is assumed that a person is discharged to home therefore there is not a standard concept id for "home".  Use concept id = 0 when a person is discharged to home. | ETLCONVENTIONS: If available, map the DISCHARGE_TO_SOURCE_VALUE to a Standard Concept in the Visit domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Visit&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    preceding_visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to find the visit detail that occurred for the person prior to the given visit detail record. There could be a few days or a few years in between. | ETLCONVENTIONS: The PRECEDING_VISIT_DETAIL_ID can be used to link a visit immediately preceding the current Visit Detail. Note this is not symmetrical, and there is no such thing as a "following_visit_id".'))
+    parent_visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: Use this field to find the visit detail that subsumes the given visit detail record. This is used in the case that a visit detail record needs to be nested beyond the VISIT_OCCURRENCE/VISIT_DETAIL relationship. | ETLCONVENTIONS: If there are multiple nested levels to how Visits are represented in the source, the VISIT_DETAIL_PARENT_ID can be used to record this relationship. '))
 
     admitted_from_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[admitted_from_concept_id])
     care_site: Mapped['CareSite'] = relationship('CareSite', back_populates='visit_details')
@@ -1452,7 +1531,7 @@ class ConditionOccurrence(Base):
         Index('idx_condition_concept_id_1', 'condition_concept_id'),
         Index('idx_condition_person_id_1', 'person_id'),
         Index('idx_condition_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: This table contains records of Events of a Person '
+        {'comment': _ddl_comment('DESC: This table contains records of Events of a Person '
                 'suggesting the presence of a disease or medical condition stated '
                 'as a diagnosis, a sign, or a symptom, which is either observed by '
                 'a Provider or reported by the patient.  | USER GUIDANCE: '
@@ -1489,25 +1568,25 @@ class ConditionOccurrence(Base):
                 'table, if they are used for analyses. However, this information '
                 'is not always available. | ETL CONVENTIONS: Source codes and '
                 'source text fields mapped to Standard Concepts of the Condition '
-                'Domain have to be recorded here. '}
+                'Domain have to be recorded here. ')}
     )
 
-    condition_occurrence_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to a condition record for a person. Refer to the ETL for how duplicate conditions during the same visit were handled. | ETLCONVENTIONS: Each instance of a condition present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same condition within the same visit. It is valid to keep these duplicates and assign them individual, unique, CONDITION_OCCURRENCE_IDs, though it is up to the ETL how they should be handled.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the PERSON for whom the condition is recorded.')
-    condition_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The CONDITION_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source value which represents a condition | ETLCONVENTIONS: The CONCEPT_ID that the CONDITION_SOURCE_VALUE maps to. Only records whose source values map to concepts with a domain of "Condition" should go in this table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Condition&standardConcept=Standard&page=1&pageSize=15&query=).')
-    condition_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the start date of the condition | ETLCONVENTIONS: Most often data sources do not have the idea of a start date for a condition. Rather, if a source only has one date associated with a condition record it is acceptable to use that date for both the CONDITION_START_DATE and the CONDITION_END_DATE.')
-    condition_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Condition record, as in whether the condition was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the CONDITION_TYPE_CONCEPT_ID that best represents the provenance of the record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    condition_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    condition_end_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the end date of the condition | ETLCONVENTIONS: Most often data sources do not have the idea of a start date for a condition. Rather, if a source only has one date associated with a condition record it is acceptable to use that date for both the CONDITION_START_DATE and the CONDITION_END_DATE.')
-    condition_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    condition_status_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This concept represents the point during the visit the diagnosis was given (admitting diagnosis, final diagnosis), whether the diagnosis was determined due to laboratory findings, if the diagnosis was exclusionary, or if it was a preliminary diagnosis, among others.  | ETLCONVENTIONS: Choose the Concept in the Condition Status domain that best represents the point during the visit when the diagnosis was given. These can include admitting diagnosis, principal diagnosis, and secondary diagnosis. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Condition+Status&standardConcept=Standard&page=1&pageSize=15&query=).')
-    stop_reason: Mapped[Optional[str]] = mapped_column(String(20), comment='USER GUIDANCE: The Stop Reason indicates why a Condition is no longer valid with respect to the purpose within the source data. Note that a Stop Reason does not necessarily imply that the condition is no longer occurring. | ETLCONVENTIONS: This information is often not populated in source data and it is a valid etl choice to leave it blank if the information does not exist.')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The provider associated with condition record, e.g. the provider who made the diagnosis or the provider who recorded the symptom. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the admitting vs attending physician on an EHR record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The visit during which the condition occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a CONDITION_START_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the Visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the CONDITION_OCCURRENCE record.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The VISIT_DETAIL record during which the condition occurred. For example, if the person was in the ICU at the time of the diagnosis the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.')
-    condition_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the condition that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    condition_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the condition source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Condition necessary for a given analytic use case. Consider using CONDITION_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the CONDITION_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    condition_status_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the condition status. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating when and how a diagnosis was given to a patient. This source value is mapped to a standard concept which is stored in the CONDITION_STATUS_CONCEPT_ID field.')
+    condition_occurrence_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to a condition record for a person. Refer to the ETL for how duplicate conditions during the same visit were handled. | ETLCONVENTIONS: Each instance of a condition present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same condition within the same visit. It is valid to keep these duplicates and assign them individual, unique, CONDITION_OCCURRENCE_IDs, though it is up to the ETL how they should be handled.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the PERSON for whom the condition is recorded.'))
+    condition_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The CONDITION_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source value which represents a condition | ETLCONVENTIONS: The CONCEPT_ID that the CONDITION_SOURCE_VALUE maps to. Only records whose source values map to concepts with a domain of "Condition" should go in this table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Condition&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    condition_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the start date of the condition | ETLCONVENTIONS: Most often data sources do not have the idea of a start date for a condition. Rather, if a source only has one date associated with a condition record it is acceptable to use that date for both the CONDITION_START_DATE and the CONDITION_END_DATE.'))
+    condition_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Condition record, as in whether the condition was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the CONDITION_TYPE_CONCEPT_ID that best represents the provenance of the record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    condition_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_MIDNIGHT))
+    condition_end_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the end date of the condition | ETLCONVENTIONS: Most often data sources do not have the idea of a start date for a condition. Rather, if a source only has one date associated with a condition record it is acceptable to use that date for both the CONDITION_START_DATE and the CONDITION_END_DATE.'))
+    condition_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_MIDNIGHT))
+    condition_status_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This concept represents the point during the visit the diagnosis was given (admitting diagnosis, final diagnosis), whether the diagnosis was determined due to laboratory findings, if the diagnosis was exclusionary, or if it was a preliminary diagnosis, among others.  | ETLCONVENTIONS: Choose the Concept in the Condition Status domain that best represents the point during the visit when the diagnosis was given. These can include admitting diagnosis, principal diagnosis, and secondary diagnosis. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Condition+Status&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    stop_reason: Mapped[Optional[str]] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The Stop Reason indicates why a Condition is no longer valid with respect to the purpose within the source data. Note that a Stop Reason does not necessarily imply that the condition is no longer occurring. | ETLCONVENTIONS: This information is often not populated in source data and it is a valid etl choice to leave it blank if the information does not exist.'))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The provider associated with condition record, e.g. the provider who made the diagnosis or the provider who recorded the symptom. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the admitting vs attending physician on an EHR record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The visit during which the condition occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a CONDITION_START_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the Visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the CONDITION_OCCURRENCE record.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The VISIT_DETAIL record during which the condition occurred. For example, if the person was in the ICU at the time of the diagnosis the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.'))
+    condition_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the condition that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    condition_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the condition source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Condition necessary for a given analytic use case. Consider using CONDITION_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the CONDITION_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    condition_status_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the condition status. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating when and how a diagnosis was given to a patient. This source value is mapped to a standard concept which is stored in the CONDITION_STATUS_CONCEPT_ID field.'))
 
     condition_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[condition_concept_id])
     condition_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[condition_source_concept_id])
@@ -1535,7 +1614,7 @@ class DeviceExposure(Base):
         Index('idx_device_concept_id_1', 'device_concept_id'),
         Index('idx_device_person_id_1', 'person_id'),
         Index('idx_device_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: The Device domain captures information about a person"s '
+        {'comment': _ddl_comment('DESC: The Device domain captures information about a person"s '
                 'exposure to a foreign physical object or instrument which is used '
                 'for diagnostic or therapeutic purposes through a mechanism beyond '
                 'chemical action. Devices include implantable objects (e.g. '
@@ -1548,28 +1627,28 @@ class DeviceExposure(Base):
                 'sometimes blurry, but the former are physical objects while the '
                 'latter are actions, often to apply a Device or supply. | ETL '
                 'CONVENTIONS: Source codes and source text fields mapped to '
-                'Standard Concepts of the Device Domain have to be recorded here. '}
+                'Standard Concepts of the Device Domain have to be recorded here. ')}
     )
 
-    device_exposure_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to records a person"s exposure to a foreign physical object or instrument. | ETLCONVENTIONS: Each instance of an exposure to a foreign object or device present in the source data should be assigned this unique key. ')
-    person_id: Mapped[int] = mapped_column(Integer)
-    device_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The DEVICE_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source concept id which represents a foreign object or instrument the person was exposed to.  | ETLCONVENTIONS: The CONCEPT_ID that the DEVICE_SOURCE_VALUE maps to. ')
-    device_exposure_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the start date of the device record. | ETLCONVENTIONS: Valid entries include a start date of a procedure to implant a device, the date of a prescription for a device, or the date of device administration. ')
-    device_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: You can use the TYPE_CONCEPT_ID to denote the provenance of the record, as in whether the record is from administrative claims or EHR.  | ETLCONVENTIONS: Choose the drug_type_concept_id that best represents the provenance of the record, for example whether it came from a record of a prescription written or physician administered drug. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    device_exposure_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: This is not required, though it is in v6. If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    device_exposure_end_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: The DEVICE_EXPOSURE_END_DATE denotes the day the device exposure ended for the patient, if given. | ETLCONVENTIONS: Put the end date or discontinuation date as it appears from the source data or leave blank if unavailable.')
-    device_exposure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    unique_device_id: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: This is the Unique Device Identification (UDI-DI) number for devices regulated by the FDA, if given.  | ETLCONVENTIONS: For medical devices that are regulated by the FDA, a Unique Device Identification (UDI) is provided if available in the data source and is recorded in the UNIQUE_DEVICE_ID field.')
-    production_id: Mapped[Optional[str]] = mapped_column(String(255), comment='USER GUIDANCE: This is the Production Identifier (UDI-PI) portion of the Unique Device Identification.')
-    quantity: Mapped[Optional[int]] = mapped_column(Integer)
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Provider associated with device record, e.g. the provider who wrote the prescription or the provider who implanted the device. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Visit during which the device was prescribed or given. | ETLCONVENTIONS: To populate this field device exposures must be explicitly initiated in the visit.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Visit Detail during which the device was prescribed or given. | ETLCONVENTIONS: To populate this field device exposures must be explicitly initiated in the visit detail record.')
-    device_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the device exposure that occurred. For example, this could be an NDC or Gemscript code. | ETLCONVENTIONS: This code is mapped to a Standard Device Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    device_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the device source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Device necessary for a given analytic use case. Consider using DEVICE_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the DEVICE_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data.  | ETLCONVENTIONS: There is no standardization requirement for units associated with DEVICE_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit. If there is no unit associated with a Device record, set to NULL.')
-    unit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Device. For example, blood transfusions are considered devices and can be given in mL quantities.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference. Using the blood transfusion example, blood transfusion is represented by the DEVICE_CONCEPT_ID and the unit (mL) would be housed in the UNIT_SOURCE_VALUE and mapped to a standard concept in the unit domain. ')
-    unit_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the UNIT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Unit necessary for a given analytic use case. Consider using UNIT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the UNIT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here. ')
+    device_exposure_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to records a person"s exposure to a foreign physical object or instrument. | ETLCONVENTIONS: Each instance of an exposure to a foreign object or device present in the source data should be assigned this unique key. '))
+    person_id: Mapped[int] = mapped_column(_Integer)
+    device_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The DEVICE_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source concept id which represents a foreign object or instrument the person was exposed to.  | ETLCONVENTIONS: The CONCEPT_ID that the DEVICE_SOURCE_VALUE maps to. '))
+    device_exposure_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the start date of the device record. | ETLCONVENTIONS: Valid entries include a start date of a procedure to implant a device, the date of a prescription for a device, or the date of device administration. '))
+    device_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: You can use the TYPE_CONCEPT_ID to denote the provenance of the record, as in whether the record is from administrative claims or EHR.  | ETLCONVENTIONS: Choose the drug_type_concept_id that best represents the provenance of the record, for example whether it came from a record of a prescription written or physician administered drug. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    device_exposure_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_NOT_REQUIRED_V6))
+    device_exposure_end_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The DEVICE_EXPOSURE_END_DATE denotes the day the device exposure ended for the patient, if given. | ETLCONVENTIONS: Put the end date or discontinuation date as it appears from the source data or leave blank if unavailable.'))
+    device_exposure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_MIDNIGHT))
+    unique_device_id: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: This is the Unique Device Identification (UDI-DI) number for devices regulated by the FDA, if given.  | ETLCONVENTIONS: For medical devices that are regulated by the FDA, a Unique Device Identification (UDI) is provided if available in the data source and is recorded in the UNIQUE_DEVICE_ID field.'))
+    production_id: Mapped[Optional[str]] = mapped_column(_String(255), comment=_ddl_comment('USER GUIDANCE: This is the Production Identifier (UDI-PI) portion of the Unique Device Identification.'))
+    quantity: Mapped[Optional[int]] = mapped_column(_Integer)
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Provider associated with device record, e.g. the provider who wrote the prescription or the provider who implanted the device. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Visit during which the device was prescribed or given. | ETLCONVENTIONS: To populate this field device exposures must be explicitly initiated in the visit.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Visit Detail during which the device was prescribed or given. | ETLCONVENTIONS: To populate this field device exposures must be explicitly initiated in the visit detail record.'))
+    device_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the device exposure that occurred. For example, this could be an NDC or Gemscript code. | ETLCONVENTIONS: This code is mapped to a Standard Device Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    device_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the device source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Device necessary for a given analytic use case. Consider using DEVICE_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the DEVICE_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data.  | ETLCONVENTIONS: There is no standardization requirement for units associated with DEVICE_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit. If there is no unit associated with a Device record, set to NULL.'))
+    unit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Device. For example, blood transfusions are considered devices and can be given in mL quantities.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference. Using the blood transfusion example, blood transfusion is represented by the DEVICE_CONCEPT_ID and the unit (mL) would be housed in the UNIT_SOURCE_VALUE and mapped to a standard concept in the unit domain. '))
+    unit_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the UNIT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Unit necessary for a given analytic use case. Consider using UNIT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the UNIT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here. '))
 
     device_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[device_concept_id])
     device_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[device_source_concept_id])
@@ -1597,7 +1676,7 @@ class DrugExposure(Base):
         Index('idx_drug_concept_id_1', 'drug_concept_id'),
         Index('idx_drug_person_id_1', 'person_id'),
         Index('idx_drug_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: This table captures records about the exposure to a Drug '
+        {'comment': _ddl_comment('DESC: This table captures records about the exposure to a Drug '
                 'ingested or otherwise introduced into the body. A Drug is a '
                 'biochemical substance formulated in such a way that when '
                 'administered to a Person it will exert a certain biochemical '
@@ -1625,32 +1704,32 @@ class DrugExposure(Base):
                 'multiple records on the same day for the same drug or procedures '
                 'the ETL should not de-dupe them unless there is probable reason '
                 'to believe the item is a true data duplicate. Take note on how to '
-                'handle refills for prescriptions written.'}
+                'handle refills for prescriptions written.')}
     )
 
-    drug_exposure_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to records of drug dispensings or administrations for a person. Refer to the ETL for how duplicate drugs during the same visit were handled. | ETLCONVENTIONS: Each instance of a drug dispensing or administration present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same drug within the same visit. It is valid to keep these duplicates and assign them individual, unique, DRUG_EXPOSURE_IDs, though it is up to the ETL how they should be handled.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the PERSON for whom the drug dispensing or administration is recorded. This may be a system generated code.')
-    drug_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The DRUG_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source concept id which represents a drug product or molecule otherwise introduced to the body. The drug concepts can have a varying degree of information about drug strength and dose. This information is relevant in the context of quantity and administration information in the subsequent fields plus strength information from the DRUG_STRENGTH table, provided as part of the standard vocabulary download. | ETLCONVENTIONS: The CONCEPT_ID that the DRUG_SOURCE_VALUE maps to. The concept id should be derived either from mapping from the source concept id or by picking the drug concept representing the most amount of detail you have. Records whose source values map to standard concepts with a domain of Drug should go in this table. When the Drug Source Value of the code cannot be translated into Standard Drug Concept IDs, a Drug exposure entry is stored with only the corresponding SOURCE_CONCEPT_ID and DRUG_SOURCE_VALUE and a DRUG_CONCEPT_ID of 0. The Drug Concept with the most detailed content of information is preferred during the mapping process. These are indicated in the CONCEPT_CLASS_ID field of the Concept and are recorded in the following order of precedence: "Branded Pack", "Clinical Pack", "Branded Drug", "Clinical Drug", "Branded Drug Component", "Clinical Drug Component", "Branded Drug Form", "Clinical Drug Form", and only if no other information is available "Ingredient". Note: If only the drug class is known, the DRUG_CONCEPT_ID field should contain 0. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Drug&standardConcept=Standard&page=1&pageSize=15&query=).')
-    drug_exposure_start_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the start date of the drug record. | ETLCONVENTIONS: Valid entries include a start date of a prescription, the date a prescription was filled, or the date on which a Drug administration was recorded. It is a valid ETL choice to use the date the drug was ordered as the DRUG_EXPOSURE_START_DATE.')
-    drug_exposure_end_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The DRUG_EXPOSURE_END_DATE denotes the day the drug exposure ended for the patient. | ETLCONVENTIONS: If this information is not explicitly available in the data, infer the end date using the following methods:<br><br> 1. Start first with duration or days supply using the calculation drug start date + days supply -1 day. 2. Use quantity divided by daily dose that you may obtain from the sig or a source field (or assumed daily dose of 1) for solid, indivisibile, drug products. If quantity represents ingredient amount, quantity divided by daily dose * concentration (from drug_strength) drug concept id tells you the dose form. 3. If it is an administration record, set drug end date equal to drug start date. If the record is a written prescription then set end date to start date + 29. If the record is a mail-order prescription set end date to start date + 89. The end date must be equal to or greater than the start date. Ibuprofen 20mg/mL oral solution concept tells us this is oral solution. Calculate duration as quantity (200 example) * daily dose (5mL) /concentration (20mg/mL) 200*5/20 = 50 days. [Examples by dose form](https://ohdsi.github.io/CommonDataModel/drug_dose.html)')
-    drug_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: You can use the TYPE_CONCEPT_ID to delineate between prescriptions written vs. prescriptions dispensed vs. medication history vs. patient-reported exposure, etc. | ETLCONVENTIONS: Choose the drug_type_concept_id that best represents the provenance of the record, for example whether it came from a record of a prescription written or physician administered drug. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    drug_exposure_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: This is not required, though it is in v6. If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    drug_exposure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: This is not required, though it is in v6. If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    verbatim_end_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: This is the end date of the drug exposure as it appears in the source data, if it is given | ETLCONVENTIONS: Put the end date or discontinuation date as it appears from the source data or leave blank if unavailable.')
-    stop_reason: Mapped[Optional[str]] = mapped_column(String(20), comment='USER GUIDANCE: The reason a person stopped a medication as it is represented in the source. Reasons include regimen completed, changed, removed, etc. This field will be retired in v6.0. | ETLCONVENTIONS: This information is often not populated in source data and it is a valid etl choice to leave it blank if the information does not exist.')
-    refills: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is only filled in when the record is coming from a prescription written this field is meant to represent intended refills at time of the prescription.')
-    quantity: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment=' | ETLCONVENTIONS: To find the dose form of a drug the RELATIONSHIP table can be used where the relationship_id is "Has dose form". If liquid, quantity stands for the total amount dispensed or ordered of ingredient in the units given by the drug_strength table. If the unit from the source data does not align with the unit in the DRUG_STRENGTH table the quantity should be converted to the correct unit given in DRUG_STRENGTH. For clinical drugs with fixed dose forms (tablets etc.) the quantity is the number of units/tablets/capsules prescribed or dispensed (can be partial, but then only 1/2 or 1/3, not 0.01). Clinical drugs with divisible dose forms (injections) the quantity is the amount of ingredient the patient got. For example, if the injection is 2mg/mL but the patient got 80mL then quantity is reported as 160.\nQuantified clinical drugs with divisible dose forms (prefilled syringes), the quantity is the amount of ingredient similar to clinical drugs. Please see [how to calculate drug dose](https://ohdsi.github.io/CommonDataModel/drug_dose.html) for more information.\n')
-    days_supply: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: Days supply of the drug. This should be the verbatim days_supply as given on the prescription. If the drug is physician administered use duration end date if given or set to 1 as default if duration is not available.')
-    sig: Mapped[Optional[str]] = mapped_column(Text, comment='USER GUIDANCE: This is the verbatim instruction for the drug as written by the provider. | ETLCONVENTIONS: Put the written out instructions for the drug as it is verbatim in the source, if available.')
-    route_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment=' | ETLCONVENTIONS: The standard CONCEPT_ID that the ROUTE_SOURCE_VALUE maps to in the route domain.')
-    lot_number: Mapped[Optional[str]] = mapped_column(String(50))
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Provider associated with drug record, e.g. the provider who wrote the prescription or the provider who administered the drug. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the ordering vs administering physician on an EHR record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Visit during which the drug was prescribed, administered or dispensed. | ETLCONVENTIONS: To populate this field drug exposures must be explicitly initiated in the visit.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The VISIT_DETAIL record during which the drug exposure occurred. For example, if the person was in the ICU at the time of the drug administration the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.')
-    drug_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the drug exposure that occurred. For example, this could be an NDC or Gemscript code. | ETLCONVENTIONS: This code is mapped to a Standard Drug Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    drug_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the drug source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Drug necessary for a given analytic use case. Consider using DRUG_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the DRUG_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    route_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the drug route. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating when and how a drug was given to a patient. This source value is mapped to a standard concept which is stored in the ROUTE_CONCEPT_ID field.')
-    dose_unit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the dose unit of the drug given. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating the unit of dosage of drug given to the patient. **This is an older column and will be deprecated in an upcoming version.**')
+    drug_exposure_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to records of drug dispensings or administrations for a person. Refer to the ETL for how duplicate drugs during the same visit were handled. | ETLCONVENTIONS: Each instance of a drug dispensing or administration present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same drug within the same visit. It is valid to keep these duplicates and assign them individual, unique, DRUG_EXPOSURE_IDs, though it is up to the ETL how they should be handled.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the PERSON for whom the drug dispensing or administration is recorded. This may be a system generated code.'))
+    drug_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The DRUG_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source concept id which represents a drug product or molecule otherwise introduced to the body. The drug concepts can have a varying degree of information about drug strength and dose. This information is relevant in the context of quantity and administration information in the subsequent fields plus strength information from the DRUG_STRENGTH table, provided as part of the standard vocabulary download. | ETLCONVENTIONS: The CONCEPT_ID that the DRUG_SOURCE_VALUE maps to. The concept id should be derived either from mapping from the source concept id or by picking the drug concept representing the most amount of detail you have. Records whose source values map to standard concepts with a domain of Drug should go in this table. When the Drug Source Value of the code cannot be translated into Standard Drug Concept IDs, a Drug exposure entry is stored with only the corresponding SOURCE_CONCEPT_ID and DRUG_SOURCE_VALUE and a DRUG_CONCEPT_ID of 0. The Drug Concept with the most detailed content of information is preferred during the mapping process. These are indicated in the CONCEPT_CLASS_ID field of the Concept and are recorded in the following order of precedence: "Branded Pack", "Clinical Pack", "Branded Drug", "Clinical Drug", "Branded Drug Component", "Clinical Drug Component", "Branded Drug Form", "Clinical Drug Form", and only if no other information is available "Ingredient". Note: If only the drug class is known, the DRUG_CONCEPT_ID field should contain 0. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Drug&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    drug_exposure_start_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the start date of the drug record. | ETLCONVENTIONS: Valid entries include a start date of a prescription, the date a prescription was filled, or the date on which a Drug administration was recorded. It is a valid ETL choice to use the date the drug was ordered as the DRUG_EXPOSURE_START_DATE.'))
+    drug_exposure_end_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The DRUG_EXPOSURE_END_DATE denotes the day the drug exposure ended for the patient. | ETLCONVENTIONS: If this information is not explicitly available in the data, infer the end date using the following methods:<br><br> 1. Start first with duration or days supply using the calculation drug start date + days supply -1 day. 2. Use quantity divided by daily dose that you may obtain from the sig or a source field (or assumed daily dose of 1) for solid, indivisibile, drug products. If quantity represents ingredient amount, quantity divided by daily dose * concentration (from drug_strength) drug concept id tells you the dose form. 3. If it is an administration record, set drug end date equal to drug start date. If the record is a written prescription then set end date to start date + 29. If the record is a mail-order prescription set end date to start date + 89. The end date must be equal to or greater than the start date. Ibuprofen 20mg/mL oral solution concept tells us this is oral solution. Calculate duration as quantity (200 example) * daily dose (5mL) /concentration (20mg/mL) 200*5/20 = 50 days. [Examples by dose form](https://ohdsi.github.io/CommonDataModel/drug_dose.html)'))
+    drug_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: You can use the TYPE_CONCEPT_ID to delineate between prescriptions written vs. prescriptions dispensed vs. medication history vs. patient-reported exposure, etc. | ETLCONVENTIONS: Choose the drug_type_concept_id that best represents the provenance of the record, for example whether it came from a record of a prescription written or physician administered drug. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    drug_exposure_start_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_NOT_REQUIRED_V6))
+    drug_exposure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_NOT_REQUIRED_V6))
+    verbatim_end_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: This is the end date of the drug exposure as it appears in the source data, if it is given | ETLCONVENTIONS: Put the end date or discontinuation date as it appears from the source data or leave blank if unavailable.'))
+    stop_reason: Mapped[Optional[str]] = mapped_column(_String(20), comment=_ddl_comment('USER GUIDANCE: The reason a person stopped a medication as it is represented in the source. Reasons include regimen completed, changed, removed, etc. This field will be retired in v6.0. | ETLCONVENTIONS: This information is often not populated in source data and it is a valid etl choice to leave it blank if the information does not exist.'))
+    refills: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is only filled in when the record is coming from a prescription written this field is meant to represent intended refills at time of the prescription.'))
+    quantity: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment(' | ETLCONVENTIONS: To find the dose form of a drug the RELATIONSHIP table can be used where the relationship_id is "Has dose form". If liquid, quantity stands for the total amount dispensed or ordered of ingredient in the units given by the drug_strength table. If the unit from the source data does not align with the unit in the DRUG_STRENGTH table the quantity should be converted to the correct unit given in DRUG_STRENGTH. For clinical drugs with fixed dose forms (tablets etc.) the quantity is the number of units/tablets/capsules prescribed or dispensed (can be partial, but then only 1/2 or 1/3, not 0.01). Clinical drugs with divisible dose forms (injections) the quantity is the amount of ingredient the patient got. For example, if the injection is 2mg/mL but the patient got 80mL then quantity is reported as 160.\nQuantified clinical drugs with divisible dose forms (prefilled syringes), the quantity is the amount of ingredient similar to clinical drugs. Please see [how to calculate drug dose](https://ohdsi.github.io/CommonDataModel/drug_dose.html) for more information.\n'))
+    days_supply: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: Days supply of the drug. This should be the verbatim days_supply as given on the prescription. If the drug is physician administered use duration end date if given or set to 1 as default if duration is not available.'))
+    sig: Mapped[Optional[str]] = mapped_column(_Text, comment=_ddl_comment('USER GUIDANCE: This is the verbatim instruction for the drug as written by the provider. | ETLCONVENTIONS: Put the written out instructions for the drug as it is verbatim in the source, if available.'))
+    route_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment(' | ETLCONVENTIONS: The standard CONCEPT_ID that the ROUTE_SOURCE_VALUE maps to in the route domain.'))
+    lot_number: Mapped[Optional[str]] = mapped_column(_String(50))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Provider associated with drug record, e.g. the provider who wrote the prescription or the provider who administered the drug. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the ordering vs administering physician on an EHR record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Visit during which the drug was prescribed, administered or dispensed. | ETLCONVENTIONS: To populate this field drug exposures must be explicitly initiated in the visit.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The VISIT_DETAIL record during which the drug exposure occurred. For example, if the person was in the ICU at the time of the drug administration the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.'))
+    drug_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the drug exposure that occurred. For example, this could be an NDC or Gemscript code. | ETLCONVENTIONS: This code is mapped to a Standard Drug Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    drug_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the drug source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Drug necessary for a given analytic use case. Consider using DRUG_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the DRUG_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    route_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the drug route. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating when and how a drug was given to a patient. This source value is mapped to a standard concept which is stored in the ROUTE_CONCEPT_ID field.'))
+    dose_unit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the dose unit of the drug given. | ETLCONVENTIONS: This information may be called something different in the source data but the field is meant to contain a value indicating the unit of dosage of drug given to the patient. **This is an older column and will be deprecated in an upcoming version.**'))
 
     drug_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_concept_id])
     drug_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[drug_source_concept_id])
@@ -1681,7 +1760,7 @@ class Measurement(Base):
         Index('idx_measurement_concept_id_1', 'measurement_concept_id'),
         Index('idx_measurement_person_id_1', 'person_id'),
         Index('idx_measurement_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: The MEASUREMENT table contains records of Measurements, '
+        {'comment': _ddl_comment('DESC: The MEASUREMENT table contains records of Measurements, '
                 'i.e. structured values (numerical or categorical) obtained '
                 'through systematic and standardized examination or testing of a '
                 'Person or Person"s sample. The MEASUREMENT table contains both '
@@ -1723,32 +1802,32 @@ class Measurement(Base):
                 '[4046263](https://athena.ohdsi.org/search-terms/terms/4046263) '
                 '"Enzyme measurement" as well as a "Maps to value" record to '
                 '[4135493](https://athena.ohdsi.org/search-terms/terms/4135493) '
-                '"Abnormal".'}
+                '"Abnormal".')}
     )
 
-    measurement_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to a Measurement record for a Person. Refer to the ETL for how duplicate Measurements during the same Visit were handled. | ETLCONVENTIONS: Each instance of a measurement present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same measurement within the same visit. It is valid to keep these duplicates and assign them individual, unique, MEASUREMENT_IDs, though it is up to the ETL how they should be handled.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the Person for whom the Measurement is recorded. This may be a system generated code.')
-    measurement_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The MEASUREMENT_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. | ETLCONVENTIONS: The CONCEPT_ID that the MEASUREMENT_SOURCE_CONCEPT_ID maps to. Only records whose SOURCE_CONCEPT_IDs map to Standard Concepts with a domain of "Measurement" should go in this table.')
-    measurement_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the date of the measurement. | ETLCONVENTIONS: If there are multiple dates in the source data associated with a record such as order_date, draw_date, and result_date, choose the one that is closest to the date the sample was drawn from the patient.')
-    measurement_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Measurement record, as in whether the measurement was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the MEASUREMENT_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    measurement_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: This is not required, though it is in v6. If a source does not specify datetime the convention is to set the time to midnight (00:00:0000)')
-    measurement_time: Mapped[Optional[str]] = mapped_column(String(10), comment=' | ETLCONVENTIONS: This is present for backwards compatibility and will be deprecated in an upcoming version.')
-    operator_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The meaning of Concept [4172703](https://athena.ohdsi.org/search-terms/terms/4172703) for "=" is identical to omission of a OPERATOR_CONCEPT_ID value. Since the use of this field is rare, it"s important when devising analyses to not to forget testing for the content of this field for values different from =. | ETLCONVENTIONS: Operators are <, <=, =, >=, > and these concepts belong to the "Meas Value Operator" domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Meas+Value+Operator&standardConcept=Standard&page=1&pageSize=15&query=).')
-    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: This is the numerical value of the Result of the Measurement, if available. Note that measurements such as blood pressures will be split into their component parts i.e. one record for systolic, one record for diastolic. | ETLCONVENTIONS: If there is a negative value coming from the source, set the VALUE_AS_NUMBER to NULL, with the exception of the following Measurements (listed as LOINC codes):<br>-  [1925-7](https://athena.ohdsi.org/search-terms/terms/3003396) Base excess in Arterial blood by calculation - [1927-3](https://athena.ohdsi.org/search-terms/terms/3002032) Base excess in Venous blood by calculation - [8632-2](https://athena.ohdsi.org/search-terms/terms/3006277) QRS-Axis - [11555-0](https://athena.ohdsi.org/search-terms/terms/3012501) Base excess in Blood by calculation - [1926-5](https://athena.ohdsi.org/search-terms/terms/3003129) Base excess in Capillary blood by calculation - [28638-5](https://athena.ohdsi.org/search-terms/terms/3004959) Base excess in Arterial cord blood by calculation [28639-3](https://athena.ohdsi.org/search-terms/terms/3007435) Base excess in Venous cord blood by calculation')
-    value_as_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the raw data gives a categorial result for measurements those values are captured and mapped to standard concepts in the "Meas Value" domain. | ETLCONVENTIONS: If the raw data provides categorial results as well as continuous results for measurements, it is a valid ETL choice to preserve both values. The continuous value should go in the VALUE_AS_NUMBER field and the categorical value should be mapped to a standard concept in the "Meas Value" domain and put in the VALUE_AS_CONCEPT_ID field. This is also the destination for the "Maps to value" relationship.')
-    unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: There is currently no recommended unit for individual measurements, i.e. it is not mandatory to represent Hemoglobin a1C measurements as a percentage. UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data. | ETLCONVENTIONS: There is no standardization requirement for units associated with MEASUREMENT_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit.')
-    range_low: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: Ranges have the same unit as the VALUE_AS_NUMBER. These ranges are provided by the source and should remain NULL if not given. | ETLCONVENTIONS: If reference ranges for upper and lower limit of normal as provided (typically by a laboratory) these are stored in the RANGE_HIGH and RANGE_LOW fields. This should be set to NULL if not provided.')
-    range_high: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: Ranges have the same unit as the VALUE_AS_NUMBER. These ranges are provided by the source and should remain NULL if not given. | ETLCONVENTIONS: If reference ranges for upper and lower limit of normal as provided (typically by a laboratory) these are stored in the RANGE_HIGH and RANGE_LOW fields. This should be set to NULL if not provided.')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The provider associated with measurement record, e.g. the provider who ordered the test or the provider who recorded the result. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record. For example the admitting vs attending physician on an EHR record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The visit during which the Measurement occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a MEASUREMENT_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the measurement record. If a measurement is related to a visit explicitly in the source data, it is possible that the result date of the Measurement falls outside of the bounds of the Visit dates.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The VISIT_DETAIL record during which the Measurement occurred. For example, if the Person was in the ICU at the time the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.')
-    measurement_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the Measurement that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Measurement Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    measurement_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the MEASUREMENT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Measurement necessary for a given analytic use case. Consider using MEASUREMENT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the MEASUREMENT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    unit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Measurement that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    unit_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: "This is the concept representing the UNIT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Measurement necessary for a given analytic use case. Consider using UNIT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network." | ETLCONVENTIONS: If the UNIT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    value_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim result value of the Measurement from the source data .  | ETLCONVENTIONS: If both a continuous and categorical result are given in the source data such that both VALUE_AS_NUMBER and VALUE_AS_CONCEPT_ID are both included, store the verbatim value that was mapped to VALUE_AS_CONCEPT_ID here.')
-    measurement_event_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Measurement record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here.')
-    meas_event_field_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Measurement record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the MEASUREMENT_EVENT_ID came from.')
+    measurement_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to a Measurement record for a Person. Refer to the ETL for how duplicate Measurements during the same Visit were handled. | ETLCONVENTIONS: Each instance of a measurement present in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same measurement within the same visit. It is valid to keep these duplicates and assign them individual, unique, MEASUREMENT_IDs, though it is up to the ETL how they should be handled.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the Person for whom the Measurement is recorded. This may be a system generated code.'))
+    measurement_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The MEASUREMENT_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. | ETLCONVENTIONS: The CONCEPT_ID that the MEASUREMENT_SOURCE_CONCEPT_ID maps to. Only records whose SOURCE_CONCEPT_IDs map to Standard Concepts with a domain of "Measurement" should go in this table.'))
+    measurement_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the date of the measurement. | ETLCONVENTIONS: If there are multiple dates in the source data associated with a record such as order_date, draw_date, and result_date, choose the one that is closest to the date the sample was drawn from the patient.'))
+    measurement_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Measurement record, as in whether the measurement was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the MEASUREMENT_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    measurement_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(_COMMENT_DATETIME_NOT_REQUIRED_V6))
+    measurement_time: Mapped[Optional[str]] = mapped_column(_String(10), comment=_ddl_comment(' | ETLCONVENTIONS: This is present for backwards compatibility and will be deprecated in an upcoming version.'))
+    operator_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The meaning of Concept [4172703](https://athena.ohdsi.org/search-terms/terms/4172703) for "=" is identical to omission of a OPERATOR_CONCEPT_ID value. Since the use of this field is rare, it"s important when devising analyses to not to forget testing for the content of this field for values different from =. | ETLCONVENTIONS: Operators are <, <=, =, >=, > and these concepts belong to the "Meas Value Operator" domain. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Meas+Value+Operator&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: This is the numerical value of the Result of the Measurement, if available. Note that measurements such as blood pressures will be split into their component parts i.e. one record for systolic, one record for diastolic. | ETLCONVENTIONS: If there is a negative value coming from the source, set the VALUE_AS_NUMBER to NULL, with the exception of the following Measurements (listed as LOINC codes):<br>-  [1925-7](https://athena.ohdsi.org/search-terms/terms/3003396) Base excess in Arterial blood by calculation - [1927-3](https://athena.ohdsi.org/search-terms/terms/3002032) Base excess in Venous blood by calculation - [8632-2](https://athena.ohdsi.org/search-terms/terms/3006277) QRS-Axis - [11555-0](https://athena.ohdsi.org/search-terms/terms/3012501) Base excess in Blood by calculation - [1926-5](https://athena.ohdsi.org/search-terms/terms/3003129) Base excess in Capillary blood by calculation - [28638-5](https://athena.ohdsi.org/search-terms/terms/3004959) Base excess in Arterial cord blood by calculation [28639-3](https://athena.ohdsi.org/search-terms/terms/3007435) Base excess in Venous cord blood by calculation'))
+    value_as_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the raw data gives a categorial result for measurements those values are captured and mapped to standard concepts in the "Meas Value" domain. | ETLCONVENTIONS: If the raw data provides categorial results as well as continuous results for measurements, it is a valid ETL choice to preserve both values. The continuous value should go in the VALUE_AS_NUMBER field and the categorical value should be mapped to a standard concept in the "Meas Value" domain and put in the VALUE_AS_CONCEPT_ID field. This is also the destination for the "Maps to value" relationship.'))
+    unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: There is currently no recommended unit for individual measurements, i.e. it is not mandatory to represent Hemoglobin a1C measurements as a percentage. UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data. | ETLCONVENTIONS: There is no standardization requirement for units associated with MEASUREMENT_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit.'))
+    range_low: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment(_COMMENT_RANGE_UNITS))
+    range_high: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment(_COMMENT_RANGE_UNITS))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The provider associated with measurement record, e.g. the provider who ordered the test or the provider who recorded the result. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record. For example the admitting vs attending physician on an EHR record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The visit during which the Measurement occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a MEASUREMENT_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the measurement record. If a measurement is related to a visit explicitly in the source data, it is possible that the result date of the Measurement falls outside of the bounds of the Visit dates.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The VISIT_DETAIL record during which the Measurement occurred. For example, if the Person was in the ICU at the time the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.'))
+    measurement_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the Measurement that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Measurement Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    measurement_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the MEASUREMENT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Measurement necessary for a given analytic use case. Consider using MEASUREMENT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the MEASUREMENT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    unit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Measurement that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    unit_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: "This is the concept representing the UNIT_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Measurement necessary for a given analytic use case. Consider using UNIT_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network." | ETLCONVENTIONS: If the UNIT_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    value_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim result value of the Measurement from the source data .  | ETLCONVENTIONS: If both a continuous and categorical result are given in the source data such that both VALUE_AS_NUMBER and VALUE_AS_CONCEPT_ID are both included, store the verbatim value that was mapped to VALUE_AS_CONCEPT_ID here.'))
+    measurement_event_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Measurement record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here.'))
+    meas_event_field_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Measurement record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the MEASUREMENT_EVENT_ID came from.'))
 
     meas_event_field_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[meas_event_field_concept_id])
     measurement_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[measurement_concept_id])
@@ -1780,7 +1859,7 @@ class Note(Base):
         Index('idx_note_concept_id_1', 'note_type_concept_id'),
         Index('idx_note_person_id_1', 'person_id'),
         Index('idx_note_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: The NOTE table captures unstructured information that was '
+        {'comment': _ddl_comment('DESC: The NOTE table captures unstructured information that was '
                 'recorded by a provider about a patient in free text (in ASCII, or '
                 'preferably in UTF8 format) notes on a given date. The type of '
                 'note_text is CLOB or varchar(MAX) depending on RDBMS.  | ETL '
@@ -1814,25 +1893,25 @@ class Note(Base):
                 'necessarily yield an existing LOINC code. Each of these '
                 'dimensions are contained in the OMOP Vocabulary under the domain '
                 'of "Meas Value" with each dimension represented as a Concept '
-                'Class. '}
+                'Class. ')}
     )
 
-    note_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: A unique identifier for each note.')
-    person_id: Mapped[int] = mapped_column(Integer)
-    note_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date the note was recorded.')
-    note_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The provenance of the note. Most likely this will be EHR.  | ETLCONVENTIONS: Put the source system of the note, as in EHR record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Type+Concept&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    note_class_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: A Standard Concept Id representing the HL7 LOINC\nDocument Type Vocabulary classification of the note. | ETLCONVENTIONS: Map the note classification to a Standard Concept. For more information see the ETL Conventions in the description of the NOTE table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&conceptClass=Doc+Kind&conceptClass=Doc+Role&conceptClass=Doc+Setting&conceptClass=Doc+Subject+Matter&conceptClass=Doc+Type+of+Service&domain=Meas+Value&page=1&pageSize=15&query=). This Concept can alternatively be represented by concepts with the relationship "Kind of (LOINC)" to [706391](https://athena.ohdsi.org/search-terms/terms/706391) (Note).')
-    note_text: Mapped[str] = mapped_column(Text, comment='USER GUIDANCE: The content of the note.')
-    encoding_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This is the Concept representing the character encoding type.  | ETLCONVENTIONS: Put the Concept Id that represents the encoding character type here. Currently the only option is UTF-8 ([32678](https://athena.ohdsi.org/search-terms/terms/32678)). It the note is encoded in any other type, like ASCII then put 0. ')
-    language_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The language of the note.  | ETLCONVENTIONS: Use Concepts that are descendants of the concept [4182347](https://athena.ohdsi.org/search-terms/terms/4182347) (World Languages).')
-    note_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If time is not given set the time to midnight.')
-    note_title: Mapped[Optional[str]] = mapped_column(String(250), comment='USER GUIDANCE: The title of the note.')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Provider who wrote the note. | ETLCONVENTIONS: The ETL may need to make a determination on which provider to put here.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Visit during which the note was written. ')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The Visit Detail during which the note was written.')
-    note_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: The source value mapped to the NOTE_CLASS_CONCEPT_ID.')
-    note_event_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Note record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here.')
-    note_event_field_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Note record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the NOTE_EVENT_ID came from.')
+    note_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: A unique identifier for each note.'))
+    person_id: Mapped[int] = mapped_column(_Integer)
+    note_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date the note was recorded.'))
+    note_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The provenance of the note. Most likely this will be EHR.  | ETLCONVENTIONS: Put the source system of the note, as in EHR record. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&domain=Type+Concept&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    note_class_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: A Standard Concept Id representing the HL7 LOINC\nDocument Type Vocabulary classification of the note. | ETLCONVENTIONS: Map the note classification to a Standard Concept. For more information see the ETL Conventions in the description of the NOTE table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?standardConcept=Standard&conceptClass=Doc+Kind&conceptClass=Doc+Role&conceptClass=Doc+Setting&conceptClass=Doc+Subject+Matter&conceptClass=Doc+Type+of+Service&domain=Meas+Value&page=1&pageSize=15&query=). This Concept can alternatively be represented by concepts with the relationship "Kind of (LOINC)" to [706391](https://athena.ohdsi.org/search-terms/terms/706391) (Note).'))
+    note_text: Mapped[str] = mapped_column(_Text, comment=_ddl_comment('USER GUIDANCE: The content of the note.'))
+    encoding_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the Concept representing the character encoding type.  | ETLCONVENTIONS: Put the Concept Id that represents the encoding character type here. Currently the only option is UTF-8 ([32678](https://athena.ohdsi.org/search-terms/terms/32678)). It the note is encoded in any other type, like ASCII then put 0. '))
+    language_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The language of the note.  | ETLCONVENTIONS: Use Concepts that are descendants of the concept [4182347](https://athena.ohdsi.org/search-terms/terms/4182347) (World Languages).'))
+    note_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(' | ETLCONVENTIONS: If time is not given set the time to midnight.'))
+    note_title: Mapped[Optional[str]] = mapped_column(_String(250), comment=_ddl_comment('USER GUIDANCE: The title of the note.'))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Provider who wrote the note. | ETLCONVENTIONS: The ETL may need to make a determination on which provider to put here.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Visit during which the note was written. '))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The Visit Detail during which the note was written.'))
+    note_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment(' | ETLCONVENTIONS: The source value mapped to the NOTE_CLASS_CONCEPT_ID.'))
+    note_event_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Note record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here.'))
+    note_event_field_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Note record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the NOTE_EVENT_ID came from.'))
 
     encoding_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[encoding_concept_id])
     language_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[language_concept_id])
@@ -1863,7 +1942,7 @@ class Observation(Base):
         Index('idx_observation_concept_id_1', 'observation_concept_id'),
         Index('idx_observation_person_id_1', 'person_id'),
         Index('idx_observation_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: The OBSERVATION table captures clinical facts about a '
+        {'comment': _ddl_comment('DESC: The OBSERVATION table captures clinical facts about a '
                 'Person obtained in the context of examination, questioning or a '
                 'procedure. Any data that cannot be represented by any other '
                 'domains, such as social and lifestyle facts, medical history, '
@@ -1893,30 +1972,30 @@ class Observation(Base):
                 'VALUE_AS_* fields. It is recommended for Observations that are '
                 'suggestive statements of positive assertion should have a value '
                 'of "Yes" (concept_id=4188539), recorded, even though the null '
-                'value is the equivalent. '}
+                'value is the equivalent. ')}
     )
 
-    observation_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to an Observation record for a Person. Refer to the ETL for how duplicate Observations during the same Visit were handled. | ETLCONVENTIONS: Each instance of an observation present in the source data should be assigned this unique key. ')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the Person for whom the Observation is recorded. This may be a system generated code.')
-    observation_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The OBSERVATION_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. | ETLCONVENTIONS: The CONCEPT_ID that the OBSERVATION_SOURCE_CONCEPT_ID maps to. There is no specified domain that the Concepts in this table must adhere to. The only rule is that records with Concepts in the Condition, Procedure, Drug, Measurement, or Device domains MUST go to the corresponding table. ')
-    observation_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: The date of the Observation. Depending on what the Observation represents this could be the date of a lab test, the date of a survey, or the date a patient"s family history was taken.  | ETLCONVENTIONS: For some observations the ETL may need to make a choice as to which date to choose.')
-    observation_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Observation record, as in whether the measurement was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the OBSERVATION_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    observation_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If no time is given set to midnight (00:00:00).')
-    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric, comment='USER GUIDANCE: This is the numerical value of the Result of the Observation, if applicable and available. It is not expected that all Observations will have numeric results, rather, this field is here to house values should they exist. ')
-    value_as_string: Mapped[Optional[str]] = mapped_column(String(60), comment='USER GUIDANCE: This is the categorical value of the Result of the Observation, if applicable and available. ')
-    value_as_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: It is possible that some records destined for the Observation table have two clinical ideas represented in one source code. This is common with ICD10 codes that describe a family history of some Condition, for example. In OMOP the Vocabulary breaks these two clinical ideas into two codes; one becomes the OBSERVATION_CONCEPT_ID and the other becomes the VALUE_AS_CONCEPT_ID. It is important when using the Observation table to keep this possibility in mind and to examine the VALUE_AS_CONCEPT_ID field for relevant information.  | ETLCONVENTIONS: Note that the value of VALUE_AS_CONCEPT_ID may be provided through mapping from a source Concept which contains the content of the Observation. In those situations, the CONCEPT_RELATIONSHIP table in addition to the "Maps to" record contains a second record with the relationship_id set to "Maps to value". For example, ICD10 [Z82.4](https://athena.ohdsi.org/search-terms/terms/45581076) "Family history of ischaemic heart disease and other diseases of the circulatory system" has a "Maps to" relationship to [4167217](https://athena.ohdsi.org/search-terms/terms/4167217) "Family history of clinical finding" as well as a "Maps to value" record to [134057](https://athena.ohdsi.org/search-terms/terms/134057) "Disorder of cardiovascular system".')
-    qualifier_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This field contains all attributes specifying the clinical fact further, such as as degrees, severities, drug-drug interaction alerts etc. | ETLCONVENTIONS: Use your best judgement as to what Concepts to use here and if they are necessary to accurately represent the clinical record. There is no restriction on the domain of these Concepts, they just need to be Standard.')
-    unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: There is currently no recommended unit for individual observation concepts. UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data. | ETLCONVENTIONS: There is no standardization requirement for units associated with OBSERVATION_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit.')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The provider associated with the observation record, e.g. the provider who ordered the test or the provider who recorded the result. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record. For example the admitting vs attending physician on an EHR record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The visit during which the Observation occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If an OBSERVATION_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the observation record. If an observation is related to a visit explicitly in the source data, it is possible that the result date of the Observation falls outside of the bounds of the Visit dates.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The VISIT_DETAIL record during which the Observation occurred. For example, if the Person was in the ICU at the time the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.')
-    observation_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the Observation that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    observation_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the OBSERVATION_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Observation necessary for a given analytic use case. Consider using OBSERVATION_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the OBSERVATION_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    unit_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Observation that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    qualifier_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the qualifier of the Observation that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.')
-    value_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim result value of the Observation from the source data.  Do not get confused with the Observation_source_value which captures source value of the observation mapped to observation_concept_id. This field is the observation result value from the source. | ETLCONVENTIONS:  If the observation_source_value was a question, for example,  or an observation that requires a result then this field is the answer/ result from the source data. Store the verbatim value that represents the result of the observation_source_value.  ')
-    observation_event_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Observation record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here. See the [ETL Conventions for the OBSERVATION](https://ohdsi.github.io/CommonDataModel/cdm60.html#observation) table for more details.')
-    obs_event_field_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the Observation record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the OBSERVATION_EVENT_ID came from.')
+    observation_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to an Observation record for a Person. Refer to the ETL for how duplicate Observations during the same Visit were handled. | ETLCONVENTIONS: Each instance of an observation present in the source data should be assigned this unique key. '))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the Person for whom the Observation is recorded. This may be a system generated code.'))
+    observation_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The OBSERVATION_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. | ETLCONVENTIONS: The CONCEPT_ID that the OBSERVATION_SOURCE_CONCEPT_ID maps to. There is no specified domain that the Concepts in this table must adhere to. The only rule is that records with Concepts in the Condition, Procedure, Drug, Measurement, or Device domains MUST go to the corresponding table. '))
+    observation_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: The date of the Observation. Depending on what the Observation represents this could be the date of a lab test, the date of a survey, or the date a patient"s family history was taken.  | ETLCONVENTIONS: For some observations the ETL may need to make a choice as to which date to choose.'))
+    observation_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Observation record, as in whether the measurement was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the OBSERVATION_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    observation_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(' | ETLCONVENTIONS: If no time is given set to midnight (00:00:00).'))
+    value_as_number: Mapped[Optional[decimal.Decimal]] = mapped_column(_Numeric, comment=_ddl_comment('USER GUIDANCE: This is the numerical value of the Result of the Observation, if applicable and available. It is not expected that all Observations will have numeric results, rather, this field is here to house values should they exist. '))
+    value_as_string: Mapped[Optional[str]] = mapped_column(_String(60), comment=_ddl_comment('USER GUIDANCE: This is the categorical value of the Result of the Observation, if applicable and available. '))
+    value_as_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: It is possible that some records destined for the Observation table have two clinical ideas represented in one source code. This is common with ICD10 codes that describe a family history of some Condition, for example. In OMOP the Vocabulary breaks these two clinical ideas into two codes; one becomes the OBSERVATION_CONCEPT_ID and the other becomes the VALUE_AS_CONCEPT_ID. It is important when using the Observation table to keep this possibility in mind and to examine the VALUE_AS_CONCEPT_ID field for relevant information.  | ETLCONVENTIONS: Note that the value of VALUE_AS_CONCEPT_ID may be provided through mapping from a source Concept which contains the content of the Observation. In those situations, the CONCEPT_RELATIONSHIP table in addition to the "Maps to" record contains a second record with the relationship_id set to "Maps to value". For example, ICD10 [Z82.4](https://athena.ohdsi.org/search-terms/terms/45581076) "Family history of ischaemic heart disease and other diseases of the circulatory system" has a "Maps to" relationship to [4167217](https://athena.ohdsi.org/search-terms/terms/4167217) "Family history of clinical finding" as well as a "Maps to value" record to [134057](https://athena.ohdsi.org/search-terms/terms/134057) "Disorder of cardiovascular system".'))
+    qualifier_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field contains all attributes specifying the clinical fact further, such as as degrees, severities, drug-drug interaction alerts etc. | ETLCONVENTIONS: Use your best judgement as to what Concepts to use here and if they are necessary to accurately represent the clinical record. There is no restriction on the domain of these Concepts, they just need to be Standard.'))
+    unit_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: There is currently no recommended unit for individual observation concepts. UNIT_SOURCE_VALUES should be mapped to a Standard Concept in the Unit domain that best represents the unit as given in the source data. | ETLCONVENTIONS: There is no standardization requirement for units associated with OBSERVATION_CONCEPT_IDs, however, it is the responsibility of the ETL to choose the most plausible unit.'))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The provider associated with the observation record, e.g. the provider who ordered the test or the provider who recorded the result. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record. For example the admitting vs attending physician on an EHR record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The visit during which the Observation occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If an OBSERVATION_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the observation record. If an observation is related to a visit explicitly in the source data, it is possible that the result date of the Observation falls outside of the bounds of the Visit dates.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The VISIT_DETAIL record during which the Observation occurred. For example, if the Person was in the ICU at the time the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.'))
+    observation_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the Observation that occurred. For example, this could be an ICD10 or Read code. | ETLCONVENTIONS: This code is mapped to a Standard Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    observation_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the OBSERVATION_SOURCE_VALUE and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Observation necessary for a given analytic use case. Consider using OBSERVATION_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the OBSERVATION_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    unit_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the unit of the Observation that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    qualifier_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the qualifier of the Observation that occurred.  | ETLCONVENTIONS: This code is mapped to a Standard Condition Concept in the Standardized Vocabularies and the original code is stored here for reference.'))
+    value_source_value: Mapped[Optional[str]] = mapped_column(_String(50), comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim result value of the Observation from the source data.  Do not get confused with the Observation_source_value which captures source value of the observation mapped to observation_concept_id. This field is the observation result value from the source. | ETLCONVENTIONS:  If the observation_source_value was a question, for example,  or an observation that requires a result then this field is the answer/ result from the source data. Store the verbatim value that represents the result of the observation_source_value.  '))
+    observation_event_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Observation record is related to another record in the database, this field is the primary key of the linked record.  | ETLCONVENTIONS: Put the primary key of the linked record, if applicable, here. See the [ETL Conventions for the OBSERVATION](https://ohdsi.github.io/CommonDataModel/cdm60.html#observation) table for more details.'))
+    obs_event_field_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the Observation record is related to another record in the database, this field is the CONCEPT_ID that identifies which table the primary key of the linked record came from.  | ETLCONVENTIONS: Put the CONCEPT_ID that identifies which table and field the OBSERVATION_EVENT_ID came from.'))
 
     obs_event_field_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[obs_event_field_concept_id])
     observation_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[observation_concept_id])
@@ -1944,9 +2023,11 @@ class ProcedureOccurrence(Base):
         ForeignKeyConstraint(['visit_occurrence_id'], ['visit_occurrence.visit_occurrence_id'], name='fpk_procedure_occurrence_visit_occurrence_id'),
         PrimaryKeyConstraint('procedure_occurrence_id', name='xpk_procedure_occurrence'),
         Index('idx_procedure_concept_id_1', 'procedure_concept_id'),
-        Index('idx_procedure_person_id_1', 'person_id'),
+        Index('idx_procedure_person_date', 'person_id', 'procedure_date', postgresql_include=['procedure_concept_id', 'visit_occurrence_id', 'quantity']),
+        Index('brin_procedure_date', 'procedure_date', postgresql_using='brin'),
+        Index('idx_procedure_source_concept', 'procedure_source_concept_id', postgresql_where=text('procedure_source_concept_id IS NOT NULL')),
         Index('idx_procedure_visit_id_1', 'visit_occurrence_id'),
-        {'comment': 'DESC: This table contains records of activities or processes '
+        {'comment': _ddl_comment('DESC: This table contains records of activities or processes '
                 'ordered by, or carried out by, a healthcare provider on the '
                 'patient with a diagnostic or therapeutic purpose. | USER '
                 'GUIDANCE: Lab tests are not a procedure, if something is observed '
@@ -1965,34 +2046,37 @@ class ProcedureOccurrence(Base):
                 'Visit Occurrence or Visit Detail - Same Provider - Same Modifier '
                 'for Procedures. Source codes and source text fields mapped to '
                 'Standard Concepts of the Procedure Domain have to be recorded '
-                'here.'}
+                'here.')}
     )
 
-    procedure_occurrence_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment='USER GUIDANCE: The unique key given to a procedure record for a person. Refer to the ETL for how duplicate procedures during the same visit were handled. | ETLCONVENTIONS: Each instance of a procedure occurrence in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same procedure within the same visit. It is valid to keep these duplicates and assign them individual, unique, PROCEDURE_OCCURRENCE_IDs, though it is up to the ETL how they should be handled.')
-    person_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PERSON_ID of the PERSON for whom the procedure is recorded. This may be a system generated code.')
-    procedure_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: The PROCEDURE_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source value which represents a procedure | ETLCONVENTIONS: The CONCEPT_ID that the PROCEDURE_SOURCE_VALUE maps to. Only records whose source values map to standard concepts with a domain of "Procedure" should go in this table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Procedure&standardConcept=Standard&page=1&pageSize=15&query=).')
-    procedure_date: Mapped[datetime.date] = mapped_column(Date, comment='USER GUIDANCE: Use this date to determine the date the procedure started. | ETLCONVENTIONS: This is meant to be the **start date** of the procedure. It will be renamed in a future version to **PROCEDURE_START_DATE**. ')
-    procedure_type_concept_id: Mapped[int] = mapped_column(Integer, comment='USER GUIDANCE: This field can be used to determine the provenance of the Procedure record, as in whether the procedure was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the PROCEDURE_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. If a procedure is recorded as an EHR encounter, the PROCEDURE_TYPE_CONCEPT would be "EHR encounter record". [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). ')
-    procedure_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment=' | ETLCONVENTIONS: If the procedure has a start time in the native date, use this field to house that information. This will be renamed in a future version to **PROCEDURE_START_DATETIME**.')
-    procedure_end_date: Mapped[Optional[datetime.date]] = mapped_column(Date, comment='USER GUIDANCE: Use this field to house the date that the procedure ended.  | ETLCONVENTIONS: This is meant to be the end date of the procedure. It is not required and for most cases will be the same as the PROCEDURE_START_DATE.')
-    procedure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, comment='USER GUIDANCE: Use this field to house the datetime that the procedure ended.  | ETLCONVENTIONS: This is meant to house the end datetime of the procedure and will most often be used in conjunction with the procedure_start_datetime to determine the length of the procedure.')
-    modifier_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The modifiers are intended to give additional information about the procedure but as of now the vocabulary is under review. | ETLCONVENTIONS: It is up to the ETL to choose how to map modifiers if they exist in source data. These concepts are typically distinguished by "Modifier" concept classes (e.g., "CPT4 Modifier" as part of the "CPT4" vocabulary). If there is more than one modifier on a record, one should be chosen that pertains to the procedure rather than provider. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?conceptClass=CPT4+Modifier&conceptClass=HCPCS+Modifier&vocabulary=CPT4&vocabulary=HCPCS&standardConcept=Standard&page=1&pageSize=15&query=).')
-    quantity: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: If the quantity value is omitted, a single procedure is assumed. | ETLCONVENTIONS: If a Procedure has a quantity of "0" in the source, this should default to "1" in the ETL. If there is a record in the source it can be assumed the exposure occurred at least once')
-    provider_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The provider associated with the procedure record, e.g. the provider who performed the Procedure. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the admitting vs attending physician on an EHR record.')
-    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The visit during which the procedure occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a PROCEDURE_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the Visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the PROCEDURE_OCCURRENCE record.')
-    visit_detail_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: The VISIT_DETAIL record during which the Procedure occurred. For example, if the Person was in the ICU at the time of the Procedure the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.')
-    procedure_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment='USER GUIDANCE: This field houses the verbatim value from the source data representing the procedure that occurred. For example, this could be an CPT4 or OPCS4 code. | ETLCONVENTIONS: Use this value to look up the source concept id and then map the source concept id to a standard concept id.')
-    procedure_source_concept_id: Mapped[Optional[int]] = mapped_column(Integer, comment='USER GUIDANCE: This is the concept representing the procedure source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Procedure necessary for a given analytic use case. Consider using PROCEDURE_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the PROCEDURE_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.')
-    modifier_source_value: Mapped[Optional[str]] = mapped_column(String(50), comment=' | ETLCONVENTIONS: The original modifier code from the source is stored here for reference.')
-
-    modifier_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[modifier_concept_id])
-    person: Mapped['Person'] = relationship('Person', back_populates='procedure_occurrences')
-    procedure_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_concept_id])
-    procedure_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_source_concept_id])
-    procedure_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_type_concept_id])
-    provider: Mapped['Provider'] = relationship('Provider', back_populates='procedure_occurrences')
-    visit_detail: Mapped['VisitDetail'] = relationship('VisitDetail', back_populates='procedure_occurrences')
-    visit_occurrence: Mapped['VisitOccurrence'] = relationship('VisitOccurrence', back_populates='procedure_occurrences')
+    # immutable event rows: no server defaults to re-fetch after flush and no
+    # rowcount confirmation needed on bulk deletes.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+    procedure_occurrence_id: Mapped[int] = mapped_column(_Integer, primary_key=True, comment=_ddl_comment('USER GUIDANCE: The unique key given to a procedure record for a person. Refer to the ETL for how duplicate procedures during the same visit were handled. | ETLCONVENTIONS: Each instance of a procedure occurrence in the source data should be assigned this unique key. In some cases, a person can have multiple records of the same procedure within the same visit. It is valid to keep these duplicates and assign them individual, unique, PROCEDURE_OCCURRENCE_IDs, though it is up to the ETL how they should be handled.'))
+    person_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PERSON_ID of the PERSON for whom the procedure is recorded. This may be a system generated code.'))
+    procedure_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The PROCEDURE_CONCEPT_ID field is recommended for primary use in analyses, and must be used for network studies. This is the standard concept mapped from the source value which represents a procedure | ETLCONVENTIONS: The CONCEPT_ID that the PROCEDURE_SOURCE_VALUE maps to. Only records whose source values map to standard concepts with a domain of "Procedure" should go in this table. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Procedure&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    procedure_date: Mapped[datetime.date] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this date to determine the date the procedure started. | ETLCONVENTIONS: This is meant to be the **start date** of the procedure. It will be renamed in a future version to **PROCEDURE_START_DATE**. '))
+    procedure_type_concept_id: Mapped[int] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This field can be used to determine the provenance of the Procedure record, as in whether the procedure was from an EHR system, insurance claim, registry, or other sources. | ETLCONVENTIONS: Choose the PROCEDURE_TYPE_CONCEPT_ID that best represents the provenance of the record, for example whether it came from an EHR record or billing claim. If a procedure is recorded as an EHR encounter, the PROCEDURE_TYPE_CONCEPT would be "EHR encounter record". [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?domain=Type+Concept&standardConcept=Standard&page=1&pageSize=15&query=). A more detailed explanation of each Type Concept can be found on the [vocabulary wiki](https://github.com/OHDSI/Vocabulary-v5.0/wiki/Vocab.-TYPE_CONCEPT). '))
+    procedure_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment(' | ETLCONVENTIONS: If the procedure has a start time in the native date, use this field to house that information. This will be renamed in a future version to **PROCEDURE_START_DATETIME**.'))
+    procedure_end_date: Mapped[Optional[datetime.date]] = mapped_column(_Date, comment=_ddl_comment('USER GUIDANCE: Use this field to house the date that the procedure ended.  | ETLCONVENTIONS: This is meant to be the end date of the procedure. It is not required and for most cases will be the same as the PROCEDURE_START_DATE.'))
+    procedure_end_datetime: Mapped[Optional[datetime.datetime]] = mapped_column(_DateTime, comment=_ddl_comment('USER GUIDANCE: Use this field to house the datetime that the procedure ended.  | ETLCONVENTIONS: This is meant to house the end datetime of the procedure and will most often be used in conjunction with the procedure_start_datetime to determine the length of the procedure.'))
+    modifier_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The modifiers are intended to give additional information about the procedure but as of now the vocabulary is under review. | ETLCONVENTIONS: It is up to the ETL to choose how to map modifiers if they exist in source data. These concepts are typically distinguished by "Modifier" concept classes (e.g., "CPT4 Modifier" as part of the "CPT4" vocabulary). If there is more than one modifier on a record, one should be chosen that pertains to the procedure rather than provider. [Accepted Concepts](https://athena.ohdsi.org/search-terms/terms?conceptClass=CPT4+Modifier&conceptClass=HCPCS+Modifier&vocabulary=CPT4&vocabulary=HCPCS&standardConcept=Standard&page=1&pageSize=15&query=).'))
+    quantity: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: If the quantity value is omitted, a single procedure is assumed. | ETLCONVENTIONS: If a Procedure has a quantity of "0" in the source, this should default to "1" in the ETL. If there is a record in the source it can be assumed the exposure occurred at least once'))
+    provider_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The provider associated with the procedure record, e.g. the provider who performed the Procedure. | ETLCONVENTIONS: The ETL may need to make a choice as to which PROVIDER_ID to put here. Based on what is available this may or may not be different than the provider associated with the overall VISIT_OCCURRENCE record, for example the admitting vs attending physician on an EHR record.'))
+    visit_occurrence_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The visit during which the procedure occurred. | ETLCONVENTIONS: Depending on the structure of the source data, this may have to be determined based on dates. If a PROCEDURE_DATE occurs within the start and end date of a Visit it is a valid ETL choice to choose the VISIT_OCCURRENCE_ID from the Visit that subsumes it, even if not explicitly stated in the data. While not required, an attempt should be made to locate the VISIT_OCCURRENCE_ID of the PROCEDURE_OCCURRENCE record.'))
+    visit_detail_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: The VISIT_DETAIL record during which the Procedure occurred. For example, if the Person was in the ICU at the time of the Procedure the VISIT_OCCURRENCE record would reflect the overall hospital stay and the VISIT_DETAIL record would reflect the ICU stay during the hospital visit. | ETLCONVENTIONS: Same rules apply as for the VISIT_OCCURRENCE_ID.'))
+    procedure_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment('USER GUIDANCE: This field houses the verbatim value from the source data representing the procedure that occurred. For example, this could be an CPT4 or OPCS4 code. | ETLCONVENTIONS: Use this value to look up the source concept id and then map the source concept id to a standard concept id.'))
+    procedure_source_concept_id: Mapped[Optional[int]] = mapped_column(_Integer, comment=_ddl_comment('USER GUIDANCE: This is the concept representing the procedure source value and may not necessarily be standard. This field is discouraged from use in analysis because it is not required to contain Standard Concepts that are used across the OHDSI community, and should only be used when Standard Concepts do not adequately represent the source detail for the Procedure necessary for a given analytic use case. Consider using PROCEDURE_CONCEPT_ID instead to enable standardized analytics that can be consistent across the network. | ETLCONVENTIONS: If the PROCEDURE_SOURCE_VALUE is coded in the source data using an OMOP supported vocabulary put the concept id representing the source value here.'))
+    modifier_source_value: Mapped[Optional[str]] = mapped_column(_String(50), deferred=True, deferred_group='source_raw', comment=_ddl_comment(' | ETLCONVENTIONS: The original modifier code from the source is stored here for reference.'))
+
+    modifier_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[modifier_concept_id], viewonly=True, lazy='raise_on_sql')
+    person: Mapped['Person'] = relationship('Person', back_populates='procedure_occurrences', lazy='raise_on_sql')
+    procedure_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_concept_id], viewonly=True, lazy='raise_on_sql')
+    procedure_source_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_source_concept_id], viewonly=True, lazy='raise_on_sql')
+    procedure_type_concept: Mapped['Concept'] = relationship('Concept', foreign_keys=[procedure_type_concept_id], viewonly=True, lazy='raise_on_sql')
+    provider: Mapped['Provider'] = relationship('Provider', back_populates='procedure_occurrences', lazy='raise_on_sql')
+    visit_detail: Mapped['VisitDetail'] = relationship('VisitDetail', back_populates='procedure_occurrences', lazy='raise_on_sql')
+    visit_occurrence: Mapped['VisitOccurrence'] = relationship('VisitOccurrence', back_populates='procedure_occurrences', lazy='raise_on_sql')
 
 
 
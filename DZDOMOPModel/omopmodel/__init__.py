@@ -1 +1,32 @@
 from omopmodel.vocabularies_loader import VocabulariesLoader
+from omopmodel.engines import (
+    get_engine,
+    warm_vocab_cache,
+    bulk_load,
+    bulk_insert,
+    copy_from_records,
+    get_concept,
+    get_concept_by_code,
+    get_domain,
+    get_vocabulary,
+    fast_loader,
+    get_person,
+    load_concepts,
+    select_for_person,
+    stream,
+    to_parquet,
+    make_concept_fks_deferrable,
+    make_fks_deferrable,
+    deferred_constraints,
+    make_staging_table,
+    lite_metadata,
+    ConceptCache,
+    refresh_condition_era,
+    person_wide_select,
+    create_person_wide_view,
+    flat_select,
+    create_flat_view,
+    create_visit_overlap_index,
+)
+from omopmodel.serialization import relationship_names, to_dict
+from omopmodel.column_types import EpochDate
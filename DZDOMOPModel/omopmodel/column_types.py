@@ -0,0 +1,71 @@
+'''
+
+MIT License
+
+Copyright (c) 2024 Deutsche Zentrum für Diabetesforschung e.V.
+
+Source: https://github.com/DZD-eV-Diabetes-Research/dzd-omop-cdm-python-models
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT . IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import datetime
+from typing import Optional
+
+from sqlalchemy import Date
+from sqlalchemy.types import TypeDecorator
+
+
+class EpochDate(TypeDecorator):
+    """A Date read as proleptic-Gregorian ordinal int instead of a datetime.date.
+
+    Hydrating a fresh date object per row is pure allocation churn when the analysis
+    only compares or subtracts dates (era lengths, persistence windows, validity
+    filters). Coerce the column at query time and plain ints come back:
+
+        from sqlalchemy import select, type_coerce
+
+        statement = select(
+            type_coerce(ConditionEra.condition_era_start_date, EpochDate()),
+            type_coerce(ConditionEra.condition_era_end_date, EpochDate()),
+        )
+        for start, end in session.execute(statement):
+            era_length_days = end - start  # int arithmetic, no timedelta
+
+    Ints bound as parameters are converted back to dates, so the same coerced column
+    works in WHERE clauses. The stored column stays a plain CDM Date - this type never
+    appears in the table definitions.
+    """
+
+    impl = Date
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[int], dialect
+    ) -> Optional[datetime.date]:
+        if value is None or isinstance(value, datetime.date):
+            return value
+        return datetime.date.fromordinal(value)
+
+    def process_result_value(
+        self, value: Optional[datetime.date], dialect
+    ) -> Optional[int]:
+        return None if value is None else value.toordinal()
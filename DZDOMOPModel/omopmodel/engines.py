@@ -0,0 +1,965 @@
+'''
+
+MIT License
+
+Copyright (c) 2024 Deutsche Zentrum für Diabetesforschung e.V.
+
+Source: https://github.com/DZD-eV-Diabetes-Research/dzd-omop-cdm-python-models
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT . IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+from typing import Dict, Iterable, List
+from types import ModuleType
+import contextlib
+import csv
+import functools
+import itertools
+from io import StringIO
+from sqlalchemy import Column, Date, DateTime, Engine, Float, ForeignKeyConstraint, Integer, MetaData, Numeric, Table, create_engine, lambda_stmt, select, text
+from sqlalchemy import inspect as sqlalchemy_inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from omopmodel import OMOP_5_4_declarative
+
+
+def _freeze(value):
+    """A hashable stand-in for a create_engine kwarg value, for the engine cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, set, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_ENGINES: Dict = {}
+
+
+def get_engine(
+    url: str,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+    **create_engine_kwargs,
+) -> Engine:
+    """Create an Engine for 'url' and make sure the OMOP schema of 'omop_module' is deployed.
+
+    The result is memoized per process: scripts or workflows that open the same database
+    multiple times (create schema, load vocabulary, insert data, ...) reuse one Engine with
+    its connection pool and only pay the 'metadata.create_all()' reflection round trips once.
+    Dict-valued kwargs such as 'connect_args' take part in the cache key by value (not
+    'functools.lru_cache', which would reject them as unhashable).
+
+    Args:
+        url (str): A sqlalchemy database url e.g. "sqlite:///cdm_source.db"
+        omop_module (ModuleType, optional): The OMOP CDM ORM module whose schema should be
+            deployed. Defaults to OMOP CDM V5.4.
+        **create_engine_kwargs: Passed through to 'sqlalchemy.create_engine()'.
+    """
+    # fold bulk ORM inserts into multi-VALUES statements of up to 10k rows.
+    # for the vocabulary sized tables prefer session.execute(insert(Concept), rows)
+    # over session.add_all(), which pays unit-of-work bookkeeping per object.
+    create_engine_kwargs.setdefault("insertmanyvalues_page_size", 10000)
+    # a larger statement cache than the default (500): the ~40 OMOP tables plus
+    # their relationship loader queries compile far more distinct statements, and a
+    # thrashing LRU re-compiles them on every repetition.
+    create_engine_kwargs.setdefault("query_cache_size", 5000)
+    # skip the ROLLBACK round trip sqlalchemy emits on every connection checkin per
+    # default. All write paths in this package commit explicitly, so there is no
+    # transactional state left to reset. Pass pool_reset_on_return="rollback" to
+    # restore the default behavior.
+    create_engine_kwargs.setdefault("pool_reset_on_return", None)
+    cache_key = (url, omop_module, _freeze(create_engine_kwargs))
+    engine = _ENGINES.get(cache_key)
+    if engine is None:
+        engine = create_engine(url, **create_engine_kwargs)
+        omop_module.Base.metadata.create_all(engine, checkfirst=True)
+        _ENGINES[cache_key] = engine
+    return engine
+
+
+def warm_vocab_cache(
+    session: Session,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+) -> None:
+    """Pre-load the enumeration-like vocabulary lookup tables into the session.
+
+    Vocabulary, Domain and ConceptClass only hold dozens to a few thousand rows but are
+    referenced by nearly every other OMOP table. Loading them once per session with three
+    SELECTs puts every row into the session's identity map, so subsequent relationship
+    traversals from e.g. Concept rows resolve against the map instead of issuing their own
+    small lookup queries.
+
+    usage:
+        with Session(engine) as session:
+            warm_vocab_cache(session)
+            ...
+
+    Args:
+        session (Session): The session whose identity map should be warmed.
+        omop_module (ModuleType, optional): The OMOP CDM ORM module in use.
+            Defaults to OMOP CDM V5.4.
+    """
+    for lookup_class_name in ("Vocabulary", "Domain", "ConceptClass"):
+        lookup_class = getattr(omop_module, lookup_class_name)
+        session.scalars(select(lookup_class)).all()
+
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_statement(table: Table):
+    """One INSERT construct per Table, built once per process.
+
+    Building the construct walks the full column collection (22 columns for cost);
+    caching it removes that per-call Python work from the bulk helpers. Note: Table.c
+    itself is already a dict-backed collection with O(1) lookup, so no further
+    column-access caching is needed.
+    """
+    return table.insert()
+
+
+def bulk_load(
+    engine: Engine,
+    table,
+    rows: Iterable[Dict],
+    chunk_size: int = 50000,
+) -> int:
+    """Insert an iterable of row dicts with plain Core inserts, bypassing the ORM unit of work.
+
+    For the very large vocabulary tables (concept, concept_ancestor, concept_synonym, ...)
+    Core inserts skip the per-object identity map / attribute history bookkeeping of
+    'session.add_all()' and, combined with the insertmanyvalues batching of 'get_engine()',
+    land as multi-VALUES statements. 'rows' is consumed lazily in chunks, so generators
+    over huge files work with bounded memory. Everything runs in one transaction.
+
+    Args:
+        engine (Engine): The database engine.
+        table: A Core Table (see the OMOP_5_X_tables modules) or a declarative/sqlmodel
+            class - the mapped Table is taken from '__table__' in that case.
+        rows (Iterable[Dict]): Column name to value dicts.
+        chunk_size (int, optional): Rows per INSERT execution. Defaults to 50000.
+
+    Returns:
+        int: The number of inserted rows.
+    """
+    if not isinstance(table, Table):
+        table = table.__table__
+    insert_statement = _insert_statement(table)
+    rows_total = 0
+    with engine.begin() as connection:
+        rows_iterator = iter(rows)
+        while chunk := list(itertools.islice(rows_iterator, chunk_size)):
+            connection.execute(insert_statement, chunk)
+            rows_total += len(chunk)
+    return rows_total
+
+
+def get_concept(
+    session: Session,
+    concept_id: int,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+):
+    """Fetch a Concept by its id. Resolves from the session's identity map when possible
+    (e.g. after 'warm_vocab_cache()' or previous lookups) and only then emits the cached
+    primary key SELECT."""
+    return session.get(omop_module.Concept, concept_id)
+
+
+def get_concept_by_code(
+    session: Session,
+    concept_code: str,
+    vocabulary_id: str,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+):
+    """Fetch a Concept by its source code within a vocabulary, e.g. ("44054006", "SNOMED").
+
+    The statement is built as a 'lambda_stmt', so SQLAlchemy compiles it exactly once per
+    process and every following call only binds new parameters - the cheap path for the
+    tight per-row lookup loops ETL code tends to run.
+    """
+    concept_class = omop_module.Concept
+    statement = lambda_stmt(
+        lambda: select(concept_class).where(
+            concept_class.concept_code == concept_code,
+            concept_class.vocabulary_id == vocabulary_id,
+        ),
+        track_on=[concept_class],
+    )
+    return session.scalars(statement).one_or_none()
+
+
+def get_domain(
+    session: Session,
+    domain_id: str,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+):
+    """Fetch a Domain by its id ("Condition", "Drug", ...) via the identity map/PK cache."""
+    return session.get(omop_module.Domain, domain_id)
+
+
+def get_vocabulary(
+    session: Session,
+    vocabulary_id: str,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+):
+    """Fetch a Vocabulary by its id ("SNOMED", "RxNorm", ...) via the identity map/PK cache."""
+    return session.get(omop_module.Vocabulary, vocabulary_id)
+
+
+def make_fks_deferrable(metadata: MetaData, target_fullname: str = None) -> int:
+    """Mark foreign keys as DEFERRABLE INITIALLY DEFERRED in subsequently emitted DDL.
+
+    Call on e.g. 'OMOP_5_4_declarative.Base.metadata' *before* the schema is deployed;
+    load transactions can then postpone FK checks to COMMIT (see
+    'deferred_constraints()'), so PostgreSQL validates them once per transaction
+    instead of once per row. PostgreSQL only - other dialects ignore the flags.
+
+    Args:
+        metadata (MetaData): The metadata of one of the OMOP model flavors.
+        target_fullname (str, optional): Restrict to FKs referencing this column, e.g.
+            "concept.concept_id". Defaults to None, which marks every foreign key.
+
+    Returns:
+        int: The number of foreign key constraints marked deferrable.
+    """
+    marked = 0
+    for table in metadata.tables.values():
+        for constraint in table.constraints:
+            if not isinstance(constraint, ForeignKeyConstraint):
+                continue
+            if target_fullname is None or all(
+                element.target_fullname == target_fullname
+                for element in constraint.elements
+            ):
+                constraint.deferrable = True
+                constraint.initially = "DEFERRED"
+                marked += 1
+    return marked
+
+
+def make_concept_fks_deferrable(metadata: MetaData) -> int:
+    """Mark every foreign key targeting 'concept.concept_id' as DEFERRABLE INITIALLY DEFERRED.
+
+    The concept foreign keys are by far the most numerous constraints in the schema and
+    the ones that slow multi-billion-row ETL loads the most; see 'make_fks_deferrable()'
+    for the mechanics and 'deferred_constraints()' for the load-transaction side.
+
+    Args:
+        metadata (MetaData): The metadata of one of the OMOP model flavors.
+
+    Returns:
+        int: The number of foreign key constraints marked deferrable.
+    """
+    return make_fks_deferrable(metadata, target_fullname="concept.concept_id")
+
+
+@contextlib.contextmanager
+def deferred_constraints(engine: Engine):
+    """One transaction with every deferrable constraint postponed to COMMIT.
+
+    Yields a Connection inside 'engine.begin()' after issuing 'SET CONSTRAINTS ALL
+    DEFERRED' - the load-phase counterpart to 'make_fks_deferrable()'. All FK checks
+    for rows written through the connection run once at COMMIT instead of per row:
+
+        with deferred_constraints(engine) as connection:
+            connection.execute(insert_statement, rows)
+
+    PostgreSQL only; constraints that were not declared deferrable are unaffected.
+    """
+    with engine.begin() as connection:
+        connection.execute(text("SET CONSTRAINTS ALL DEFERRED"))
+        yield connection
+
+
+# Shared across all bulk_insert() calls so statement compilation for the heavy
+# tables is paid once per process, not once per session.
+_COMPILED_CACHE: Dict = {}
+
+
+def bulk_insert(
+    session: Session,
+    model,
+    rows: Iterable[Dict],
+    chunk_size: int = 50000,
+) -> int:
+    """Insert dict rows through an existing Session, with a process-wide compiled cache.
+
+    The ORM-session sibling of 'bulk_load()': it joins the session's current transaction
+    (commit/rollback stays with the caller) but executes plain Core inserts, so no ORM
+    objects are built. This is the intended write path for the clinical ETL sinks -
+    person, observation_period, drug_era, dose_era and the event tables - where
+    'session.add_all()' per-object bookkeeping dominates load time. The compiled INSERT is cached in a module-level dict shared by all
+    sessions and engines, which keeps repeated ETL loops from re-compiling the statement
+    per engine cache. On psycopg, pass 'prepare_threshold=1' in 'connect_args' to also
+    get server-side prepared statements from the first repetition.
+
+    Args:
+        session (Session): The session whose connection/transaction should be used.
+        model: A mapped class of any flavor or a Core Table.
+        rows (Iterable[Dict]): Column name to value dicts, consumed lazily in chunks.
+        chunk_size (int, optional): Rows per INSERT execution. Defaults to 50000.
+
+    Returns:
+        int: The number of inserted rows.
+    """
+    table = model if isinstance(model, Table) else model.__table__
+    insert_statement = _insert_statement(table)
+    # per-execution option, not session.connection(execution_options=...): the
+    # latter is silently ignored when the session already holds a connection -
+    # i.e. exactly the mid-transaction ETL case this helper is for.
+    connection = session.connection()
+    rows_total = 0
+    rows_iterator = iter(rows)
+    while chunk := list(itertools.islice(rows_iterator, chunk_size)):
+        connection.execute(
+            insert_statement,
+            chunk,
+            execution_options={"compiled_cache": _COMPILED_CACHE},
+        )
+        rows_total += len(chunk)
+    return rows_total
+
+
+def make_staging_table(
+    model,
+    suffix: str = "_staging",
+    unlogged: bool = True,
+) -> Table:
+    """Build a constraint- and index-free staging twin of an OMOP table for initial loads.
+
+    The returned Table has the same columns (all nullable) but no primary key, foreign
+    keys or indexes, and is created UNLOGGED on PostgreSQL - skipping WAL roughly halves
+    initial-load I/O. The intended flow:
+
+        staging = make_staging_table(omop54.Cost)
+        staging.create(engine)
+        bulk_load(engine, staging, rows)            # or COPY FROM STDIN
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO cost SELECT * FROM cost_staging"))
+        staging.drop(engine)
+
+    so the expensive index/constraint maintenance happens once on the final INSERT ..
+    SELECT instead of per staged row. The staging table lives in its own MetaData and
+    is never touched by 'metadata.create_all()' of the models.
+
+    Args:
+        model: A mapped class of any flavor or a Core Table.
+        suffix (str, optional): Appended to the source table name. Defaults to "_staging".
+        unlogged (bool, optional): Emit CREATE UNLOGGED TABLE. PostgreSQL only - pass
+            False for other databases. Defaults to True.
+
+    Returns:
+        Table: The staging table, ready for '.create(engine)'.
+    """
+    table = model if isinstance(model, Table) else model.__table__
+    return Table(
+        table.name + suffix,
+        MetaData(),
+        *[Column(c.name, c.type, nullable=True) for c in table.columns],
+        prefixes=["UNLOGGED"] if unlogged else [],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def lite_metadata(omop_module: ModuleType = OMOP_5_4_declarative) -> MetaData:
+    """A lightweight Core mirror of the OMOP schema for throwaway test databases.
+
+    Same tables and columns, but no foreign keys, no secondary indexes, no comments,
+    and Numeric columns become Float - 'create_all()' against an in-memory SQLite or
+    DuckDB engine takes a fraction of the full schema's DDL time, and inserts skip
+    all constraint checking. Intended for unit tests and local iteration:
+
+        engine = create_engine("duckdb:///:memory:")   # or "sqlite://"
+        lite = lite_metadata(omop54)
+        lite.create_all(engine)
+        bulk_load(engine, lite.tables["person"], rows)
+
+    Rows read back as named tuples, like the Core-table flavor. The mirror is
+    schema-compatible with the real tables column-for-column, so statements written
+    against it also run against a fully deployed schema - but never deploy it to
+    production, the constraints are the point there.
+
+    Args:
+        omop_module (ModuleType): The OMOP model flavor to mirror.
+
+    Returns:
+        MetaData: A fresh MetaData with the mirrored tables, cached per module.
+    """
+    metadata = MetaData()
+    # not sorted_tables: the mirror has no FKs, so dependency order is moot (and
+    # the vocabulary tables' FK cycle would make sorted_tables warn).
+    for table in omop_module.Base.metadata.tables.values():
+        Table(
+            table.name,
+            metadata,
+            *[
+                Column(
+                    c.name,
+                    Float() if isinstance(c.type, Numeric) else c.type,
+                    primary_key=c.primary_key,
+                    nullable=c.nullable,
+                )
+                for c in table.columns
+            ],
+        )
+    return metadata
+
+
+@functools.lru_cache(maxsize=None)
+def fast_loader(model):
+    """A generated per-class row loader that skips the ORM's hydration machinery.
+
+    'session.execute(select(Person))' runs the generic ORM loader per row: identity
+    map lookup, state bookkeeping, load events and a keyed dict lookup per column.
+    For read-only scans none of that is needed. This builds (once per class, via
+    'exec') a monomorphic function that unpacks a Core row by index straight into a
+    fresh instance's '__dict__':
+
+        load_person = fast_loader(omop54.Person)
+        with engine.connect() as connection:
+            rows = connection.execute(select(omop54.Person.__table__))
+            persons = [load_person(row) for row in rows]
+
+    Column values still pass through the normal Core result processors, so dates
+    and Decimals come back as usual - only the ORM bookkeeping is skipped, which is
+    the bulk of per-row hydration cost on wide tables like Person or Cost. The
+    returned instances are detached: attribute reads work, but they belong to no
+    session, have no identity-map entry and must not be mutated and flushed. Rows
+    must be in table-column order, i.e. from 'select(model.__table__)' or
+    'select(model)'.
+
+    Args:
+        model: A mapped class of the declarative or dataclasses flavor.
+
+    Returns:
+        A function '(row) -> model' instance, cached per class.
+    """
+    manager = sqlalchemy_inspect(model).class_manager
+    assignments = "; ".join(
+        f"d[{column.key!r}] = row[{index}]"
+        for index, column in enumerate(model.__table__.columns)
+    )
+    source = (
+        "def load(row):\n"
+        "    obj = new_instance()\n"
+        "    d = obj.__dict__\n"
+        f"    {assignments}\n"
+        "    return obj\n"
+    )
+    namespace = {"new_instance": manager.new_instance}
+    exec(compile(source, f"<fast_loader {model.__name__}>", "exec"), namespace)
+    return namespace["load"]
+
+
+class ConceptCache:
+    """Process-wide concept_id lookup dict for read paths that only need concept attributes.
+
+    Cost references concept five times per row, FactRelationship and ConceptRelationship
+    three times - even batched relationship loading re-fetches the same concepts per
+    session. warm() pulls (concept_id, concept_name, domain_id, vocabulary_id,
+    concept_code) for all concepts once - lightweight Row tuples, typically a few MB for
+    the concepts a CDM instance actually uses - after which every lookup is a plain dict
+    hit with no SQL:
+
+        ConceptCache.warm(session)
+        ...
+        ConceptCache.name(cost.cost_type_concept_id)
+
+    The cache is shared by all sessions of the process and is read-only by convention;
+    call warm() again after loading new vocabularies. This plain dict is deliberately
+    not an lru_cache around 'session.get' (which would pin sessions past their
+    lifetime) and not a TypeDecorator on the concept-id columns (resolving names is a
+    read-path concern, not a type concern): 'get_concept()' already hits the identity
+    map for single ORM lookups, and this cache covers the batch/name case.
+    """
+
+    _by_id: Dict = {}
+
+    @classmethod
+    def warm(cls, session: Session, omop_module: ModuleType = OMOP_5_4_declarative) -> int:
+        """Fill the cache from the concept table. Returns the number of cached concepts."""
+        concept = omop_module.Concept.__table__
+        rows = session.execute(
+            select(
+                concept.c.concept_id,
+                concept.c.concept_name,
+                concept.c.domain_id,
+                concept.c.vocabulary_id,
+                concept.c.concept_code,
+            )
+        ).all()
+        cls._by_id = {row.concept_id: row for row in rows}
+        return len(cls._by_id)
+
+    @classmethod
+    def get(cls, concept_id: int):
+        """The cached (concept_id, concept_name, domain_id, vocabulary_id, concept_code)
+        Row, or None for unknown ids."""
+        return cls._by_id.get(concept_id)
+
+    @classmethod
+    def name(cls, concept_id: int, default: str = None) -> str:
+        """The concept_name for an id, or 'default' for unknown ids."""
+        row = cls._by_id.get(concept_id)
+        return default if row is None else row.concept_name
+
+    @classmethod
+    def clear(cls):
+        cls._by_id = {}
+
+
+def refresh_condition_era(session: Session) -> None:
+    """Rebuild the condition_era_mv materialized view without blocking readers.
+
+    Companion to examples/condition_era_materialized_view.sql, which derives
+    condition eras (30-day persistence window) from condition_occurrence with one
+    set-based window query inside PostgreSQL - orders of magnitude faster than
+    aggregating occurrence rows in Python. Call after the condition_occurrence
+    load is committed: PostgreSQL refuses REFRESH .. CONCURRENTLY inside a
+    transaction block, so the statement runs on its own AUTOCOMMIT connection,
+    independent of the session's transaction, and sees only committed rows.
+    """
+    engine = session.get_bind()
+    with engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY condition_era_mv")
+        )
+
+
+def get_person(
+    session: Session,
+    person_id: int,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+):
+    """Fetch a Person by id via the identity map / cached primary key SELECT."""
+    return session.get(omop_module.Person, person_id)
+
+
+def select_for_person(model, person_id: int):
+    """A cached 'SELECT * FROM <model's table> WHERE person_id = :id' statement.
+
+    Works for every person-scoped clinical table (ObservationPeriod, DrugEra, DoseEra,
+    VisitOccurrence, ...). Built as a 'lambda_stmt', so the construct and its compiled
+    SQL are cached per model class and repeated calls only bind a new person_id - the
+    cheap path when a report loops over persons:
+
+        eras = session.scalars(select_for_person(omop54.DrugEra, person_id)).all()
+
+    Args:
+        model: A mapped class of any flavor with a 'person_id' column.
+        person_id (int): The person to filter on.
+    """
+    return lambda_stmt(
+        lambda: select(model).where(model.person_id == person_id),
+        track_on=[model],
+    )
+
+
+def load_concepts(
+    session: Session,
+    objects: Iterable,
+    names: Iterable[str] = ("gender_concept", "race_concept", "ethnicity_concept"),
+    omop_module: ModuleType = OMOP_5_4_declarative,
+) -> List:
+    """Populate Concept relationships on many instances with a single IN-query.
+
+    The concept relationships are mapped 'lazy="raise_on_sql"', so resolving them
+    per instance would mean one SELECT each. This helper collects the FK values of
+    all given instances, fetches the distinct Concepts in one statement and attaches
+    them with 'set_committed_value' - the relationship attributes read as if they
+    had been eagerly loaded, without marking anything dirty:
+
+        persons = session.scalars(select(omop54.Person)).all()
+        load_concepts(session, persons)
+        persons[0].gender_concept.concept_name  # no SQL emitted
+
+    Args:
+        session (Session): An open session.
+        objects (Iterable): Mapped instances, all of the same class.
+        names (Iterable[str]): Relationship attribute names to populate; each must
+            have a matching '<name>_id' FK column (e.g. 'cause_concept' on Death).
+        omop_module (ModuleType): The OMOP model flavor the instances belong to.
+
+    Returns:
+        List: The instances, as a list.
+    """
+    objects = list(objects)
+    names = tuple(names)
+    concept_ids = {
+        concept_id
+        for obj in objects
+        for name in names
+        if (concept_id := getattr(obj, name + "_id")) is not None
+    }
+    concepts = {}
+    if concept_ids:
+        concept_class = omop_module.Concept
+        statement = select(concept_class).where(
+            concept_class.concept_id.in_(concept_ids)
+        )
+        concepts = {c.concept_id: c for c in session.scalars(statement)}
+    for obj in objects:
+        for name in names:
+            set_committed_value(obj, name, concepts.get(getattr(obj, name + "_id")))
+    return objects
+
+
+def person_wide_select(omop_module: ModuleType = OMOP_5_4_declarative):
+    """The denormalized person SELECT behind 'create_person_wide_view()'.
+
+    Person plus the resolved gender/race/ethnicity concept names, zip and care site
+    name via LEFT JOINs - usable directly as a statement when no view is wanted.
+    """
+    person = omop_module.Person.__table__
+    concept = omop_module.Concept.__table__
+    location = omop_module.Location.__table__
+    care_site = omop_module.CareSite.__table__
+    gender = concept.alias("gender_concept")
+    race = concept.alias("race_concept")
+    ethnicity = concept.alias("ethnicity_concept")
+    return (
+        select(
+            person,
+            gender.c.concept_name.label("gender_name"),
+            race.c.concept_name.label("race_name"),
+            ethnicity.c.concept_name.label("ethnicity_name"),
+            location.c.zip.label("zip"),
+            care_site.c.care_site_name.label("care_site_name"),
+        )
+        .select_from(
+            person.outerjoin(gender, person.c.gender_concept_id == gender.c.concept_id)
+            .outerjoin(race, person.c.race_concept_id == race.c.concept_id)
+            .outerjoin(
+                ethnicity, person.c.ethnicity_concept_id == ethnicity.c.concept_id
+            )
+            .outerjoin(location, person.c.location_id == location.c.location_id)
+            .outerjoin(care_site, person.c.care_site_id == care_site.c.care_site_id)
+        )
+    )
+
+
+def create_person_wide_view(
+    engine: Engine,
+    omop_module: ModuleType = OMOP_5_4_declarative,
+) -> None:
+    """Create (or replace) a 'person_wide' view that denormalizes Person in the database.
+
+    Resolving a person's demographics through the ORM costs up to five concept lookups
+    plus location and care site - an 8-way fan-out per person. The view bakes those
+    LEFT JOINs in once, so reporting code runs one indexed SELECT against 'person_wide'
+    and gets gender_name/race_name/ethnicity_name/zip/care_site_name alongside every
+    person column. Call after the schema is deployed; works on PostgreSQL and SQLite.
+    """
+    view_sql = str(
+        person_wide_select(omop_module).compile(
+            engine, compile_kwargs={"literal_binds": True}
+        )
+    )
+    with engine.begin() as connection:
+        connection.execute(text("DROP VIEW IF EXISTS person_wide"))
+        connection.execute(text("CREATE VIEW person_wide AS " + view_sql))
+
+
+def to_parquet(
+    session: Session,
+    model,
+    path: str,
+    columns: Iterable[str] = None,
+    batch_size: int = 50000,
+) -> int:
+    """Stream a table into a Parquet file for columnar analytics.
+
+    Aggregate analyses read a handful of columns out of 15+; a row store drags the
+    whole tuple through cache per row. This streams the table (server-side cursor,
+    bounded memory) into Parquet record batches with dictionary encoding and zstd
+    compression, so downstream tools read one column at a time and the repetitive
+    '*_concept_id' columns shrink by an order of magnitude on disk:
+
+        to_parquet(session, omop54.ProcedureOccurrence, "procedure_occurrence.parquet")
+
+    Requires the 'parquet' extra ('pip install dzdomop[parquet]'). For
+    date-partitioned datasets, export per window (a filtered Core select works too)
+    and arrange the files with 'pyarrow.dataset'.
+
+    Args:
+        session (Session): An open session.
+        model: A mapped class of any flavor or a Core Table.
+        path (str): Target file path.
+        columns (Iterable[str], optional): Column names to export. Defaults to all.
+        batch_size (int, optional): Rows per record batch. Defaults to 50000.
+
+    Returns:
+        int: The number of rows written.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "to_parquet() needs pyarrow - install the 'parquet' extra: "
+            "pip install dzdomop[parquet]"
+        ) from error
+
+    def arrow_type(column):
+        if isinstance(column.type, Numeric):  # includes Float
+            return pyarrow.float64()
+        if isinstance(column.type, Integer):
+            return pyarrow.int32()
+        if isinstance(column.type, DateTime):
+            return pyarrow.timestamp("us")
+        if isinstance(column.type, Date):
+            return pyarrow.date32()
+        return pyarrow.string()
+
+    table = model if isinstance(model, Table) else model.__table__
+    selected = (
+        [table.c[name] for name in columns] if columns else list(table.columns)
+    )
+    schema = pyarrow.schema(
+        [(column.name, arrow_type(column)) for column in selected]
+    )
+    decimal_positions = [
+        index
+        for index, column in enumerate(selected)
+        if isinstance(column.type, Numeric) and not isinstance(column.type, Float)
+    ]
+    statement = select(*selected).execution_options(
+        stream_results=True, yield_per=batch_size
+    )
+    rows_written = 0
+    with pyarrow.parquet.ParquetWriter(
+        path, schema, compression="zstd", use_dictionary=True
+    ) as writer:
+        for partition in session.execute(statement).partitions():
+            column_values = [list(values) for values in zip(*partition)]
+            for index in decimal_positions:
+                column_values[index] = [
+                    None if value is None else float(value)
+                    for value in column_values[index]
+                ]
+            writer.write_batch(
+                pyarrow.record_batch(
+                    [
+                        pyarrow.array(values, type=field.type)
+                        for field, values in zip(schema, column_values)
+                    ],
+                    schema=schema,
+                )
+            )
+            rows_written += len(partition)
+    return rows_written
+
+
+def create_visit_overlap_index(engine: Engine) -> None:
+    """Create a GiST range index on visit_occurrence for temporal-overlap queries.
+
+    Overlap joins ('which visits overlap [a, b]?') cannot be answered efficiently
+    by B-trees on the two date columns - one side always degenerates to a filter.
+    This creates an expression index over 'daterange(visit_start_date,
+    visit_end_date, '[]')', so the canonical overlap predicate becomes an index
+    search:
+
+        WHERE daterange(visit_start_date, visit_end_date, '[]')
+              && daterange(:window_start, :window_end, '[)')
+
+    PostgreSQL only (range types and GiST), which is why it is a helper instead of
+    part of the models' '__table_args__' - 'create_all()' on SQLite would choke on
+    the expression. Call once after the schema is deployed; idempotent.
+
+    Args:
+        engine (Engine): A PostgreSQL engine.
+
+    Raises:
+        ValueError: If the engine is not PostgreSQL.
+    """
+    if engine.dialect.name != "postgresql":
+        raise ValueError(
+            "create_visit_overlap_index() needs PostgreSQL, got "
+            f"'{engine.dialect.name}' - range types and GiST are PG-only."
+        )
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS gist_visit_date_range "
+                "ON visit_occurrence USING gist "
+                "(daterange(visit_start_date, visit_end_date, '[]'))"
+            )
+        )
+
+
+def flat_select(model, concept_columns: Iterable[str] = None):
+    """A denormalized SELECT of an event table with its concept names resolved.
+
+    Reporting queries on e.g. procedure_occurrence join Concept three or four times
+    per row just to show names. This builds the event row plus one
+    '<fk column minus _id>_name' label per concept FK ('procedure_concept_id' ->
+    'procedure_concept_name') via LEFT JOINs - by default for every column with an
+    FK to concept.concept_id, or an explicit subset:
+
+        statement = flat_select(
+            omop54.ProcedureOccurrence,
+            ["procedure_concept_id", "procedure_type_concept_id", "modifier_concept_id"],
+        )
+
+    Args:
+        model: A mapped class of any flavor or a Core Table.
+        concept_columns (Iterable[str], optional): FK column names to resolve.
+            Defaults to all concept FKs of the table.
+    """
+    table = model if isinstance(model, Table) else model.__table__
+    concept = table.metadata.tables["concept"]
+    if concept_columns is None:
+        concept_columns = [
+            column.name
+            for column in table.columns
+            for fk in column.foreign_keys
+            if fk.target_fullname == "concept.concept_id"
+        ]
+    columns = [table]
+    joined = table
+    for name in concept_columns:
+        base = name[:-3] if name.endswith("_id") else name
+        alias = concept.alias(base)
+        joined = joined.outerjoin(alias, table.c[name] == alias.c.concept_id)
+        columns.append(alias.c.concept_name.label(base + "_name"))
+    return select(*columns).select_from(joined)
+
+
+def create_flat_view(
+    engine: Engine,
+    model,
+    view_name: str = None,
+    concept_columns: Iterable[str] = None,
+) -> None:
+    """Create (or replace) a '<table>_flat' view that bakes in the concept-name joins.
+
+    Companion to 'flat_select()', same shape as 'create_person_wide_view()': the
+    LEFT JOINs to Concept are defined once in the database and read paths run one
+    SELECT against e.g. 'procedure_occurrence_flat'. Sensible for the concept-heavy
+    event tables (ProcedureOccurrence, Specimen, VisitOccurrence). A plain view
+    resolves the names at query time against the (well-cached) concept table; if
+    even that is too much, create the same SELECT as a materialized view by hand.
+    Call after the schema is deployed; works on PostgreSQL and SQLite.
+
+    Args:
+        engine (Engine): The target database.
+        model: A mapped class of any flavor or a Core Table.
+        view_name (str, optional): Defaults to the table name plus '_flat'.
+        concept_columns (Iterable[str], optional): Passed through to 'flat_select()'.
+    """
+    table = model if isinstance(model, Table) else model.__table__
+    view_name = view_name or table.name + "_flat"
+    view_sql = str(
+        flat_select(model, concept_columns).compile(
+            engine, compile_kwargs={"literal_binds": True}
+        )
+    )
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP VIEW IF EXISTS {view_name}"))
+        connection.execute(text(f"CREATE VIEW {view_name} AS " + view_sql))
+
+
+def stream(session: Session, statement, batch_size: int = 10000):
+    """Iterate a large result set in bounded-memory batches via a server-side cursor.
+
+    'session.scalars(select(Person)).all()' materializes every row at once; for the
+    wide person/era tables that dominates RSS. This helper executes the statement with
+    'stream_results' (a named server-side cursor on PostgreSQL) and 'yield_per', so
+    rows arrive and are mapped in batches that can be garbage collected as processing
+    moves on:
+
+        for batch in stream(session, select(omop54.DrugEra), batch_size=10_000):
+            process(batch)
+
+    Each yielded batch is a tuple of Rows (ORM instances for entity selects). Combine
+    with the models' raise-on-SQL lazy loading to keep per-object traversals from
+    firing queries mid-stream.
+
+    Args:
+        session (Session): The session to execute in.
+        statement: Any select() statement.
+        batch_size (int, optional): Rows per fetched batch. Defaults to 10000.
+    """
+    return session.execute(
+        statement.execution_options(stream_results=True, yield_per=batch_size)
+    ).partitions()
+
+
+def copy_from_records(
+    engine: Engine,
+    model,
+    rows: Iterable[tuple],
+    columns: List[str] = None,
+    chunk_size: int = 50000,
+) -> int:
+    """Load positional tuples into a table via PostgreSQL COPY FROM STDIN.
+
+    COPY is the highest-throughput write path PostgreSQL has - typically 5-20x over
+    even batched multi-VALUES INSERTs for wide tables like person or drug_era. Rows
+    are plain tuples in column order (cheaper to build and stream than dicts), CSV-
+    encoded in chunks and pushed through the driver copy API of psycopg or pg8000.
+    None becomes NULL. Everything runs in one transaction; combine with
+    'make_staging_table()' to also skip WAL and index maintenance during the load.
+
+        copy_from_records(engine, omop54.Person, person_tuples)
+
+    Args:
+        engine (Engine): A PostgreSQL engine (psycopg or pg8000 driver).
+        model: A mapped class of any flavor or a Core Table.
+        rows (Iterable[tuple]): Values in 'columns' order, consumed lazily.
+        columns (List[str], optional): Target columns. Defaults to all table columns
+            in declaration order.
+        chunk_size (int, optional): Rows per encoded CSV chunk. Defaults to 50000.
+
+    Returns:
+        int: The number of copied rows.
+    """
+    if engine.dialect.name != "postgresql":
+        raise ValueError(
+            f"copy_from_records only supports PostgreSQL, got dialect '{engine.dialect.name}'. "
+            "Use bulk_load() for other databases."
+        )
+    table = model if isinstance(model, Table) else model.__table__
+    if columns is None:
+        columns = [column.name for column in table.columns]
+    statement = (
+        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)"
+    )
+    rows_total = 0
+    with engine.begin() as connection:
+        dbapi_connection = connection.connection
+        rows_iterator = iter(rows)
+        while chunk := list(itertools.islice(rows_iterator, chunk_size)):
+            buffer = StringIO()
+            csv.writer(buffer).writerows(chunk)
+            buffer.seek(0)
+            if engine.driver == "psycopg":
+                # https://www.psycopg.org/psycopg3/docs/basic/copy.html
+                with dbapi_connection.cursor() as cursor:
+                    with cursor.copy(statement) as copy:
+                        while data := buffer.read(1024 * 1024):
+                            copy.write(data)
+            else:
+                # pg8000 streams the file object directly
+                dbapi_connection.run(statement, stream=buffer)
+            rows_total += len(chunk)
+    return rows_total
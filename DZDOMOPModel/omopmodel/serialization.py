@@ -0,0 +1,91 @@
+'''
+
+MIT License
+
+Copyright (c) 2024 Deutsche Zentrum für Diabetesforschung e.V.
+
+Source: https://github.com/DZD-eV-Diabetes-Research/dzd-omop-cdm-python-models
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT . IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import datetime
+import decimal
+import functools
+from typing import Any, Dict, FrozenSet, Tuple, Type
+
+from sqlalchemy import inspect
+
+
+@functools.lru_cache(maxsize=None)
+def _column_attribute_names(mapped_class: Type) -> Tuple[str, ...]:
+    """Snapshot the column attribute names of a mapped class, computed once per class."""
+    return tuple(attr.key for attr in inspect(mapped_class).column_attrs)
+
+
+@functools.lru_cache(maxsize=None)
+def relationship_names(mapped_class: Type) -> FrozenSet[str]:
+    """Frozen set of relationship attribute names of a mapped class.
+
+    Person carries 20+ relationships, and ETL code that rebuilds
+    '{r.key for r in inspect(Person).relationships}' per row to decide what to
+    serialize pays for the mapper walk every time. This snapshot is computed once
+    per class, so membership tests ('if name in relationship_names(Person)') are a
+    single hash lookup.
+
+    Args:
+        mapped_class: Any mapped class from the declarative, dataclasses or
+            sqlmodels flavor.
+
+    Returns:
+        FrozenSet[str]: The relationship attribute names.
+    """
+    return frozenset(r.key for r in inspect(mapped_class).relationships)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Turn one mapped OMOP object into a dict of JSON-native primitives.
+
+    Decimal becomes float and date/datetime become ISO strings, so the result can be
+    handed straight to 'json.dumps'/'orjson.dumps' without a custom default hook. The
+    column list is cached per class, which keeps the per-row work at plain attribute
+    access - noticeably faster than ad-hoc dict comprehensions over '__table__.columns'
+    when serializing large result lists of e.g. Cost or NoteNlp rows.
+
+    usage:
+        orjson.dumps([to_dict(cost) for cost in costs])
+
+    Args:
+        obj: An instance of any mapped class from the declarative, dataclasses or
+            sqlmodels flavor.
+
+    Returns:
+        Dict[str, Any]: Column name to primitive value.
+    """
+    result = {}
+    for name in _column_attribute_names(type(obj)):
+        value = getattr(obj, name)
+        if isinstance(value, decimal.Decimal):
+            value = float(value)
+        elif isinstance(value, (datetime.datetime, datetime.date)):
+            value = value.isoformat()
+        result[name] = value
+    return result